@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+데이터베이스 연결 풀 벤치마크
+동시 클라이언트 수를 늘려 가며 DatabaseService 조회 처리량(req/sec)과 지연 시간을 측정합니다.
+DATABASE_URL과 DB_POOL_* 환경변수 설정을 그대로 사용합니다.
+
+사용법:
+    DATABASE_URL=postgresql://... python benchmarks/bench_db_pool.py --clients 1,2,4,8,16 --seed 200
+"""
+
+import argparse
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+# backend 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models.database import AdminLegislationDB, NationalLegislationDB, SessionLocal, create_tables, engine
+from models.legislation_models import LegislationItem
+from services.database_service import DatabaseService
+
+# 벤치마크용으로 넣은 행 식별자
+BENCH_PREFIX = "BENCH-"
+
+def seed(database_service: DatabaseService, count: int):
+    """소스별로 count건의 벤치마크용 데이터 저장"""
+    national = [
+        LegislationItem(bill_no=f"{BENCH_PREFIX}{i}", title=f"벤치마크 법률안 {i}", committee="벤치마크위원회",
+                        proposer="벤치마크", start_date="2024-01-01", end_date="2024-01-10",
+                        content="벤치마크 내용 " * 20, link_url="https://example.com", source="national")
+        for i in range(count)
+    ]
+    admin = [
+        LegislationItem(notice_key=f"{BENCH_PREFIX}{i}", title=f"벤치마크 시행령 {i}", committee="벤치마크부",
+                        proposer="", start_date="2024-01-01", end_date="2024-01-10",
+                        content="벤치마크 내용 " * 20, link_url="https://example.com", source="admin")
+        for i in range(count)
+    ]
+    database_service.save_national_legislation_data(national)
+    database_service.save_admin_legislation_data(admin)
+
+def cleanup():
+    """벤치마크용 데이터 삭제"""
+    db = SessionLocal()
+    try:
+        db.query(NationalLegislationDB).filter(NationalLegislationDB.bill_no.like(f"{BENCH_PREFIX}%")).delete(
+            synchronize_session=False)
+        db.query(AdminLegislationDB).filter(AdminLegislationDB.notice_key.like(f"{BENCH_PREFIX}%")).delete(
+            synchronize_session=False)
+        db.commit()
+    finally:
+        db.close()
+
+def bench_clients(database_service: DatabaseService, clients: int, duration: float):
+    """clients개 스레드가 duration초 동안 전체 조회를 반복 - (요청 수, req/sec, p50 ms, p95 ms)"""
+    latencies = []
+    lock = threading.Lock()
+    deadline = time.perf_counter() + duration
+
+    def client():
+        local = []
+        while time.perf_counter() < deadline:
+            start = time.perf_counter()
+            database_service.get_all_legislation_data()
+            local.append(time.perf_counter() - start)
+        with lock:
+            latencies.extend(local)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=clients) as executor:
+        for _ in range(clients):
+            executor.submit(client)
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    if not latencies:
+        return 0, 0.0, 0.0, 0.0
+    p50 = latencies[len(latencies) // 2] * 1000
+    p95 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))] * 1000
+    return len(latencies), len(latencies) / elapsed, p50, p95
+
+def main():
+    parser = argparse.ArgumentParser(description="데이터베이스 연결 풀 동시 조회 벤치마크")
+    parser.add_argument("--clients", default="1,2,4,8,16", help="동시 클라이언트 수 목록 (쉼표 구분)")
+    parser.add_argument("--duration", type=float, default=3.0, help="단계별 측정 시간(초)")
+    parser.add_argument("--seed", type=int, default=0, help="소스별로 미리 넣을 벤치마크 데이터 수 (끝나면 삭제)")
+    args = parser.parse_args()
+
+    create_tables()
+    database_service = DatabaseService()
+    if args.seed:
+        seed(database_service, args.seed)
+
+    pool = engine.pool
+    print(f"DB: {engine.url.render_as_string(hide_password=True)}")
+    print(f"풀: {type(pool).__name__} / {pool.status()}")
+    print(f"\n{'clients':>8}{'requests':>10}{'req/sec':>10}{'p50 ms':>10}{'p95 ms':>10}")
+    try:
+        for clients in (int(value) for value in args.clients.split(",")):
+            requests, rate, p50, p95 = bench_clients(database_service, clients, args.duration)
+            print(f"{clients:>8}{requests:>10}{rate:>10.1f}{p50:>10.2f}{p95:>10.2f}")
+    finally:
+        if args.seed:
+            cleanup()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+상세 페이지 파싱 벤치마크
+녹화된 상세 페이지(test_scraper.py --record)로 standard(html.parser 전체 문서) / fast(lxml 본문 영역) 모드의
+페이지당 파싱 시간을 비교하고, 두 모드의 추출 결과가 다르면 실패(종료 코드 1)합니다.
+
+사용법:
+    python test_scraper.py --record fixtures/2024-01-05 --date 2024-01-05
+    python benchmarks/bench_parse.py fixtures/2024-01-05 [--repeat 5] [--date 2024-01-05]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+# backend 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.web_scraper import WebScraper
+from services.http_fixtures import FixtureStore
+from services.page_parsers import PARSE_MODES
+
+def load_pages(store: FixtureStore, source: str):
+    """소스별 녹화된 상세 페이지 (URL, 본문) 목록"""
+    return [
+        (url, store.load(url)["body"])
+        for url, entry in sorted(store.responses.items())
+        if entry["source"] == source and entry["kind"] == "detail"
+    ]
+
+def parse_page(scraper: WebScraper, source: str, content: bytes, url: str, target_date: str):
+    """녹화 당시 대상 날짜로 상세 페이지 파싱 (마감된 건도 포함)"""
+    if source == "national":
+        return scraper._inspect_national_detail_page(content, url, target_date)
+    return scraper._inspect_admin_detail_page(content, url, target_date, None)
+
+def diff_fields(standard, fast):
+    """두 모드의 (게시시작일, 데이터) 결과에서 값이 다른 필드 이름 목록"""
+    (standard_date, standard_item), (fast_date, fast_item) = standard, fast
+    fields = ["(게시시작일)"] if standard_date != fast_date else []
+    if (standard_item is None) != (fast_item is None):
+        return fields + ["(데이터 유무)"]
+    if standard_item is not None:
+        fields += [name for name in standard_item if standard_item.get(name) != fast_item.get(name)]
+    return fields
+
+def bench_source(scrapers, source: str, pages, target_date: str, repeat: int):
+    """소스별 모드당 평균 페이지 파싱 시간(ms) 측정 - (시간, [(URL, 다른 필드)])"""
+    timings = {}
+    outputs = {}
+    for mode, scraper in scrapers.items():
+        start = time.perf_counter()
+        for _ in range(repeat):
+            outputs[mode] = [parse_page(scraper, source, content, url, target_date) for url, content in pages]
+        elapsed = time.perf_counter() - start
+        timings[mode] = elapsed * 1000 / (len(pages) * repeat)
+
+    mismatches = []
+    for (url, _), standard, fast in zip(pages, outputs["standard"], outputs["fast"]):
+        fields = diff_fields(standard, fast)
+        if fields:
+            mismatches.append((url, fields))
+    return timings, mismatches
+
+def main():
+    parser = argparse.ArgumentParser(description="상세 페이지 파싱 벤치마크")
+    parser.add_argument("fixture_dir", help="test_scraper.py --record로 녹화한 디렉토리")
+    parser.add_argument("--repeat", type=int, default=5, help="페이지당 반복 횟수")
+    parser.add_argument("--date", help="대상 날짜 (기본: 녹화 시 대상 날짜)")
+    args = parser.parse_args()
+
+    store = FixtureStore(args.fixture_dir)
+    target_date = args.date or store.meta.get("target_date")
+    if not target_date:
+        parser.error("녹화 정보에 대상 날짜가 없습니다. --date를 지정하세요.")
+
+    # 아카이브 캐시를 거치지 않고 매번 실제로 파싱
+    scrapers = {mode: WebScraper(parse_mode=mode, archive_enabled=False) for mode in PARSE_MODES}
+
+    print(f"대상 날짜 {target_date} / 반복 {args.repeat}회")
+    print(f"{'source':<10}{'pages':>7}{'standard(ms)':>15}{'fast(ms)':>12}{'speedup':>10}{'diff':>7}")
+    all_mismatches = []
+    try:
+        for source in ("national", "admin"):
+            pages = load_pages(store, source)
+            if not pages:
+                print(f"{source:<10}{0:>7}  (녹화된 상세 페이지 없음)")
+                continue
+
+            timings, mismatches = bench_source(scrapers, source, pages, target_date, args.repeat)
+            speedup = timings["standard"] / timings["fast"] if timings["fast"] else float("inf")
+            print(f"{source:<10}{len(pages):>7}{timings['standard']:>15.2f}{timings['fast']:>12.2f}{speedup:>9.1f}x{len(mismatches):>7}")
+            all_mismatches.extend((source, url, fields) for url, fields in mismatches)
+    finally:
+        for scraper in scrapers.values():
+            scraper.close()
+
+    # 파싱 모드는 속도만 달라야 하므로 추출 결과가 다르면 실패
+    if all_mismatches:
+        print(f"\n❌ 모드 간 추출 결과가 다른 페이지 {len(all_mismatches)}건")
+        for source, url, fields in all_mismatches:
+            print(f"  [{source}] {url} - {', '.join(fields)}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+스크래퍼 재생 벤치마크
+녹화된 목록/상세 응답(test_scraper.py --record)을 네트워크 없이 WebScraper에 흘려
+소스별 처리량(pages/sec)과 필드별 추출 시간을 측정합니다.
+
+사용법:
+    python test_scraper.py --record fixtures/2024-01-05 --date 2024-01-05
+    python benchmarks/bench_scraper.py fixtures/2024-01-05 [--repeat 3] [--mode fast]
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from collections import defaultdict
+
+# backend 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.web_scraper import WebScraper
+from services.http_fixtures import FixtureStore, start_replay
+from services.page_parsers import PARSE_MODES, make_detail_soup
+from services.extraction_rules import SOURCE_RULES
+
+async def collect(scraper: WebScraper, source: str, target_date: str):
+    """녹화 당시 대상 날짜로 수집 (재생 시점과 무관하게 마감된 건도 포함)"""
+    if source == "national":
+        return await scraper.get_national_legislation_data_async(target_date)
+    return await scraper.get_admin_legislation_data_async(target_date, include_closed=True)
+
+def bench_throughput(fixture_dir: str, mode: str, target_date: str, repeat: int):
+    """소스별 재생 수집 처리량 측정 - {source: (pages, items, pages/sec)}"""
+    # 아카이브를 켜면 두 번째 반복부터 저장된 파싱 결과를 재사용하므로 끄고 측정
+    scraper = WebScraper(parse_mode=mode, per_host_interval=0, archive_enabled=False)
+    replay = start_replay(scraper.session, fixture_dir)
+
+    results = {}
+    try:
+        for source in ("national", "admin"):
+            served = replay.served
+            start = time.perf_counter()
+            for _ in range(repeat):
+                items = asyncio.run(collect(scraper, source, target_date))
+            elapsed = time.perf_counter() - start
+            pages = (replay.served - served) // repeat
+            results[source] = (pages, len(items), pages * repeat / elapsed if elapsed else 0.0)
+    finally:
+        scraper.close()
+
+    if replay.missing:
+        print(f"⚠️ 녹화되지 않은 요청 {replay.missing}건 (404로 처리됨)")
+    return results
+
+def bench_fields(store: FixtureStore, mode: str, repeat: int):
+    """상세 페이지 필드별 평균 추출 시간(ms) 측정 - {source: (pages, {단계: ms})}"""
+    results = {}
+    for source in ("national", "admin"):
+        rules = SOURCE_RULES[(source, mode)]
+        pages = [
+            store.load(url)["body"]
+            for url, entry in store.responses.items()
+            if entry["source"] == source and entry["kind"] == "detail"
+        ]
+        if not pages:
+            continue
+
+        totals = defaultdict(float)
+        for _ in range(repeat):
+            for content in pages:
+                start = time.perf_counter()
+                soup = make_detail_soup(content, rules.strainer, mode)
+                totals["(parse)"] += time.perf_counter() - start
+
+                document = rules.bind(soup)
+                start = time.perf_counter()
+                document.page_text
+                totals["(page_text)"] += time.perf_counter() - start
+
+                # 캐시를 거치지 않고 규칙별로 직접 실행해 필드 단위 비용 측정
+                for name, rule in rules.fields.items():
+                    start = time.perf_counter()
+                    rule.extract(document)
+                    totals[name] += time.perf_counter() - start
+
+        runs = len(pages) * repeat
+        results[source] = (len(pages), {name: total * 1000 / runs for name, total in totals.items()})
+    return results
+
+def main():
+    parser = argparse.ArgumentParser(description="녹화 응답 기반 스크래퍼 벤치마크")
+    parser.add_argument("fixture_dir", help="test_scraper.py --record로 녹화한 디렉토리")
+    parser.add_argument("--repeat", type=int, default=3, help="반복 횟수")
+    parser.add_argument("--mode", choices=PARSE_MODES, help="파싱 모드 (기본: 전체)")
+    parser.add_argument("--date", help="대상 날짜 (기본: 녹화 시 대상 날짜)")
+    args = parser.parse_args()
+
+    store = FixtureStore(args.fixture_dir)
+    target_date = args.date or store.meta.get("target_date")
+    if not target_date:
+        parser.error("녹화 정보에 대상 날짜가 없습니다. --date를 지정하세요.")
+    modes = [args.mode] if args.mode else list(PARSE_MODES)
+
+    print(f"녹화 응답 {len(store.responses)}건 / 대상 날짜 {target_date} / 반복 {args.repeat}회")
+
+    print(f"\n[처리량]\n{'mode':<10}{'source':<10}{'pages':>7}{'items':>7}{'pages/sec':>12}")
+    for mode in modes:
+        for source, (pages, items, rate) in bench_throughput(args.fixture_dir, mode, target_date, args.repeat).items():
+            print(f"{mode:<10}{source:<10}{pages:>7}{items:>7}{rate:>12.1f}")
+
+    print("\n[필드별 추출 시간 (ms/page)]")
+    for mode in modes:
+        for source, (pages, timings) in bench_fields(store, mode, args.repeat).items():
+            print(f"{mode} / {source} ({pages} pages)")
+            for name, ms in timings.items():
+                print(f"  {name:<14}{ms:>10.3f}")
+
+if __name__ == "__main__":
+    main()
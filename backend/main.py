@@ -1,7 +1,9 @@
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Depends, Query
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 import uvicorn
+import asyncio
+from typing import Dict, List, Optional
 from datetime import datetime, timedelta
 import os
 import logging
@@ -16,8 +18,11 @@ logger = logging.getLogger(__name__)
 
 from services.legislation_service import LegislationService
 from services.database_service import DatabaseService
-from models.legislation_models import LegislationResponse, LegislationItem
-from models.database import create_tables
+from services.async_database_service import AsyncDatabaseService
+from services.crawl_jobs import CrawlJobQueue
+from services.single_flight import SingleFlight
+from models.legislation_models import LegislationResponse, LegislationItem, CrawlJobResponse
+from models.database import create_tables, dispose_async_engine
 
 # 환경변수 로드
 load_dotenv()
@@ -68,6 +73,27 @@ except Exception as e:
     logger.error(f"❌ DATABASE_URL: {os.getenv('DATABASE_URL', 'NOT_SET')[:50]}...")
     database_service = None
 
+# 비동기 데이터베이스 서비스 (API 요청 처리용 - 쿼리를 기다리는 동안 다른 요청을 처리)
+try:
+    async_database_service = AsyncDatabaseService() if database_service else None
+except Exception as e:
+    logger.error(f"❌ 비동기 데이터베이스 서비스 초기화 실패 (asyncpg/aiosqlite 설치 확인): {str(e)}")
+    async_database_service = None
+
+# 수집 작업 큐 (새로고침은 백그라운드 워커에서 처리)
+crawl_jobs = CrawlJobQueue(legislation_service, database_service) if database_service else None
+
+@app.on_event("startup")
+async def start_crawl_worker():
+    if crawl_jobs:
+        crawl_jobs.start()
+
+@app.on_event("shutdown")
+async def stop_crawl_worker():
+    if crawl_jobs:
+        await crawl_jobs.stop()
+    await dispose_async_engine()
+
 @app.get("/")
 async def root():
     return {"message": "입법예고 수집 API 서버가 실행 중입니다."}
@@ -81,7 +107,7 @@ async def test_database():
     """데이터베이스 연결 테스트"""
     logger.info("🔍 데이터베이스 연결 테스트 시작")
     
-    if database_service is None:
+    if async_database_service is None:
         logger.error("❌ 데이터베이스 서비스가 초기화되지 않음")
         return {
             "status": "error", 
@@ -91,8 +117,8 @@ async def test_database():
     
     try:
         # 데이터베이스 연결 테스트
-        national_count = len(database_service.get_national_legislation_data(limit=1))
-        admin_count = len(database_service.get_admin_legislation_data(limit=1))
+        national_count = len(await async_database_service.get_national_legislation_data(limit=1))
+        admin_count = len(await async_database_service.get_admin_legislation_data(limit=1))
         data_count = national_count + admin_count
         
         logger.info(f"✅ 데이터베이스 연결 테스트 성공 - 데이터: {data_count}건")
@@ -113,185 +139,230 @@ async def test_database():
             "database_url": os.getenv('DATABASE_URL', 'NOT_SET')[:50] + "..."
         }
 
+# 데이터가 없을 때의 실시간 크롤링은 소스별로 하나만 실행하고 동시에 들어온 요청은 그 결과를 공유
+live_crawls = SingleFlight()
+
+async def _crawl_and_save(source: str) -> List[LegislationItem]:
+    """소스 데이터를 실시간 크롤링해 저장 (새로고침 작업이 진행 중이면 끝난 뒤 저장된 데이터를 조회)"""
+    label = "입법부" if source == "national" else "행정부"
+    if source == "national":
+        crawl = legislation_service.get_national_legislation
+        save = async_database_service.save_national_legislation_data
+        load = async_database_service.get_national_legislation_data
+    else:
+        crawl = legislation_service.get_admin_legislation
+        save = async_database_service.save_admin_legislation_data
+        load = async_database_service.get_admin_legislation_data
+    
+    refresh_job = crawl_jobs.active_refresh() if crawl_jobs else None
+    if refresh_job:
+        logger.info(f"⏳ 진행 중인 새로고침 작업({refresh_job.id}) 완료 후 {label} 데이터 조회")
+        await refresh_job.wait()
+        return await load()
+    
+    logger.info(f"🕷️ {label} 데이터 실시간 크롤링 시작")
+    frontier_entries = []
+    data = await crawl(frontier_entries=frontier_entries)
+    if data:
+        logger.info(f"💾 크롤링한 {label} 데이터 {len(data)}건을 데이터베이스에 저장 중...")
+        if not await save(data):
+            # 저장 실패 - 프론티어에 기록하지 않아 다음 크롤링에서 다시 수집
+            logger.error(f"❌ {label} 데이터 저장 실패")
+            return data
+        logger.info(f"✅ {label} 데이터 저장 완료")
+    else:
+        logger.error(f"❌ {label} 데이터 크롤링 실패 - 데이터 없음")
+    await legislation_service.web_scraper.record_frontier(source, frontier_entries)
+    return data or []
+
+async def crawl_on_empty(source: str) -> List[LegislationItem]:
+    """빈 테이블 조회 시 실시간 크롤링 (같은 소스의 크롤링이 진행 중이면 합류)"""
+    return await live_crawls.do(source, lambda: _crawl_and_save(source))
+
+# 목록 API 페이지 크기 (기본값 / 요청 가능한 최대값)
+MAX_PAGE_SIZE = int(os.getenv("API_MAX_PAGE_SIZE", "200"))
+DEFAULT_PAGE_SIZE = min(int(os.getenv("API_PAGE_SIZE", "50")), MAX_PAGE_SIZE)
+DATE_PATTERN = r"^\d{4}-\d{2}-\d{2}$"
+
+def page_query(
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE, description="페이지 크기"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor (비우면 첫 페이지)"),
+    committee: Optional[str] = Query(None, description="소관위원회"),
+    date_from: Optional[str] = Query(None, pattern=DATE_PATTERN, description="게시시작일 이후 (YYYY-MM-DD)"),
+    date_to: Optional[str] = Query(None, pattern=DATE_PATTERN, description="게시시작일 이전 (YYYY-MM-DD)")
+) -> Dict:
+    """목록 API 공통 페이지/필터 파라미터"""
+    return {"limit": limit, "cursor": cursor, "committee": committee, "date_from": date_from, "date_to": date_to}
+
+async def load_page(sources: List[str], limit: int, cursor: Optional[str] = None, committee: Optional[str] = None,
+                    date_from: Optional[str] = None, date_to: Optional[str] = None):
+    """목록 페이지 조회 - 필터 없는 첫 페이지에서 데이터가 없는 소스는 실시간 크롤링 후 다시 조회"""
+    if async_database_service is None:
+        logger.error("❌ 데이터베이스 서비스가 초기화되지 않음")
+        raise HTTPException(status_code=500, detail="데이터베이스 서비스가 사용 불가능합니다")
+    
+    try:
+        data, next_cursor = await async_database_service.get_legislation_page(
+            sources, limit, cursor, committee, date_from, date_to
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    if cursor or committee or date_from or date_to:
+        return data, next_cursor
+    
+    loaded = {item.source for item in data}
+    missing = [source for source in sources if source not in loaded]
+    empty = await async_database_service.empty_sources(missing) if missing else []
+    if not empty:
+        return data, next_cursor
+    
+    # 데이터가 없으면 실시간 크롤링 (백업) - 여러 소스는 동시에 수집
+    logger.warning(f"⚠️ 데이터베이스에 데이터가 없는 소스: {', '.join(empty)} - 실시간 크롤링 시작")
+    results = await asyncio.gather(*(crawl_on_empty(source) for source in empty), return_exceptions=True)
+    crawled = []
+    for source, result in zip(empty, results):
+        if isinstance(result, Exception):
+            logger.error(f"❌ {source} 데이터 크롤링 오류: {str(result)}")
+        else:
+            crawled.extend(result)
+    
+    # 저장된 데이터로 다시 조회해 커서를 만들고, 저장하지 못했으면 크롤링 결과를 그대로 반환
+    data, next_cursor = await async_database_service.get_legislation_page(sources, limit)
+    if not data:
+        data = crawled[:limit]
+    return data, next_cursor
+
 @app.get("/api/legislation/national", response_model=LegislationResponse)
-async def get_national_legislation():
-    """입법부 입법예고 데이터를 가져옵니다."""
+async def get_national_legislation(query: Dict = Depends(page_query)):
+    """입법부 입법예고 데이터를 가져옵니다. (수집일시 역순, next_cursor로 다음 페이지 조회)"""
     logger.info("🏛️ 입법부 입법예고 데이터 요청 시작")
     
     try:
-        if database_service is None:
-            logger.error("❌ 데이터베이스 서비스가 초기화되지 않음")
-            raise HTTPException(status_code=500, detail="데이터베이스 서비스가 사용 불가능합니다")
-        
-        # 데이터베이스에서 조회
-        logger.info("📊 데이터베이스에서 입법부 데이터 조회 중...")
-        data = database_service.get_national_legislation_data()
-        
-        if not data:
-            logger.warning("⚠️ 데이터베이스에 입법부 데이터가 없음 - 실시간 크롤링 시작")
-            try:
-                # 데이터가 없으면 실시간 크롤링 (백업)
-                data = await legislation_service.get_national_legislation()
-                if data:
-                    logger.info(f"💾 크롤링한 입법부 데이터 {len(data)}건을 데이터베이스에 저장 중...")
-                    # 크롤링한 데이터를 데이터베이스에 저장
-                    database_service.save_national_legislation_data(data)
-                    logger.info("✅ 데이터베이스 저장 완료")
-                else:
-                    logger.error("❌ 입법부 데이터 크롤링 실패 - 데이터 없음")
-                    data = []
-            except Exception as crawl_error:
-                logger.error(f"❌ 입법부 데이터 크롤링 오류: {str(crawl_error)}")
-                data = []
-        else:
-            logger.info(f"✅ 데이터베이스에서 입법부 데이터 {len(data)}건 조회 성공")
+        data, next_cursor = await load_page(["national"], **query)
+        logger.info(f"✅ 입법부 데이터 {len(data)}건 조회 성공")
         
         return LegislationResponse(
             success=True,
             message="입법부 입법예고 데이터를 성공적으로 가져왔습니다.",
             data=data,
-            total_count=len(data)
+            total_count=len(data),
+            next_cursor=next_cursor
         )
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"❌ 입법부 데이터 수집 오류: {str(e)}")
         raise HTTPException(status_code=500, detail=f"입법부 데이터 수집 중 오류가 발생했습니다: {str(e)}")
 
 @app.get("/api/legislation/admin", response_model=LegislationResponse)
-async def get_admin_legislation():
-    """행정부 입법예고 데이터를 가져옵니다."""
+async def get_admin_legislation(query: Dict = Depends(page_query)):
+    """행정부 입법예고 데이터를 가져옵니다. (수집일시 역순, next_cursor로 다음 페이지 조회)"""
     logger.info("🏢 행정부 입법예고 데이터 요청 시작")
     
     try:
-        if database_service is None:
-            logger.error("❌ 데이터베이스 서비스가 초기화되지 않음")
-            raise HTTPException(status_code=500, detail="데이터베이스 서비스가 사용 불가능합니다")
-        
-        # 데이터베이스에서 조회
-        logger.info("📊 데이터베이스에서 행정부 데이터 조회 중...")
-        data = database_service.get_admin_legislation_data()
-        
-        if not data:
-            logger.warning("⚠️ 데이터베이스에 행정부 데이터가 없음 - 실시간 크롤링 시작")
-            # 데이터가 없으면 실시간 크롤링 (백업)
-            data = await legislation_service.get_admin_legislation()
-            if data:
-                logger.info(f"💾 크롤링한 행정부 데이터 {len(data)}건을 데이터베이스에 저장 중...")
-                # 크롤링한 데이터를 데이터베이스에 저장
-                database_service.save_admin_legislation_data(data)
-                logger.info("✅ 데이터베이스 저장 완료")
-            else:
-                logger.error("❌ 행정부 데이터 크롤링 실패")
-        else:
-            logger.info(f"✅ 데이터베이스에서 행정부 데이터 {len(data)}건 조회 성공")
+        data, next_cursor = await load_page(["admin"], **query)
+        logger.info(f"✅ 행정부 데이터 {len(data)}건 조회 성공")
         
         return LegislationResponse(
             success=True,
             message="행정부 입법예고 데이터를 성공적으로 가져왔습니다.",
             data=data,
-            total_count=len(data)
+            total_count=len(data),
+            next_cursor=next_cursor
         )
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"❌ 행정부 데이터 수집 오류: {str(e)}")
         raise HTTPException(status_code=500, detail=f"행정부 데이터 수집 중 오류가 발생했습니다: {str(e)}")
 
 @app.get("/api/legislation/all", response_model=LegislationResponse)
-async def get_all_legislation():
-    """모든 입법예고 데이터를 가져옵니다."""
+async def get_all_legislation(
+    query: Dict = Depends(page_query),
+    source: Optional[str] = Query(None, pattern="^(national|admin)$", description="데이터 출처 (national/admin)")
+):
+    """모든 입법예고 데이터를 가져옵니다. (두 소스를 수집일시 역순으로 합친 페이지)"""
     logger.info("📋 모든 입법예고 데이터 요청 시작")
     
     try:
-        if database_service is None:
-            logger.error("❌ 데이터베이스 서비스가 초기화되지 않음")
-            raise HTTPException(status_code=500, detail="데이터베이스 서비스가 사용 불가능합니다")
-        
-        # 데이터베이스에서 조회
-        logger.info("📊 데이터베이스에서 모든 데이터 조회 중...")
-        national_data = database_service.get_national_legislation_data()
-        admin_data = database_service.get_admin_legislation_data()
-        
-        logger.info(f"📊 조회 결과 - 입법부: {len(national_data) if national_data else 0}건, 행정부: {len(admin_data) if admin_data else 0}건")
-        
-        # 데이터가 없으면 실시간 크롤링 (백업)
-        if not national_data:
-            logger.warning("⚠️ 입법부 데이터가 없음 - 실시간 크롤링 시작")
-            national_data = await legislation_service.get_national_legislation()
-            if national_data:
-                logger.info(f"💾 크롤링한 입법부 데이터 {len(national_data)}건을 데이터베이스에 저장 중...")
-                database_service.save_national_legislation_data(national_data)
-                logger.info("✅ 입법부 데이터 저장 완료")
-            else:
-                logger.error("❌ 입법부 데이터 크롤링 실패")
-                national_data = []
-        
-        if not admin_data:
-            logger.warning("⚠️ 행정부 데이터가 없음 - 실시간 크롤링 시작")
-            admin_data = await legislation_service.get_admin_legislation()
-            if admin_data:
-                logger.info(f"💾 크롤링한 행정부 데이터 {len(admin_data)}건을 데이터베이스에 저장 중...")
-                database_service.save_admin_legislation_data(admin_data)
-                logger.info("✅ 행정부 데이터 저장 완료")
-            else:
-                logger.error("❌ 행정부 데이터 크롤링 실패")
-                admin_data = []
+        sources = [source] if source else ["national", "admin"]
+        all_data, next_cursor = await load_page(sources, **query)
         
-        all_data = national_data + admin_data
-        logger.info(f"✅ 전체 데이터 조회 완료 - 총 {len(all_data)}건 (입법부: {len(national_data)}, 행정부: {len(admin_data)})")
+        national_count = sum(1 for item in all_data if item.source == "national")
+        logger.info(f"✅ 전체 데이터 조회 완료 - 총 {len(all_data)}건 (입법부: {national_count}, 행정부: {len(all_data) - national_count})")
         
         return LegislationResponse(
             success=True,
             message="모든 입법예고 데이터를 성공적으로 가져왔습니다.",
             data=all_data,
-            total_count=len(all_data)
+            total_count=len(all_data),
+            next_cursor=next_cursor
         )
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"❌ 전체 데이터 수집 오류: {str(e)}")
         raise HTTPException(status_code=500, detail=f"데이터 수집 중 오류가 발생했습니다: {str(e)}")
 
-@app.post("/api/legislation/refresh")
+@app.get("/api/legislation/search", response_model=LegislationResponse)
+async def search_legislation(
+    q: str = Query(..., min_length=1, max_length=100, description="검색어 (제목/소관위원회/주요내용)"),
+    source: Optional[str] = Query(None, pattern="^(national|admin)$", description="데이터 출처 (national/admin)"),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE, description="페이지 크기"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor (비우면 첫 페이지)")
+):
+    """입법예고를 전문 검색합니다. (관련도 높은 순, next_cursor로 다음 페이지 조회)"""
+    logger.info(f"🔍 입법예고 검색 요청: {q}")
+    
+    if async_database_service is None:
+        logger.error("❌ 데이터베이스 서비스가 초기화되지 않음")
+        raise HTTPException(status_code=500, detail="데이터베이스 서비스가 사용 불가능합니다")
+    
+    try:
+        data, next_cursor = await async_database_service.search_legislation(q, source, limit, cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    logger.info(f"✅ 검색 결과 {len(data)}건")
+    return LegislationResponse(
+        success=True,
+        message="입법예고 검색 결과를 성공적으로 가져왔습니다.",
+        data=data,
+        total_count=len(data),
+        next_cursor=next_cursor
+    )
+
+@app.post("/api/legislation/refresh", status_code=202)
 async def refresh_legislation_data():
-    """입법예고 데이터를 새로고침합니다."""
+    """입법예고 데이터 새로고침 작업을 등록합니다. (진행 상황은 /api/jobs/{job_id}로 조회)"""
     logger.info("🔄 데이터 새로고침 요청 시작")
     
+    if crawl_jobs is None:
+        logger.error("❌ 데이터베이스 서비스가 초기화되지 않음")
+        raise HTTPException(status_code=500, detail="데이터베이스 서비스가 사용 불가능합니다")
+    
     try:
-        if database_service is None:
-            logger.error("❌ 데이터베이스 서비스가 초기화되지 않음")
-            raise HTTPException(status_code=500, detail="데이터베이스 서비스가 사용 불가능합니다")
-        
-        # 기존 데이터 삭제 후 새로 수집
-        logger.info("🗑️ 기존 데이터 삭제 중...")
-        deleted_national = database_service.delete_national_legislation_data()
-        deleted_admin = database_service.delete_admin_legislation_data()
-        logger.info(f"🗑️ 삭제 완료 - 입법부: {deleted_national}건, 행정부: {deleted_admin}건")
-        
-        # 새로운 데이터 수집
-        logger.info("🕷️ 새로운 데이터 수집 시작...")
-        national_data = await legislation_service.get_national_legislation()
-        admin_data = await legislation_service.get_admin_legislation()
-        
-        # 데이터베이스에 저장
-        if national_data:
-            logger.info(f"💾 입법부 데이터 {len(national_data)}건 저장 중...")
-            database_service.save_national_legislation_data(national_data)
-            logger.info("✅ 입법부 데이터 저장 완료")
-        
-        if admin_data:
-            logger.info(f"💾 행정부 데이터 {len(admin_data)}건 저장 중...")
-            database_service.save_admin_legislation_data(admin_data)
-            logger.info("✅ 행정부 데이터 저장 완료")
-        
-        total_count = len(national_data) + len(admin_data)
-        logger.info(f"✅ 데이터 새로고침 완료 - 총 {total_count}건 (입법부: {len(national_data)}, 행정부: {len(admin_data)})")
-        
-        return {
-            "success": True,
-            "message": "데이터가 성공적으로 새로고침되었습니다.",
-            "national_count": len(national_data),
-            "admin_count": len(admin_data),
-            "total_count": total_count
-        }
+        job = crawl_jobs.submit_refresh()
     except Exception as e:
-        logger.error(f"❌ 데이터 새로고침 오류: {str(e)}")
-        raise HTTPException(status_code=500, detail=f"데이터 새로고침 중 오류가 발생했습니다: {str(e)}")
+        logger.error(f"❌ 데이터 새로고침 작업 등록 오류: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"데이터 새로고침 작업 등록 중 오류가 발생했습니다: {str(e)}")
+    
+    logger.info(f"📥 데이터 새로고침 작업 등록 - job_id: {job.id} ({job.status})")
+    return {
+        "success": True,
+        "message": "데이터 새로고침 작업이 등록되었습니다.",
+        "job_id": job.id,
+        "status": job.status
+    }
+
+@app.get("/api/jobs/{job_id}", response_model=CrawlJobResponse)
+async def get_crawl_job(job_id: str):
+    """수집 작업의 진행 상황과 저장 건수를 조회합니다."""
+    job = crawl_jobs.get(job_id) if crawl_jobs else None
+    if job is None:
+        raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다")
+    return job.to_dict()
 
 if __name__ == "__main__":
     port = int(os.getenv("PORT", 7050))
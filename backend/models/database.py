@@ -1,19 +1,77 @@
-from sqlalchemy import create_engine, Column, Integer, String, Text, DateTime, Boolean, Index
+from sqlalchemy import (
+    create_engine, Column, Integer, String, Text, DateTime, Boolean, Index, MetaData, Table,
+    inspect, select, func, text, literal, cast, null, union_all
+)
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
-from datetime import datetime
+from datetime import datetime, timedelta
 import os
+import logging
+
+from models.legislation_models import MISSING_BILL_NO
+from models.search_index import ensure_search_index
+
+logger = logging.getLogger(__name__)
 
 # 데이터베이스 URL (Railway 환경변수에서 가져오기)
 DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./legislation.db")
 
+# 연결 풀 설정 (요청/작업 단위마다 풀에서 연결을 빌려 씀)
+POOL_OPTIONS = {
+    "pool_size": int(os.getenv("DB_POOL_SIZE", "5")),
+    "max_overflow": int(os.getenv("DB_MAX_OVERFLOW", "10")),
+    "pool_timeout": float(os.getenv("DB_POOL_TIMEOUT", "30")),
+    # 서버/프록시가 끊은 오래된 연결을 재사용하지 않도록 주기적으로 교체
+    "pool_recycle": int(os.getenv("DB_POOL_RECYCLE", "1800")),
+    # 연결을 빌려줄 때 살아 있는지 확인
+    "pool_pre_ping": os.getenv("DB_POOL_PRE_PING", "true").lower() == "true",
+}
+
 # SQLite는 Railway에서 테스트용, PostgreSQL은 프로덕션용
 if DATABASE_URL.startswith("postgres"):
-    engine = create_engine(DATABASE_URL)
-else:
+    engine = create_engine(DATABASE_URL, **POOL_OPTIONS)
+elif ":memory:" in DATABASE_URL or DATABASE_URL in ("sqlite://", "sqlite:///"):
+    # 메모리 DB는 연결마다 별도 DB가 되므로 풀 설정을 적용하지 않음
     engine = create_engine(DATABASE_URL, connect_args={"check_same_thread": False})
+else:
+    engine = create_engine(DATABASE_URL, connect_args={"check_same_thread": False}, **POOL_OPTIONS)
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+# 비동기 엔진 (API 요청 처리용, 비동기 드라이버가 필요하므로 처음 사용할 때 생성)
+_async_engine = None
+_AsyncSessionLocal = None
+
+def async_database_url(url: str = DATABASE_URL) -> str:
+    """동기 DATABASE_URL을 비동기 드라이버 URL로 변환 (PostgreSQL: asyncpg, SQLite: aiosqlite)"""
+    for prefix in ("postgresql+psycopg2://", "postgresql://", "postgres://"):
+        if url.startswith(prefix):
+            return "postgresql+asyncpg://" + url[len(prefix):]
+    if url.startswith("sqlite://"):
+        return "sqlite+aiosqlite://" + url[len("sqlite://"):]
+    return url
+
+def get_async_sessionmaker():
+    """비동기 세션 팩토리 (엔진은 프로세스당 하나, 동기 엔진과 같은 연결 풀 설정 사용)"""
+    global _async_engine, _AsyncSessionLocal
+    if _AsyncSessionLocal is None:
+        from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+        url = async_database_url()
+        if url.startswith("sqlite") and (":memory:" in url or url.endswith("://")):
+            _async_engine = create_async_engine(url)
+        else:
+            _async_engine = create_async_engine(url, **POOL_OPTIONS)
+        _AsyncSessionLocal = async_sessionmaker(_async_engine, expire_on_commit=False)
+    return _AsyncSessionLocal
+
+async def dispose_async_engine():
+    """비동기 엔진 연결 풀 정리"""
+    global _async_engine, _AsyncSessionLocal
+    if _async_engine is not None:
+        await _async_engine.dispose()
+        _async_engine = None
+        _AsyncSessionLocal = None
 Base = declarative_base()
 
 class NationalLegislationDB(Base):
@@ -29,15 +87,19 @@ class NationalLegislationDB(Base):
     end_date = Column(String(20), nullable=False)  # 게시종료일
     content = Column(Text, nullable=True)  # 주요내용
     link_url = Column(String(500), nullable=False)  # 링크 URL
+    content_hash = Column(String(64), nullable=True)  # 저장 필드 해시 (변경 없으면 갱신 생략)
+    search_text = Column(Text, nullable=True)  # 전문 검색용 2-gram 토큰 (제목/소관위원회/주요내용)
     created_at = Column(DateTime, default=datetime.utcnow)  # 수집일시
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)  # 수정일시
     is_active = Column(Boolean, default=True)  # 활성 상태
     
-    # 인덱스 설정
+    # 인덱스 설정 (의안번호는 일괄 저장 시 충돌 기준으로 사용)
     __table_args__ = (
+        Index('uq_national_bill_no', 'bill_no', unique=True),
         Index('idx_national_date', 'start_date'),
         Index('idx_national_end_date', 'end_date'),
         Index('idx_national_committee', 'committee'),
+        Index('idx_national_created', 'created_at', 'id'),  # 목록 키셋 페이지 조회
     )
 
 class AdminLegislationDB(Base):
@@ -53,17 +115,121 @@ class AdminLegislationDB(Base):
     end_date = Column(String(20), nullable=False)  # 게시종료일
     content = Column(Text, nullable=True)  # 주요내용
     link_url = Column(String(500), nullable=False)  # 링크 URL
+    notice_key = Column(String(500), nullable=True)  # 공고 고유키 (상세 URL의 공고 일련번호)
+    content_hash = Column(String(64), nullable=True)  # 저장 필드 해시 (변경 없으면 갱신 생략)
+    search_text = Column(Text, nullable=True)  # 전문 검색용 2-gram 토큰 (제목/소관위원회/주요내용)
     created_at = Column(DateTime, default=datetime.utcnow)  # 수집일시
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)  # 수정일시
     is_active = Column(Boolean, default=True)  # 활성 상태
     
-    # 인덱스 설정
+    # 인덱스 설정 (의안번호가 없는 행은 NULL끼리 충돌하지 않으므로 공고 고유키로 식별)
     __table_args__ = (
+        Index('uq_admin_bill_no', 'bill_no', unique=True),
+        Index('uq_admin_notice_key', 'notice_key', unique=True),
         Index('idx_admin_date', 'start_date'),
         Index('idx_admin_end_date', 'end_date'),
         Index('idx_admin_committee', 'committee'),
+        Index('idx_admin_created', 'created_at', 'id'),  # 목록 키셋 페이지 조회
     )
 
+class CrawlFrontierDB(Base):
+    """크롤링 프론티어 (이미 처리한 상세 페이지 URL 기록)"""
+    __tablename__ = "crawl_frontier"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    source = Column(String(20), nullable=False)  # 데이터 출처 (national/admin)
+    url = Column(String(500), nullable=False, unique=True)  # 상세 페이지 URL
+    bill_no = Column(String(50), index=True, nullable=True)  # 의안번호
+    notice_date = Column(String(20), nullable=True)  # 게시시작일 (확인된 경우)
+    first_seen_at = Column(DateTime, default=datetime.utcnow)  # 최초 수집일시
+    last_fetched_at = Column(DateTime, default=datetime.utcnow)  # 마지막 수집일시
+    next_check_at = Column(DateTime, nullable=True)  # 재확인 예정일시
+    
+    # 인덱스 설정
+    __table_args__ = (
+        Index('idx_frontier_source', 'source'),
+    )
+
+# 입법부 + 행정부 통합 목록 뷰 (UNION ALL, 테이블이 아니므로 create_all 대상 메타데이터와 분리)
+# 정렬 순서는 수집일시 → 소스 순위(입법부 먼저) → ID 내림차순이며, 각 테이블의 (created_at, id) 인덱스를 그대로 사용
+SOURCE_RANK = {"national": 1, "admin": 0}
+
+view_metadata = MetaData()
+
+LegislationAllView = Table(
+    "legislation_all", view_metadata,
+    Column("source", String(20)),  # 데이터 출처 (national/admin)
+    Column("source_rank", Integer),  # 같은 수집일시일 때 정렬 순위
+    Column("id", Integer),
+    Column("bill_no", String(50)),
+    Column("notice_key", String(500)),
+    Column("title", String(500)),
+    Column("committee", String(200)),
+    Column("proposer", String(200)),
+    Column("start_date", String(20)),
+    Column("end_date", String(20)),
+    Column("content", Text),
+    Column("link_url", String(500)),
+    Column("created_at", DateTime),
+    Column("is_active", Boolean),
+)
+
+def legislation_all_select():
+    """통합 목록 뷰 정의 (두 테이블의 UNION ALL)"""
+    selects = []
+    for model, source in ((NationalLegislationDB, "national"), (AdminLegislationDB, "admin")):
+        table = model.__table__
+        columns = []
+        for column in LegislationAllView.columns:
+            if column.name == "source":
+                columns.append(literal(source, String(20)).label("source"))
+            elif column.name == "source_rank":
+                columns.append(literal(SOURCE_RANK[source], Integer).label("source_rank"))
+            elif column.name in table.c:
+                columns.append(table.c[column.name])
+            else:
+                columns.append(cast(null(), column.type).label(column.name))
+        selects.append(select(*columns))
+    return union_all(*selects)
+
+# 보관 테이블 월별 파티셔닝 (PostgreSQL 전용, monthly이면 created_at 기준 월 단위 파티션)
+ARCHIVE_PARTITIONED = (
+    os.getenv("DB_ARCHIVE_PARTITIONING", "").lower() == "monthly" and DATABASE_URL.startswith("postgres")
+)
+
+def archive_table(model) -> Table:
+    """보관 테이블 정의 (원본 테이블과 같은 컬럼 + 보관일시, 파티션 키를 포함하도록 기본키는 (id, created_at))"""
+    table = model.__table__
+    columns = [
+        Column(column.name, column.type, primary_key=column.name in ("id", "created_at"), autoincrement=False)
+        for column in table.columns
+    ]
+    options = {"postgresql_partition_by": "RANGE (created_at)"} if ARCHIVE_PARTITIONED else {}
+    return Table(
+        f"{table.name}_archive", Base.metadata,
+        *columns,
+        Column("archived_at", DateTime, default=datetime.utcnow),  # 보관일시
+        Index(f"idx_{table.name}_archive_created", "created_at"),
+        **options
+    )
+
+# 보관 기간이 지난 행을 옮겨 두는 테이블 (조회 API는 원본 테이블만 사용하므로 원본 크기가 일정하게 유지됨)
+NationalLegislationArchive = archive_table(NationalLegislationDB)
+AdminLegislationArchive = archive_table(AdminLegislationDB)
+ARCHIVE_TABLES = {
+    NationalLegislationDB.__tablename__: NationalLegislationArchive,
+    AdminLegislationDB.__tablename__: AdminLegislationArchive,
+}
+
+def ensure_archive_partitions(conn, archive: Table, months):
+    """보관 테이블 월별 파티션 생성 (이미 있으면 건너뜀, months는 각 월 1일)"""
+    for month in sorted(set(months)):
+        next_month = (month + timedelta(days=32)).replace(day=1)
+        conn.execute(text(
+            f"CREATE TABLE IF NOT EXISTS {archive.name}_{month:%Y%m} PARTITION OF {archive.name} "
+            f"FOR VALUES FROM ('{month:%Y-%m-%d}') TO ('{next_month:%Y-%m-%d}')"
+        ))
+
 def get_db():
     """데이터베이스 세션 생성"""
     db = SessionLocal()
@@ -75,3 +241,85 @@ def get_db():
 def create_tables():
     """테이블 생성"""
     Base.metadata.create_all(bind=engine)
+    ensure_columns()
+    ensure_unique_keys()
+    ensure_indexes()
+    ensure_search_index(engine, [NationalLegislationDB.__table__, AdminLegislationDB.__table__])
+    ensure_views()
+
+def ensure_columns():
+    """이전 버전에서 만든 테이블에 새로 추가된 컬럼 추가 (기존 행은 NULL)"""
+    for table in (NationalLegislationDB.__table__, AdminLegislationDB.__table__, *ARCHIVE_TABLES.values()):
+        with engine.begin() as conn:
+            existing = {column["name"] for column in inspect(conn).get_columns(table.name)}
+            for column in table.columns:
+                if column.name not in existing:
+                    column_type = column.type.compile(dialect=conn.dialect)
+                    conn.execute(text(f"ALTER TABLE {table.name} ADD COLUMN {column.name} {column_type}"))
+
+# 자연키 유니크 인덱스 (모델, 인덱스 이름, 키 컬럼)
+UNIQUE_KEYS = (
+    (NationalLegislationDB, 'uq_national_bill_no', 'bill_no'),
+    (AdminLegislationDB, 'uq_admin_bill_no', 'bill_no'),
+    (AdminLegislationDB, 'uq_admin_notice_key', 'notice_key'),
+)
+
+def ensure_unique_keys(dedupe: bool = False):
+    """이전 버전에서 만든 테이블에 자연키 유니크 인덱스 추가
+
+    의안번호 자리의 표시 값("(없음)")은 NULL로 바꿔 자연키에서 제외합니다.
+    중복 행이 남아 있으면 인덱스를 만들지 않고 경고만 남기며,
+    dedupe=True(scheduled_crawler.py migrate)일 때만 키별로 최신 행 하나만 남기고 삭제합니다.
+    """
+    for model, index_name, key in UNIQUE_KEYS:
+        table = model.__table__
+        index = next(index for index in table.indexes if index.name == index_name)
+        with engine.begin() as conn:
+            if key == 'bill_no':
+                conn.execute(table.update().where(table.c.bill_no == MISSING_BILL_NO).values(bill_no=None))
+            if inspect(conn).has_index(table.name, index_name):
+                continue
+            latest_ids = (
+                select(func.max(table.c.id))
+                .where(table.c[key].isnot(None))
+                .group_by(table.c[key])
+            )
+            duplicates = table.c[key].isnot(None) & table.c.id.notin_(latest_ids)
+            if not dedupe:
+                count = conn.execute(select(func.count()).select_from(table).where(duplicates)).scalar()
+                if count:
+                    logger.warning(
+                        f"⚠️ {table.name}.{key} 중복 행 {count}건으로 유니크 인덱스를 만들지 못했습니다. "
+                        f"'python scheduled_crawler.py migrate'로 정리하세요."
+                    )
+                    continue
+            else:
+                deleted = conn.execute(table.delete().where(duplicates)).rowcount
+                logger.info(f"{table.name}.{key} 중복 행 {deleted}건 삭제")
+            index.create(conn)
+
+def migrate_unique_keys():
+    """자연키 중복 행을 정리하고 유니크 인덱스 생성 (기존 데이터를 지우므로 명시적으로만 실행)"""
+    Base.metadata.create_all(bind=engine)
+    ensure_columns()
+    ensure_unique_keys(dedupe=True)
+
+def ensure_indexes():
+    """이전 버전에서 만든 테이블에 새로 추가된 일반 인덱스 추가"""
+    for model in (NationalLegislationDB, AdminLegislationDB):
+        table = model.__table__
+        with engine.begin() as conn:
+            existing = {index["name"] for index in inspect(conn).get_indexes(table.name)}
+            for index in table.indexes:
+                if not index.unique and index.name not in existing:
+                    index.create(conn)
+
+def ensure_views():
+    """통합 목록 뷰 생성 (테이블 컬럼이 바뀌어도 맞도록 매번 다시 정의)"""
+    with engine.begin() as conn:
+        definition = legislation_all_select().compile(dialect=conn.dialect, compile_kwargs={"literal_binds": True})
+        if conn.dialect.name == "postgresql":
+            conn.execute(text(f"CREATE OR REPLACE VIEW {LegislationAllView.name} AS {definition}"))
+        else:
+            conn.execute(text(f"DROP VIEW IF EXISTS {LegislationAllView.name}"))
+            conn.execute(text(f"CREATE VIEW {LegislationAllView.name} AS {definition}"))
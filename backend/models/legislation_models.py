@@ -1,7 +1,10 @@
 from pydantic import BaseModel, Field
-from typing import List, Optional
+from typing import Dict, List, Optional
 from datetime import datetime
 
+# 상세 페이지에 의안번호가 없을 때 표시하는 값 (저장할 때는 NULL로 바꿔 자연키로 쓰지 않음)
+MISSING_BILL_NO = "(없음)"
+
 class LegislationItem(BaseModel):
     """입법예고 개별 항목 모델"""
     id: Optional[str] = None
@@ -13,6 +16,7 @@ class LegislationItem(BaseModel):
     content: str = Field(..., description="주요내용")
     link_url: str = Field(..., description="링크 URL")
     bill_no: Optional[str] = Field(None, description="의안번호")
+    notice_key: Optional[str] = Field(None, description="행정부 공고 고유키 (상세 URL의 공고 일련번호)")
     source: str = Field(..., description="데이터 출처 (national/admin)")
     created_at: Optional[datetime] = Field(None, description="수집일시")
     
@@ -27,8 +31,23 @@ class LegislationResponse(BaseModel):
     message: str = Field(..., description="응답 메시지")
     data: List[LegislationItem] = Field(..., description="입법예고 데이터 목록")
     total_count: int = Field(..., description="총 데이터 개수")
+    next_cursor: Optional[str] = Field(None, description="다음 페이지 커서 (마지막 페이지면 None)")
     timestamp: Optional[datetime] = Field(default_factory=datetime.now, description="응답 시간")
 
+class CrawlJobResponse(BaseModel):
+    """백그라운드 수집 작업 상태 응답 모델"""
+    job_id: str = Field(..., description="작업 ID")
+    kind: str = Field(..., description="작업 종류 (refresh)")
+    status: str = Field(..., description="작업 상태 (queued/running/succeeded/failed)")
+    created_at: datetime = Field(..., description="등록 시간")
+    started_at: Optional[datetime] = Field(None, description="시작 시간")
+    finished_at: Optional[datetime] = Field(None, description="종료 시간")
+    progress: Dict[str, Dict] = Field(..., description="소스별 진행 상태와 저장 건수")
+    national_count: int = Field(0, description="입법부 저장 건수")
+    admin_count: int = Field(0, description="행정부 저장 건수")
+    total_count: int = Field(0, description="총 저장 건수")
+    error: Optional[str] = Field(None, description="실패 사유")
+
 class ErrorResponse(BaseModel):
     """에러 응답 모델"""
     success: bool = Field(False, description="성공 여부")
@@ -0,0 +1,122 @@
+"""
+입법예고 전문 검색 인덱스 (한국어 2-gram 토큰화)
+
+제목/소관위원회/주요내용을 단어마다 두 글자씩 겹쳐 자른 토큰(2-gram)으로 바꿔 search_text 컬럼에 저장하고,
+DB 기본 전문 검색 인덱스로 조회합니다. (PostgreSQL: tsvector GIN 인덱스, SQLite: FTS5 외부 콘텐츠 테이블)
+형태소 분석 없이도 조사가 붙은 단어의 일부("개정안을" → "개정안")를 찾을 수 있습니다.
+"""
+
+import re
+from typing import List
+
+from sqlalchemy import bindparam, inspect, select, text
+
+# 단어 문자 (밑줄은 FTS5 토크나이저가 구분자로 보므로 제외)
+WORD_PATTERN = re.compile(r"[^\W_]+")
+
+# PostgreSQL 텍스트 검색 설정 (2-gram을 그대로 토큰으로 사용)
+TS_CONFIG = "'simple'::regconfig"
+
+BACKFILL_BATCH_SIZE = 1000
+
+def word_bigrams(word: str) -> List[str]:
+    """단어를 두 글자씩 겹쳐 자른 토큰 목록 (한 글자 단어는 그대로)"""
+    if len(word) < 2:
+        return [word]
+    return [word[i:i + 2] for i in range(len(word) - 1)]
+
+def search_text(*fields) -> str:
+    """검색 인덱스에 넣을 2-gram 토큰 문자열 (필드 경계를 넘는 토큰은 만들지 않음)
+
+    한 글자 검색어가 단어 끝 글자("도로교통법"의 "법")와도 맞도록 단어마다 끝 글자를 토큰으로 덧붙입니다.
+    """
+    tokens = []
+    for field in fields:
+        for word in WORD_PATTERN.findall((field or "").lower()):
+            tokens.extend(word_bigrams(word))
+            if len(word) > 1:
+                tokens.append(word[-1])
+    return " ".join(tokens)
+
+def query_words(keyword: str) -> List[List[str]]:
+    """검색어를 단어별 2-gram 목록으로 변환 (중복 단어 제거)"""
+    words = []
+    for word in dict.fromkeys(WORD_PATTERN.findall(keyword.lower())):
+        words.append(word_bigrams(word))
+    return words
+
+def fts5_query(keyword: str) -> str:
+    """SQLite FTS5 MATCH 구문 - 단어마다 연속된 2-gram 구(phrase), 한 글자 단어는 접두어 검색"""
+    terms = []
+    for grams in query_words(keyword):
+        phrase = '"' + " ".join(grams) + '"'
+        terms.append(phrase + "*" if len(grams[0]) == 1 else phrase)
+    return " ".join(terms)
+
+def tsquery(keyword: str) -> str:
+    """PostgreSQL to_tsquery 구문 - 단어마다 연속된 2-gram(<->), 한 글자 단어는 접두어 검색"""
+    terms = []
+    for grams in query_words(keyword):
+        if len(grams[0]) == 1:
+            terms.append(f"{grams[0]}:*")
+        else:
+            terms.append("(" + " <-> ".join(grams) + ")")
+    return " & ".join(terms)
+
+def fts_table_name(table_name: str) -> str:
+    return f"{table_name}_fts"
+
+def backfill_search_text(conn, table):
+    """search_text가 비어 있는 기존 행의 검색 토큰 채우기"""
+    update = (
+        table.update()
+        .where(table.c.id == bindparam("row_id"))
+        .values(search_text=bindparam("tokens"))
+    )
+    while True:
+        rows = conn.execute(
+            select(table.c.id, table.c.title, table.c.committee, table.c.content)
+            .where(table.c.search_text.is_(None))
+            .limit(BACKFILL_BATCH_SIZE)
+        ).all()
+        if not rows:
+            return
+        conn.execute(update, [
+            {"row_id": row.id, "tokens": search_text(row.title, row.committee, row.content)}
+            for row in rows
+        ])
+
+def create_sqlite_fts(conn, table_name: str):
+    """FTS5 외부 콘텐츠 테이블과 원본 테이블 동기화 트리거 생성 후 기존 행 색인"""
+    fts = fts_table_name(table_name)
+    conn.execute(text(
+        f"CREATE VIRTUAL TABLE {fts} USING fts5(search_text, content='{table_name}', content_rowid='id')"
+    ))
+    conn.execute(text(
+        f"CREATE TRIGGER {fts}_ai AFTER INSERT ON {table_name} BEGIN "
+        f"INSERT INTO {fts}(rowid, search_text) VALUES (new.id, new.search_text); END"
+    ))
+    conn.execute(text(
+        f"CREATE TRIGGER {fts}_ad AFTER DELETE ON {table_name} BEGIN "
+        f"INSERT INTO {fts}({fts}, rowid, search_text) VALUES ('delete', old.id, old.search_text); END"
+    ))
+    conn.execute(text(
+        f"CREATE TRIGGER {fts}_au AFTER UPDATE OF search_text ON {table_name} BEGIN "
+        f"INSERT INTO {fts}({fts}, rowid, search_text) VALUES ('delete', old.id, old.search_text); "
+        f"INSERT INTO {fts}(rowid, search_text) VALUES (new.id, new.search_text); END"
+    ))
+    conn.execute(text(f"INSERT INTO {fts}({fts}) VALUES ('rebuild')"))
+
+def ensure_search_index(engine, tables):
+    """검색 토큰을 채우고 DB별 전문 검색 인덱스 생성 (이미 있으면 건너뜀)"""
+    for table in tables:
+        with engine.begin() as conn:
+            backfill_search_text(conn, table)
+            if conn.dialect.name == "postgresql":
+                conn.execute(text(
+                    f"CREATE INDEX IF NOT EXISTS idx_{table.name}_search ON {table.name} "
+                    f"USING gin (to_tsvector({TS_CONFIG}, search_text))"
+                ))
+            elif conn.dialect.name == "sqlite":
+                if not inspect(conn).has_table(fts_table_name(table.name)):
+                    create_sqlite_fts(conn, table.name)
@@ -0,0 +1,251 @@
+from sqlalchemy import desc, select, tuple_
+from datetime import datetime
+from typing import List, Optional, Tuple
+import base64
+import json
+import os
+import logging
+
+from models.database import (
+    NationalLegislationDB, AdminLegislationDB, LegislationAllView, SOURCE_RANK, get_async_sessionmaker
+)
+from models.legislation_models import LegislationItem
+from services.database_service import (
+    SOURCE_MODELS, rank_search_results, search_statement, to_legislation_item, unkeyed_lookup_statement,
+    unkeyed_update_statement, upsert_rows, upsert_statement, union_view_enabled
+)
+
+logger = logging.getLogger(__name__)
+
+def encode_cursor(created_at: datetime, source: str, row_id: int) -> str:
+    """페이지 마지막 항목의 정렬 위치를 커서 문자열로 변환"""
+    payload = json.dumps([created_at.isoformat(), source, row_id])
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+def decode_cursor(cursor: str) -> Tuple[datetime, str, int]:
+    """커서 문자열을 (수집일시, 소스, ID)로 변환 (형식이 잘못되면 ValueError)"""
+    try:
+        payload = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        created_at, source, row_id = json.loads(payload)
+        if source not in SOURCE_MODELS:
+            raise ValueError(source)
+        return datetime.fromisoformat(created_at), source, int(row_id)
+    except Exception as e:
+        raise ValueError(f"잘못된 페이지 커서입니다: {cursor}") from e
+
+def encode_search_cursor(offset: int) -> str:
+    """검색 결과 다음 페이지 위치를 커서 문자열로 변환 (관련도 순이므로 건너뛸 건수를 기록)"""
+    return base64.urlsafe_b64encode(json.dumps(["search", offset]).encode()).decode().rstrip("=")
+
+def decode_search_cursor(cursor: str) -> int:
+    """검색 커서를 건너뛸 건수로 변환 (형식이 잘못되면 ValueError)"""
+    try:
+        kind, offset = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        if kind != "search" or int(offset) < 0:
+            raise ValueError(kind)
+        return int(offset)
+    except Exception as e:
+        raise ValueError(f"잘못된 페이지 커서입니다: {cursor}") from e
+
+def keyset_condition(model, source: str, position: Tuple[datetime, str, int]):
+    """커서 위치 다음 행만 남기는 조건 (인덱스 (created_at, id)를 그대로 따라 읽음)"""
+    created_at, cursor_source, row_id = position
+    if SOURCE_RANK[source] < SOURCE_RANK[cursor_source]:
+        return model.created_at <= created_at
+    if SOURCE_RANK[source] > SOURCE_RANK[cursor_source]:
+        return model.created_at < created_at
+    return tuple_(model.created_at, model.id) < tuple_(created_at, row_id)
+
+def filter_conditions(model, committee: Optional[str] = None, date_from: Optional[str] = None,
+                      date_to: Optional[str] = None) -> list:
+    """목록 필터 조건 (소관위원회 일치, 게시시작일 범위 YYYY-MM-DD)"""
+    conditions = [model.is_active == True]
+    if committee:
+        conditions.append(model.committee == committee)
+    if date_from:
+        conditions.append(model.start_date >= date_from)
+    if date_to:
+        conditions.append(model.start_date <= date_to)
+    return conditions
+
+def view_page_statement(limit: int, position: Optional[Tuple[datetime, str, int]] = None,
+                        committee: Optional[str] = None, date_from: Optional[str] = None,
+                        date_to: Optional[str] = None):
+    """통합 목록 뷰에서 두 소스를 한 번에 정렬해 커서 다음 limit + 1건을 읽는 구문"""
+    view = LegislationAllView.c
+    conditions = filter_conditions(view, committee, date_from, date_to)
+    if position:
+        created_at, source, row_id = position
+        conditions.append(
+            tuple_(view.created_at, view.source_rank, view.id) < tuple_(created_at, SOURCE_RANK[source], row_id)
+        )
+    return (
+        select(LegislationAllView)
+        .where(*conditions)
+        .order_by(desc(view.created_at), desc(view.source_rank), desc(view.id))
+        .limit(limit + 1)
+    )
+
+class AsyncDatabaseService:
+    """DatabaseService의 비동기 버전 (SQLAlchemy asyncio 엔진 - PostgreSQL: asyncpg, SQLite: aiosqlite)
+
+    API 요청 처리에서 사용하며, 쿼리를 기다리는 동안 이벤트 루프가 다른 요청을 처리합니다.
+    호출마다 연결 풀에서 세션을 빌려 쓰고 반납합니다.
+    """
+
+    def __init__(self):
+        self.session_factory = get_async_sessionmaker()
+        self.upsert_chunk_size = max(1, int(os.getenv("DB_UPSERT_CHUNK_SIZE", "500")))
+        # 두 소스를 합친 목록은 통합 뷰 한 번의 정렬 쿼리로 조회 (false이면 소스별로 조회 후 합침)
+        self.union_view = union_view_enabled()
+
+    async def save_national_legislation_data(self, items: List[LegislationItem]) -> int:
+        """입법부 입법예고 데이터를 데이터베이스에 저장 (의안번호 기준, 내용이 같으면 갱신 생략)"""
+        return await self._bulk_upsert(NationalLegislationDB, "bill_no", items, "입법부")
+
+    async def save_admin_legislation_data(self, items: List[LegislationItem]) -> int:
+        """행정부 입법예고 데이터를 데이터베이스에 저장 (공고 고유키 기준, 내용이 같으면 갱신 생략)"""
+        return await self._bulk_upsert(AdminLegislationDB, "notice_key", items, "행정부")
+
+    async def _bulk_upsert(self, model, key: str, items: List[LegislationItem], label: str) -> int:
+        """자연키 기준 INSERT ... ON CONFLICT DO UPDATE를 청크 단위로 실행"""
+        rows = upsert_rows(model, key, items)
+        async with self.session_factory() as session:
+            try:
+                stmt = upsert_statement(model, key, session.bind.dialect.name)
+                # 자연키가 없는 행은 상세 페이지 URL이 같은 기존 행을 직접 갱신
+                unkeyed = [row for row in rows if row[key] is None]
+                if unkeyed:
+                    existing = dict((await session.execute(unkeyed_lookup_statement(model, key, unkeyed))).all())
+                    for row in unkeyed:
+                        if row["link_url"] in existing:
+                            await session.execute(unkeyed_update_statement(model, existing[row["link_url"]], row))
+                    rows = [row for row in rows if row[key] is not None or row["link_url"] not in existing]
+
+                for offset in range(0, len(rows), self.upsert_chunk_size):
+                    await session.execute(stmt, rows[offset:offset + self.upsert_chunk_size])
+                await session.commit()
+                logger.info(f"{label} 데이터 {len(items)}건 저장 완료")
+                return len(items)
+            except Exception as e:
+                await session.rollback()
+                logger.error(f"{label} 데이터 저장 오류: {e}")
+                return 0
+
+    async def _fetch(self, model, source: str, limit: int) -> List[LegislationItem]:
+        async with self.session_factory() as session:
+            result = await session.execute(
+                select(model)
+                .where(model.is_active == True)
+                .order_by(desc(model.created_at))
+                .limit(limit)
+            )
+            return [to_legislation_item(row, source) for row in result.scalars()]
+
+    async def get_national_legislation_data(self, limit: int = 100) -> List[LegislationItem]:
+        """입법부 입법예고 데이터 조회"""
+        try:
+            result = await self._fetch(NationalLegislationDB, "national", limit)
+            logger.info(f"입법부 데이터 {len(result)}건 조회 완료")
+            return result
+        except Exception as e:
+            logger.error(f"입법부 데이터 조회 오류: {e}")
+            return []
+
+    async def get_admin_legislation_data(self, limit: int = 100) -> List[LegislationItem]:
+        """행정부 입법예고 데이터 조회"""
+        try:
+            result = await self._fetch(AdminLegislationDB, "admin", limit)
+            logger.info(f"행정부 데이터 {len(result)}건 조회 완료")
+            return result
+        except Exception as e:
+            logger.error(f"행정부 데이터 조회 오류: {e}")
+            return []
+
+    async def get_all_legislation_data(self, limit: int = 200) -> List[LegislationItem]:
+        """모든 입법예고 데이터 조회 (입법부 + 행정부, 수집일시 역순)"""
+        data, _ = await self.get_legislation_page(["national", "admin"], limit)
+        return data
+
+    async def get_legislation_page(self, sources: List[str], limit: int, cursor: Optional[str] = None,
+                                   committee: Optional[str] = None, date_from: Optional[str] = None,
+                                   date_to: Optional[str] = None) -> Tuple[List[LegislationItem], Optional[str]]:
+        """키셋 페이지 조회 - (항목 목록, 다음 페이지 커서)
+
+        커서 다음 limit + 1건만 읽으므로 뒤쪽 페이지도 첫 페이지와 같은 비용으로 조회합니다.
+        두 소스를 합칠 때는 통합 뷰에서 한 번에 정렬해 읽습니다.
+        커서 형식이 잘못되면 ValueError를 발생시킵니다.
+        """
+        position = decode_cursor(cursor) if cursor else None
+        try:
+            async with self.session_factory() as session:
+                if len(sources) > 1 and self.union_view:
+                    # 통합 뷰가 정렬해서 돌려주므로 그대로 사용
+                    result = await session.execute(
+                        view_page_statement(limit, position, committee, date_from, date_to)
+                    )
+                    rows = [(row, row.source) for row in result]
+                else:
+                    rows = []
+                    for source in sources:
+                        model = SOURCE_MODELS[source]
+                        conditions = filter_conditions(model, committee, date_from, date_to)
+                        if position:
+                            conditions.append(keyset_condition(model, source, position))
+                        result = await session.execute(
+                            select(model)
+                            .where(*conditions)
+                            .order_by(desc(model.created_at), desc(model.id))
+                            .limit(limit + 1)
+                        )
+                        rows.extend((row, source) for row in result.scalars())
+                    # 소스별 결과를 뷰와 같은 정렬 순서로 합침
+                    rows.sort(key=lambda pair: (pair[0].created_at, SOURCE_RANK[pair[1]], pair[0].id), reverse=True)
+
+            page = rows[:limit]
+            next_cursor = None
+            if len(rows) > limit:
+                last, last_source = page[-1]
+                next_cursor = encode_cursor(last.created_at, last_source, last.id)
+            return [to_legislation_item(row, source) for row, source in page], next_cursor
+        except Exception as e:
+            logger.error(f"목록 페이지 조회 오류: {e}")
+            return [], None
+
+    async def empty_sources(self, sources: List[str]) -> List[str]:
+        """활성 데이터가 한 건도 없는 소스 목록"""
+        empty = []
+        async with self.session_factory() as session:
+            for source in sources:
+                model = SOURCE_MODELS[source]
+                result = await session.execute(select(model.id).where(model.is_active == True).limit(1))
+                if result.first() is None:
+                    empty.append(source)
+        return empty
+
+    async def search_legislation(self, keyword: str, source: Optional[str] = None, limit: int = 50,
+                                 cursor: Optional[str] = None) -> Tuple[List[LegislationItem], Optional[str]]:
+        """입법예고 전문 검색 (관련도 높은 순) - (항목 목록, 다음 페이지 커서)
+
+        커서 형식이 잘못되면 ValueError를 발생시킵니다.
+        """
+        offset = decode_search_cursor(cursor) if cursor else 0
+        try:
+            sources = [source] if source in SOURCE_MODELS else list(SOURCE_MODELS)
+            scored = []
+            async with self.session_factory() as session:
+                dialect = session.bind.dialect.name
+                for model_source in sources:
+                    stmt = search_statement(SOURCE_MODELS[model_source], dialect, keyword, offset + limit + 1)
+                    if stmt is None:
+                        return [], None
+                    result = await session.execute(stmt)
+                    scored.extend((row, score, model_source) for row, score in result)
+
+            ranked = rank_search_results(scored)
+            page = ranked[offset:offset + limit]
+            next_cursor = encode_search_cursor(offset + limit) if len(ranked) > offset + limit else None
+            return [to_legislation_item(row, model_source) for row, _, model_source in page], next_cursor
+        except Exception as e:
+            logger.error(f"검색 오류: {e}")
+            return [], None
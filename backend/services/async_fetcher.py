@@ -0,0 +1,272 @@
+import asyncio
+import functools
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional
+from urllib.parse import urlparse
+import logging
+
+import requests
+
+logger = logging.getLogger(__name__)
+
+# 재시도할 HTTP 상태 코드 (요청 과다 / 일시적 서버 오류)
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
+class CircuitOpenError(Exception):
+    """호스트의 서킷이 열려 있어 요청을 보내지 않음 (retry_after: 다시 시도할 수 있을 때까지 남은 초)"""
+
+    def __init__(self, message: str, retry_after: float):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+class HostRateLimiter:
+    """호스트별 최소 요청 간격을 보장하는 비동기 레이트 리미터"""
+
+    def __init__(self, min_interval: float = 0.1):
+        self.min_interval = min_interval
+        self._next_slot: Dict[str, float] = {}
+
+    def interval_for(self, host: str) -> float:
+        """해당 호스트의 현재 요청 간격"""
+        return self.min_interval
+
+    async def wait(self, host: str):
+        """해당 호스트의 다음 요청 슬롯까지 대기"""
+        # 이벤트 루프 안에서는 await 전까지 원자적으로 실행되므로 별도 락이 필요 없음
+        now = time.monotonic()
+        slot = max(now, self._next_slot.get(host, 0.0))
+        self._next_slot[host] = slot + self.interval_for(host)
+
+        delay = slot - now
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+class AdaptiveRateLimiter(HostRateLimiter):
+    """응답 지연과 오류율에 따라 호스트별 요청 간격을 조절하는 레이트 리미터
+
+    - 빠르고 오류가 없으면 간격을 조금씩 줄임 (요청 속도 증가)
+    - 느리거나 오류율이 높으면 간격을 늘리고, 일시적 오류가 나면 1.5배로 늘림
+    """
+
+    def __init__(self, initial_interval: float = 0.1, min_interval: float = 0.05,
+                 max_interval: float = 5.0, target_latency: float = 2.0,
+                 max_error_rate: float = 0.1, smoothing: float = 0.2):
+        super().__init__(initial_interval)
+        self.initial_interval = initial_interval
+        self.floor = min(min_interval, initial_interval)
+        self.ceiling = max(max_interval, initial_interval)
+        self.target_latency = target_latency
+        self.max_error_rate = max_error_rate
+        self.smoothing = smoothing
+        self._intervals: Dict[str, float] = {}
+        self._latency: Dict[str, float] = {}
+        self._error_rate: Dict[str, float] = {}
+
+    def interval_for(self, host: str) -> float:
+        return self._intervals.get(host, self.initial_interval)
+
+    def _set_interval(self, host: str, interval: float):
+        self._intervals[host] = min(self.ceiling, max(self.floor, interval))
+
+    def _observe_error_rate(self, host: str, failed: bool) -> float:
+        rate = self._error_rate.get(host, 0.0)
+        rate += self.smoothing * ((1.0 if failed else 0.0) - rate)
+        self._error_rate[host] = rate
+        return rate
+
+    def record_success(self, host: str, latency: float):
+        """성공 응답의 지연 시간 반영"""
+        error_rate = self._observe_error_rate(host, False)
+        average = self._latency.get(host, latency)
+        average += self.smoothing * (latency - average)
+        self._latency[host] = average
+
+        interval = self.interval_for(host)
+        if average > self.target_latency or error_rate > self.max_error_rate:
+            self._set_interval(host, interval * 1.25)
+        else:
+            self._set_interval(host, interval * 0.9)
+
+    def record_failure(self, host: str):
+        """일시적 오류 반영 - 요청 간격을 1.5배로"""
+        self._observe_error_rate(host, True)
+        interval = self.interval_for(host)
+        self._set_interval(host, max(interval * 1.5, self.floor or 0.1))
+        logger.info(f"{host} 요청 간격 조정: {interval:.2f}s -> {self.interval_for(host):.2f}s")
+
+class CircuitBreaker:
+    """호스트별 서킷 브레이커 (연속 실패 시 일정 시간 요청 차단 후 한 건으로 복구 확인)"""
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._failures: Dict[str, int] = {}
+        self._opened_at: Dict[str, float] = {}
+        self._probing: Dict[str, bool] = {}
+
+    def before_request(self, host: str) -> bool:
+        """요청 가능 여부 확인 - 서킷이 열려 있으면 CircuitOpenError, 시험 요청이면 True"""
+        opened_at = self._opened_at.get(host)
+        if opened_at is None:
+            return False
+        remaining = self.reset_timeout - (time.monotonic() - opened_at)
+        if remaining > 0:
+            raise CircuitOpenError(f"{host} 서킷 열림 - 요청 차단", remaining)
+        if self._probing.get(host):
+            # 시험 요청 결과가 나오면 서킷이 닫히거나 다시 열리므로 차단 시간만큼 기다린 뒤 재확인
+            raise CircuitOpenError(f"{host} 서킷 복구 확인 중 - 요청 차단", self.reset_timeout)
+        # 차단 시간이 지나면 한 건만 시험 요청 (half-open)
+        self._probing[host] = True
+        return True
+
+    def release_probe(self, host: str):
+        """결과 없이 끝난 시험 요청(취소 등) 해제 - 다음 요청이 다시 시험 요청이 됨"""
+        self._probing.pop(host, None)
+
+    def record_success(self, host: str):
+        if host in self._opened_at:
+            logger.info(f"{host} 서킷 닫힘 - 요청 재개")
+        self._failures.pop(host, None)
+        self._opened_at.pop(host, None)
+        self._probing.pop(host, None)
+
+    def record_failure(self, host: str):
+        failures = self._failures.get(host, 0) + 1
+        self._failures[host] = failures
+        if self._probing.pop(host, False) or failures >= self.failure_threshold:
+            self._opened_at[host] = time.monotonic()
+            logger.warning(f"{host} 서킷 열림 - 연속 {failures}회 실패, {self.reset_timeout:.0f}초간 요청 차단")
+
+def is_retryable(error: Exception) -> bool:
+    """재시도할 일시적 오류인지 확인"""
+    if isinstance(error, (requests.ConnectionError, requests.Timeout)):
+        return True
+    if isinstance(error, requests.HTTPError) and error.response is not None:
+        return error.response.status_code in RETRYABLE_STATUS_CODES
+    return False
+
+def retry_after_seconds(error: Exception) -> Optional[float]:
+    """응답의 Retry-After 헤더(초) 조회"""
+    response = getattr(error, "response", None)
+    if response is None:
+        return None
+    try:
+        return float(response.headers.get("Retry-After"))
+    except (TypeError, ValueError):
+        return None
+
+class AsyncFetcher:
+    """requests 세션을 스레드에서 실행하는 비동기 페치 계층
+
+    동시성 제한 + 호스트별 적응형 속도 제한 + 일시적 오류 재시도(지수 백오프) + 서킷 브레이커
+    동시성 슬롯(max_concurrency)과 요청 스레드는 호스트마다 따로 두어, 여러 소스를 동시에 수집해도
+    느린 소스가 다른 소스의 I/O 예산을 잡아먹지 않습니다.
+    전체 동시 요청 수는 모든 호스트가 공유하는 max_total_concurrency로 한 번 더 제한합니다.
+    """
+
+    def __init__(self, session: requests.Session, max_concurrency: int = 8,
+                 per_host_interval: float = 0.1, timeout: int = 30,
+                 max_retries: int = 3, backoff_base: float = 0.5, backoff_max: float = 30.0,
+                 min_interval: float = 0.05, max_interval: float = 5.0,
+                 circuit_threshold: int = 5, circuit_reset: float = 30.0,
+                 max_total_concurrency: Optional[int] = None):
+        self.session = session
+        self.max_concurrency = max_concurrency
+        # 지정하지 않으면 두 소스(호스트)가 각자 슬롯을 다 쓸 수 있는 만큼
+        self.max_total_concurrency = max_total_concurrency or max_concurrency * 2
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.rate_limiter = AdaptiveRateLimiter(per_host_interval, min_interval, max_interval)
+        self.circuit_breaker = CircuitBreaker(circuit_threshold, circuit_reset)
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._total_semaphore: Optional[asyncio.Semaphore] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._executors: Dict[str, ThreadPoolExecutor] = {}
+
+    def _get_semaphore(self, host: str) -> asyncio.Semaphore:
+        """현재 이벤트 루프에 묶인 호스트별 세마포어 반환 (asyncio.run 호출마다 새 루프가 생성됨)"""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._semaphores = {}
+            self._total_semaphore = asyncio.Semaphore(self.max_total_concurrency)
+        if host not in self._semaphores:
+            self._semaphores[host] = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphores[host]
+
+    def _get_executor(self, host: str) -> ThreadPoolExecutor:
+        """호스트 전용 요청 스레드 풀 (기본 스레드 풀은 DB 저장 등 다른 작업이 사용)"""
+        if host not in self._executors:
+            self._executors[host] = ThreadPoolExecutor(
+                max_workers=self.max_concurrency, thread_name_prefix=f"fetch-{host}"
+            )
+        return self._executors[host]
+
+    def _backoff_delay(self, attempt: int, error: Exception) -> float:
+        """재시도 대기 시간 (full jitter 지수 백오프, Retry-After가 있으면 우선)"""
+        retry_after = retry_after_seconds(error)
+        if retry_after is not None:
+            return min(retry_after, self.backoff_max)
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+
+    async def fetch(self, url: str, params: Optional[Dict] = None) -> bytes:
+        """URL을 비동기로 가져와 응답 본문을 반환 (일시적 오류는 재시도)"""
+        host = urlparse(url).netloc
+
+        attempt = 0
+        while True:
+            try:
+                probe = self.circuit_breaker.before_request(host)
+            except CircuitOpenError as e:
+                # 서킷이 열려 있으면 바로 실패하지 않고 차단이 풀릴 때까지 대기 (재시도 횟수에 포함)
+                if attempt >= self.max_retries:
+                    raise
+                attempt += 1
+                logger.warning(f"{e} - 재시도 {attempt}/{self.max_retries} ({e.retry_after:.1f}초 후): {url}")
+                await asyncio.sleep(e.retry_after)
+                continue
+            try:
+                # 호스트 슬롯을 먼저 잡아 느린 호스트가 전체 슬롯을 모두 차지하지 못하게 함
+                async with self._get_semaphore(host), self._total_semaphore:
+                    await self.rate_limiter.wait(host)
+                    started = time.monotonic()
+                    response = await asyncio.get_running_loop().run_in_executor(
+                        self._get_executor(host),
+                        functools.partial(self.session.get, url, params=params, timeout=self.timeout)
+                    )
+                    response.raise_for_status()
+            except Exception as e:
+                if not is_retryable(e):
+                    # 404 등은 호스트 장애도 정상 응답도 아니므로 실패 횟수는 그대로 두고 시험 요청만 해제
+                    if probe:
+                        self.circuit_breaker.release_probe(host)
+                    raise
+                self.rate_limiter.record_failure(host)
+                self.circuit_breaker.record_failure(host)
+                if attempt >= self.max_retries:
+                    raise
+                delay = self._backoff_delay(attempt, e)
+                attempt += 1
+                logger.warning(f"일시적 오류로 재시도 {attempt}/{self.max_retries} ({delay:.1f}초 후): {url} - {e}")
+                # 대기 중에는 동시성 슬롯을 반납
+                await asyncio.sleep(delay)
+                continue
+            except BaseException:
+                # 취소된 시험 요청이 서킷을 half-open 상태로 영구히 묶어두지 않도록 해제
+                if probe:
+                    self.circuit_breaker.release_probe(host)
+                raise
+
+            self.rate_limiter.record_success(host, time.monotonic() - started)
+            self.circuit_breaker.record_success(host)
+            return response.content
+
+    def close(self):
+        """호스트별 요청 스레드 풀 종료"""
+        executors, self._executors = self._executors, {}
+        for executor in executors.values():
+            executor.shutdown(wait=True)
@@ -0,0 +1,130 @@
+import asyncio
+import os
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+import logging
+
+from services.legislation_service import LegislationService
+from services.database_service import DatabaseService
+
+logger = logging.getLogger(__name__)
+
+# 백필 시 목록 페이지 상한 (기간 전체를 한 번에 훑으며, 시작일 이전 게시일에서 조기 종료)
+BACKFILL_MAX_PAGES = 50
+
+def split_date_range(start_date: str, end_date: str) -> List[str]:
+    """시작일~종료일(포함)을 하루 단위 파티션(YYYY-MM-DD)으로 분할 (최근 날짜부터)"""
+    start = datetime.strptime(start_date, "%Y-%m-%d").date()
+    end = datetime.strptime(end_date, "%Y-%m-%d").date()
+    if start > end:
+        raise ValueError(f"시작일이 종료일보다 늦습니다: {start_date} ~ {end_date}")
+
+    days = (end - start).days
+    return [(end - timedelta(days=offset)).strftime("%Y-%m-%d") for offset in range(days + 1)]
+
+class BackfillService:
+    """날짜 범위를 일 단위 파티션으로 나눠 병렬 수집 후 데이터베이스에 적재
+
+    목록 페이지(입법부 API 포함)는 소스별로 기간 전체를 한 번만 훑어 게시시작일별로 나누고,
+    상세 페이지 수집과 저장만 파티션 단위로 진행합니다.
+    모든 파티션은 하나의 WebScraper를 공유하므로 호스트별 동시 요청 수(SCRAPER_MAX_CONCURRENCY),
+    전체 동시 요청 상한(SCRAPER_MAX_TOTAL_CONCURRENCY), 호스트별 속도 제한은 파티션 수와 관계없이
+    전체 백필에 대한 전역 예산으로 적용됩니다.
+    """
+
+    def __init__(self, legislation_service: LegislationService, database_service: DatabaseService,
+                 max_parallel_days: Optional[int] = None, parse_workers: Optional[int] = None):
+        if max_parallel_days is None:
+            max_parallel_days = int(os.getenv("BACKFILL_PARALLEL_DAYS", "4"))
+        if parse_workers is None:
+            parse_workers = int(os.getenv("BACKFILL_PARSE_WORKERS") or os.cpu_count() or 1)
+        self.legislation_service = legislation_service
+        self.database_service = database_service
+        self.max_parallel_days = max_parallel_days
+        self.parse_workers = parse_workers
+
+    async def run(self, start_date: str, end_date: str, sources=("national", "admin")) -> Dict[str, int]:
+        """날짜 범위 백필 실행 - 소스별 저장 건수 반환"""
+        partitions = split_date_range(start_date, end_date)
+        logger.info(f"백필 시작 - {start_date} ~ {end_date} ({len(partitions)}일, 소스: {', '.join(sources)})")
+
+        # 대량 수집이므로 파싱을 프로세스 풀로 넘겨 모든 코어 사용 (기존 풀 종료 대기는 스레드에서)
+        scraper = self.legislation_service.web_scraper
+        previous_workers = scraper.parse_workers
+        await asyncio.to_thread(scraper.set_parse_workers, self.parse_workers)
+
+        day_slots = asyncio.Semaphore(self.max_parallel_days)
+        saved_counts = {source: 0 for source in sources}
+
+        async def list_source(source: str):
+            """목록(입법부는 API 포함)을 기간 전체에 대해 한 번만 훑어 게시시작일별로 나눔"""
+            if source == "national":
+                links, api_data = await asyncio.gather(
+                    scraper.list_links_by_date(source, start_date, end_date, BACKFILL_MAX_PAGES),
+                    self.legislation_service.collect_api_range(start_date, end_date)
+                )
+            else:
+                links, api_data = await scraper.list_links_by_date(source, start_date, end_date, BACKFILL_MAX_PAGES), {}
+            await assign_undated(source, links)
+            return links, api_data
+
+        async def assign_undated(source: str, links: Dict[Optional[str], List[str]]):
+            """목록에서 게시일을 읽지 못한 URL은 상세 페이지의 게시시작일을 확인해 해당 파티션 하나에만 배정"""
+            undated = links.pop(None, [])
+
+            async def notice_date(url: str) -> Optional[str]:
+                try:
+                    content = await scraper.fetcher.fetch(url)
+                    # 아카이브 사용 시 파싱 결과가 기록되어 파티션 수집에서 다시 파싱하지 않음
+                    return (await scraper.extract_detail_page(source, content, url))[0]
+                except Exception as e:
+                    # 프론티어에 기록되지 않으므로 다음 백필에서 다시 확인
+                    logger.error(f"백필 {source} 게시일 확인 오류 ({url}): {e}")
+                    return None
+
+            dates = await asyncio.gather(*(notice_date(url) for url in undated))
+            for url, date in zip(undated, dates):
+                if date and start_date <= date <= end_date:
+                    links.setdefault(date, []).append(url)
+            if undated:
+                logger.info(f"백필 {source} 게시일 미표시 링크 {len(undated)}개 중 "
+                            f"{sum(1 for date in dates if date and start_date <= date <= end_date)}개 기간 내 배정")
+
+        async def run_partition(source: str, target_date: str):
+            links, api_data = listings[source]
+            urls = links.get(target_date, [])
+            frontier_entries = []
+            async with day_slots:
+                items = await self.legislation_service.get_legislation_from_links(
+                    source, target_date, urls, api_data.get(target_date), frontier_entries
+                )
+
+            if items:
+                # 저장은 호출마다 세션을 따로 쓰므로 파티션끼리 동시에 진행
+                if source == "national":
+                    saved = await asyncio.to_thread(self.database_service.save_national_legislation_data, items)
+                else:
+                    saved = await asyncio.to_thread(self.database_service.save_admin_legislation_data, items)
+                if not saved:
+                    # 저장 실패 - 프론티어에 기록하지 않아 다음 백필에서 다시 수집
+                    logger.error(f"백필 파티션 {source} {target_date} - 저장 실패")
+                    return
+                saved_counts[source] += saved
+                logger.info(f"백필 파티션 {source} {target_date} - {saved}건 저장")
+            else:
+                logger.info(f"백필 파티션 {source} {target_date} - 데이터 없음")
+
+            await scraper.record_frontier(source, frontier_entries)
+
+        try:
+            listings = dict(zip(sources, await asyncio.gather(*(list_source(source) for source in sources))))
+            await asyncio.gather(*(
+                run_partition(source, target_date)
+                for target_date in partitions
+                for source in sources
+            ))
+        finally:
+            await asyncio.to_thread(scraper.set_parse_workers, previous_workers)
+
+        logger.info(f"백필 완료 - {saved_counts}")
+        return saved_counts
@@ -0,0 +1,184 @@
+import asyncio
+import atexit
+import os
+import queue
+import threading
+from contextlib import contextmanager
+from typing import Dict, List, Optional
+import logging
+
+from selenium import webdriver
+from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from webdriver_manager.chrome import ChromeDriverManager
+
+logger = logging.getLogger(__name__)
+
+# ChromeDriver 경로 (프로세스당 한 번만 확인/다운로드)
+_driver_path: Optional[str] = None
+_driver_path_lock = threading.Lock()
+
+def get_driver_path() -> str:
+    """ChromeDriver 실행 파일 경로 (CHROMEDRIVER_PATH 또는 webdriver-manager 결과 캐시)"""
+    global _driver_path
+    with _driver_path_lock:
+        if _driver_path is None:
+            _driver_path = os.getenv("CHROMEDRIVER_PATH") or ChromeDriverManager().install()
+        return _driver_path
+
+def create_driver() -> webdriver.Chrome:
+    """헤드리스 Chrome 드라이버 생성"""
+    options = webdriver.ChromeOptions()
+    options.add_argument('--no-sandbox')
+    options.add_argument('--disable-dev-shm-usage')
+    options.add_argument('--headless')
+    options.add_argument('--disable-gpu')
+    options.add_argument('--disable-extensions')
+    options.add_argument('--disable-infobars')
+    # DOM이 준비되면 바로 반환 (탭 이동을 기다리지 않고 병렬 로딩)
+    options.page_load_strategy = 'eager'
+
+    return webdriver.Chrome(service=Service(get_driver_path()), options=options)
+
+class BrowserPool:
+    """미리 띄워 둔 헤드리스 Chrome을 재사용하는 브라우저 풀
+
+    상세 페이지는 클릭/뒤로가기 대신 URL로 바로 이동하고, 드라이버마다 여러 탭을 동시에 열어
+    고정 sleep 없이 지정한 요소가 나타날 때까지만 기다립니다.
+    """
+
+    def __init__(self, size: Optional[int] = None, tabs_per_driver: Optional[int] = None,
+                 page_timeout: float = 10):
+        if size is None:
+            size = int(os.getenv("BROWSER_POOL_SIZE", "2"))
+        if tabs_per_driver is None:
+            tabs_per_driver = int(os.getenv("BROWSER_TABS_PER_DRIVER", "4"))
+        self.size = max(1, size)
+        self.tabs_per_driver = max(1, tabs_per_driver)
+        self.page_timeout = page_timeout
+        self._idle: "queue.Queue[webdriver.Chrome]" = queue.Queue()
+        self._created = 0
+        self._lock = threading.Lock()
+        self._drivers: List[webdriver.Chrome] = []
+        atexit.register(self.close)
+
+    @contextmanager
+    def acquire(self):
+        """유휴 드라이버를 빌려 사용 (없으면 최대 크기까지 새로 생성, 문제 생긴 드라이버는 폐기)"""
+        driver = None
+        with self._lock:
+            if self._idle.empty() and self._created < self.size:
+                self._created += 1
+                create = True
+            else:
+                create = False
+
+        if create:
+            try:
+                driver = create_driver()
+            except Exception:
+                with self._lock:
+                    self._created -= 1
+                raise
+            with self._lock:
+                self._drivers.append(driver)
+            logger.info(f"브라우저 풀 드라이버 생성 ({self._created}/{self.size})")
+        else:
+            driver = self._idle.get()
+
+        healthy = True
+        try:
+            yield driver
+        except Exception:
+            healthy = self._is_alive(driver)
+            raise
+        finally:
+            if healthy:
+                self._idle.put(driver)
+            else:
+                self._discard(driver)
+
+    def _is_alive(self, driver) -> bool:
+        try:
+            driver.current_window_handle
+            return True
+        except Exception:
+            return False
+
+    def _discard(self, driver):
+        with self._lock:
+            self._created -= 1
+            if driver in self._drivers:
+                self._drivers.remove(driver)
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+    def _wait_ready(self, driver, ready_selector: str):
+        WebDriverWait(driver, self.page_timeout).until(
+            EC.presence_of_element_located((By.CSS_SELECTOR, ready_selector))
+        )
+
+    def _render_tabs(self, urls: List[str], ready_selector: str) -> Dict[str, Optional[str]]:
+        """드라이버 하나에서 URL마다 탭을 열어 동시에 로딩한 뒤 HTML 수집"""
+        pages: Dict[str, Optional[str]] = {}
+        with self.acquire() as driver:
+            main_handle = driver.current_window_handle
+            tabs = []
+            for url in urls:
+                driver.switch_to.new_window('tab')
+                # 로딩 완료를 기다리지 않고 이동만 시작
+                driver.execute_script("window.location.href = arguments[0];", url)
+                tabs.append((driver.current_window_handle, url))
+
+            for handle, url in tabs:
+                driver.switch_to.window(handle)
+                try:
+                    self._wait_ready(driver, ready_selector)
+                    pages[url] = driver.page_source
+                except Exception as e:
+                    logger.error(f"브라우저 페이지 로딩 실패 ({url}): {e}")
+                    pages[url] = None
+                finally:
+                    driver.close()
+
+            driver.switch_to.window(main_handle)
+        return pages
+
+    def _render(self, url: str, ready_selector: str) -> str:
+        with self.acquire() as driver:
+            driver.get(url)
+            self._wait_ready(driver, ready_selector)
+            return driver.page_source
+
+    async def render(self, url: str, ready_selector: str) -> str:
+        """페이지를 열어 지정 요소가 나타나면 HTML 반환"""
+        return await asyncio.to_thread(self._render, url, ready_selector)
+
+    async def render_many(self, urls: List[str], ready_selector: str) -> Dict[str, Optional[str]]:
+        """여러 페이지를 드라이버/탭에 나눠 동시에 렌더링 - {URL: HTML (실패 시 None)}"""
+        chunks = [urls[i:i + self.tabs_per_driver] for i in range(0, len(urls), self.tabs_per_driver)]
+        results = await asyncio.gather(*(
+            asyncio.to_thread(self._render_tabs, chunk, ready_selector) for chunk in chunks
+        ))
+
+        pages: Dict[str, Optional[str]] = {}
+        for result in results:
+            pages.update(result)
+        return pages
+
+    def close(self):
+        """모든 드라이버 종료"""
+        with self._lock:
+            drivers, self._drivers = self._drivers, []
+            self._created = 0
+        while not self._idle.empty():
+            self._idle.get_nowait()
+        for driver in drivers:
+            try:
+                driver.quit()
+            except Exception:
+                pass
@@ -0,0 +1,149 @@
+import hashlib
+import math
+import os
+import threading
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+import logging
+
+from models.database import CrawlFrontierDB, SessionLocal, engine
+
+logger = logging.getLogger(__name__)
+
+class BloomFilter:
+    """URL 멤버십 확인용 블룸 필터 (거짓 양성만 존재, 거짓 음성 없음)"""
+
+    def __init__(self, expected_items: int = 100000, false_positive_rate: float = 0.01):
+        self.size = max(8, int(-expected_items * math.log(false_positive_rate) / (math.log(2) ** 2)))
+        self.hash_count = max(1, round(self.size / expected_items * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, key: str):
+        digest = hashlib.blake2b(key.encode('utf-8'), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        return ((h1 + i * h2) % self.size for i in range(self.hash_count))
+
+    def add(self, key: str):
+        for position in self._positions(key):
+            self.bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, key: str) -> bool:
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self._positions(key))
+
+class CrawlFrontier:
+    """이미 처리한 상세 페이지를 기록해 새 URL과 재확인 대상만 수집하도록 하는 프론티어
+
+    블룸 필터로 처음 보는 URL을 DB 조회 없이 걸러내고,
+    블룸 필터에 있는 URL만 crawl_frontier 테이블에서 상태를 확인합니다.
+    """
+
+    def __init__(self, recheck_interval: Optional[timedelta] = None, expected_items: int = 100000):
+        if recheck_interval is None:
+            recheck_interval = timedelta(hours=float(os.getenv("CRAWL_RECHECK_HOURS", "24")))
+        self.recheck_interval = recheck_interval
+        self.expected_items = expected_items
+        self.bloom: Optional[BloomFilter] = None
+        # 여러 날짜 파티션이 동시에 기록할 때 같은 URL 중복 삽입 방지
+        self._record_lock = threading.Lock()
+
+    def _load(self):
+        """테이블의 URL로 블룸 필터 구성 (최초 사용 시 한 번)"""
+        if self.bloom is not None:
+            return
+
+        CrawlFrontierDB.__table__.create(bind=engine, checkfirst=True)
+        db = SessionLocal()
+        try:
+            urls = [url for (url,) in db.query(CrawlFrontierDB.url)]
+        finally:
+            db.close()
+
+        self.bloom = BloomFilter(max(self.expected_items, len(urls) * 2))
+        for url in urls:
+            self.bloom.add(url)
+        logger.info(f"크롤링 프론티어 로드 완료 - {len(urls)}개 URL")
+
+    def filter_due(self, urls: List[str], target_date: str) -> List[str]:
+        """수집이 필요한 URL만 반환 (입력 순서 유지)
+
+        - 처음 보는 URL
+        - 게시시작일이 대상 날짜이거나 확인되지 않았고 재확인 시점이 지난 URL
+        """
+        try:
+            self._load()
+
+            maybe_seen = [url for url in urls if url in self.bloom]
+            if not maybe_seen:
+                return list(urls)
+
+            db = SessionLocal()
+            try:
+                rows = {
+                    row.url: row
+                    for row in db.query(CrawlFrontierDB).filter(CrawlFrontierDB.url.in_(maybe_seen))
+                }
+            finally:
+                db.close()
+        except Exception as e:
+            # 프론티어를 사용할 수 없으면 전체 URL 수집
+            logger.error(f"크롤링 프론티어 조회 오류: {e}")
+            return list(urls)
+
+        now = datetime.utcnow()
+        due = []
+        for url in urls:
+            row = rows.get(url)
+            if row is None:
+                # 블룸 필터 거짓 양성 또는 새 URL
+                due.append(url)
+            elif row.notice_date not in (None, target_date):
+                # 게시시작일이 다른 공고는 대상 날짜와 일치할 수 없음
+                continue
+            elif row.next_check_at is None or row.next_check_at <= now:
+                due.append(url)
+
+        skipped = len(urls) - len(due)
+        if skipped:
+            logger.info(f"크롤링 프론티어 - {skipped}개 URL은 이미 처리되어 건너뜀")
+        return due
+
+    def record(self, source: str, entries: List[Dict]):
+        """처리한 URL 기록 (entries: url, notice_date, bill_no)"""
+        if not entries:
+            return
+
+        now = datetime.utcnow()
+        next_check_at = now + self.recheck_interval
+
+        with self._record_lock:
+            db = None
+            try:
+                self._load()
+                db = SessionLocal()
+                urls = [entry["url"] for entry in entries]
+                existing = {
+                    row.url: row
+                    for row in db.query(CrawlFrontierDB).filter(CrawlFrontierDB.url.in_(urls))
+                }
+
+                for entry in entries:
+                    row = existing.get(entry["url"])
+                    if row is None:
+                        row = CrawlFrontierDB(source=source, url=entry["url"], first_seen_at=now)
+                        db.add(row)
+                        existing[entry["url"]] = row
+                    row.notice_date = entry.get("notice_date") or row.notice_date
+                    row.bill_no = entry.get("bill_no") or row.bill_no
+                    row.last_fetched_at = now
+                    row.next_check_at = next_check_at
+                    self.bloom.add(entry["url"])
+
+                db.commit()
+            except Exception as e:
+                if db:
+                    db.rollback()
+                logger.error(f"크롤링 프론티어 기록 오류: {e}")
+            finally:
+                if db:
+                    db.close()
@@ -0,0 +1,178 @@
+import asyncio
+import os
+import uuid
+from collections import OrderedDict
+from datetime import datetime
+from typing import Dict, Optional
+import logging
+
+from services.legislation_service import LegislationService
+from services.database_service import DatabaseService
+from services.ingest_pipeline import IngestPipeline
+
+logger = logging.getLogger(__name__)
+
+JOB_SOURCES = ("national", "admin")
+
+class CrawlJob:
+    """백그라운드 수집 작업 상태"""
+
+    def __init__(self, kind: str):
+        self.id = uuid.uuid4().hex
+        self.kind = kind
+        self.status = "queued"
+        self.created_at = datetime.now()
+        self.started_at: Optional[datetime] = None
+        self.finished_at: Optional[datetime] = None
+        self.error: Optional[str] = None
+        # 소스별 진행 상태와 저장 건수 (배치가 저장될 때마다 갱신)
+        self.progress: Dict[str, Dict] = {
+            source: {"status": "queued", "saved": 0} for source in JOB_SOURCES
+        }
+        self._done = asyncio.Event()
+
+    @property
+    def finished(self) -> bool:
+        return self.status in ("succeeded", "failed")
+
+    async def wait(self):
+        """작업이 끝날 때까지 대기"""
+        await self._done.wait()
+
+    def to_dict(self) -> Dict:
+        national_count = self.progress["national"]["saved"]
+        admin_count = self.progress["admin"]["saved"]
+        return {
+            "job_id": self.id,
+            "kind": self.kind,
+            "status": self.status,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "progress": self.progress,
+            "national_count": national_count,
+            "admin_count": admin_count,
+            "total_count": national_count + admin_count,
+            "error": self.error,
+        }
+
+class CrawlJobQueue:
+    """수집 작업을 큐에 넣고 백그라운드 워커가 하나씩 처리하는 로컬 작업 큐
+
+    HTTP 요청은 작업을 등록하고 바로 반환하며, 진행 상황은 작업 ID로 조회합니다.
+    같은 종류의 작업이 이미 대기/실행 중이면 새로 만들지 않고 그 작업을 돌려줍니다.
+    """
+
+    def __init__(self, legislation_service: LegislationService, database_service: DatabaseService,
+                 max_history: Optional[int] = None):
+        if max_history is None:
+            max_history = int(os.getenv("CRAWL_JOB_HISTORY", "100"))
+        self.legislation_service = legislation_service
+        self.database_service = database_service
+        self.max_history = max(1, max_history)
+        self._jobs: "OrderedDict[str, CrawlJob]" = OrderedDict()
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+
+    def start(self):
+        """백그라운드 워커 시작 (이벤트 루프 안에서 호출)"""
+        if self._worker is None:
+            self._queue = asyncio.Queue()
+            self._worker = asyncio.create_task(self._work())
+            logger.info("수집 작업 워커 시작")
+
+    async def stop(self):
+        """백그라운드 워커 종료 (실행 중인 작업은 취소)"""
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+            logger.info("수집 작업 워커 종료")
+
+    def submit_refresh(self) -> CrawlJob:
+        """전체 새로고침 작업 등록 (두 소스 동시 수집 후 추가/갱신)"""
+        if self._queue is None:
+            raise RuntimeError("수집 작업 워커가 시작되지 않았습니다")
+
+        job = self.active_refresh()
+        if job:
+            logger.info(f"이미 대기/실행 중인 새로고침 작업 반환: {job.id}")
+            return job
+
+        job = CrawlJob("refresh")
+        self._jobs[job.id] = job
+        self._trim_history()
+        self._queue.put_nowait(job)
+        logger.info(f"새로고침 작업 등록: {job.id}")
+        return job
+
+    def active_refresh(self) -> Optional[CrawlJob]:
+        """대기/실행 중인 새로고침 작업 (없으면 None)"""
+        for job in self._jobs.values():
+            if job.kind == "refresh" and not job.finished:
+                return job
+        return None
+
+    def get(self, job_id: str) -> Optional[CrawlJob]:
+        """작업 조회 (보관 기간이 지났거나 없으면 None)"""
+        return self._jobs.get(job_id)
+
+    def _trim_history(self):
+        """끝난 작업부터 오래된 순으로 정리해 보관 개수 유지"""
+        for job_id in [job_id for job_id, job in self._jobs.items() if job.finished]:
+            if len(self._jobs) <= self.max_history:
+                break
+            del self._jobs[job_id]
+
+    async def _work(self):
+        while True:
+            job = await self._queue.get()
+            job.status = "running"
+            job.started_at = datetime.now()
+            try:
+                await self._run_refresh(job)
+                job.status = "succeeded"
+            except asyncio.CancelledError:
+                job.status = "failed"
+                job.error = "작업 워커 종료로 취소됨"
+                job.finished_at = datetime.now()
+                job._done.set()
+                raise
+            except Exception as e:
+                logger.error(f"수집 작업 오류 ({job.id}): {e}")
+                job.status = "failed"
+                job.error = str(e)
+            job.finished_at = datetime.now()
+            job._done.set()
+            logger.info(f"수집 작업 종료 ({job.id}): {job.status} - 총 {job.to_dict()['total_count']}건")
+
+    async def _run_refresh(self, job: CrawlJob):
+        """두 소스를 동시에 수집해 자연키 기준으로 추가/갱신 (기존 데이터와 프론티어 기록은 유지)"""
+        pipeline = IngestPipeline(self.legislation_service, self.database_service)
+
+        async def run_source(source: str, run):
+            progress = job.progress[source]
+            progress["status"] = "running"
+
+            def on_saved(count: int):
+                progress["saved"] += count
+
+            try:
+                await run(on_saved=on_saved)
+            except Exception:
+                progress["status"] = "failed"
+                raise
+            progress["status"] = "succeeded"
+
+        # 한쪽이 실패해도 다른 쪽 수집은 끝까지 진행한 뒤 작업을 실패로 기록
+        results = await asyncio.gather(
+            run_source("national", pipeline.run_national),
+            run_source("admin", pipeline.run_admin),
+            return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                raise result
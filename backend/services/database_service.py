@@ -1,117 +1,301 @@
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_, desc
-from typing import List, Optional
+from sqlalchemy import and_, or_, desc, select, update, func, column, literal, literal_column, table as sql_table, DateTime
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime, timedelta
-from models.database import NationalLegislationDB, AdminLegislationDB, get_db
-from models.legislation_models import LegislationItem
+from models.database import (
+    NationalLegislationDB, AdminLegislationDB, CrawlFrontierDB, LegislationAllView, SessionLocal, engine,
+    ARCHIVE_TABLES, ARCHIVE_PARTITIONED, ensure_archive_partitions
+)
+from models.legislation_models import LegislationItem, MISSING_BILL_NO
+from models.search_index import TS_CONFIG, fts5_query, fts_table_name, query_words, search_text, tsquery
+import functools
+import hashlib
+import json
+import os
+from contextvars import ContextVar
 import logging
 
 logger = logging.getLogger(__name__)
 
+SOURCE_MODELS = {"national": NationalLegislationDB, "admin": AdminLegislationDB}
+
+def union_view_enabled() -> bool:
+    """두 소스를 합친 목록을 통합 뷰(legislation_all) 한 번의 정렬 쿼리로 조회할지 여부"""
+    return os.getenv("DB_UNION_VIEW", "true").lower() == "true"
+
+# 일괄 저장(upsert)을 지원하는 DB별 INSERT 구문 (ON CONFLICT DO UPDATE)
+UPSERT_INSERTS = {
+    "postgresql": postgresql_insert,
+    "sqlite": sqlite_insert,
+}
+
+# 이미 있는 행일 때 갱신할 컬럼 (created_at은 최초 수집일시 유지)
+UPSERT_UPDATE_COLUMNS = (
+    "bill_no", "title", "committee", "proposer", "start_date", "end_date",
+    "content", "link_url", "content_hash", "search_text", "updated_at", "is_active",
+)
+
+def content_hash(row: Dict) -> str:
+    """저장 필드의 SHA-256 해시 (같으면 내용이 바뀌지 않은 것으로 보고 쓰기 생략)"""
+    payload = json.dumps(row, ensure_ascii=False, sort_keys=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+def legislation_row(model, item: LegislationItem, now: datetime) -> Dict:
+    """LegislationItem을 저장할 컬럼 값으로 변환"""
+    row = {
+        # 의안번호가 없는 상세 페이지끼리 한 행으로 합쳐지지 않도록 표시 값은 NULL로 저장
+        "bill_no": None if item.bill_no == MISSING_BILL_NO else item.bill_no,
+        "title": item.title,
+        "committee": item.committee,
+        "proposer": item.proposer,
+        "start_date": item.start_date,
+        "end_date": item.end_date,
+        "content": item.content,
+        "link_url": item.link_url,
+    }
+    row["content_hash"] = content_hash(row)
+    row["search_text"] = search_text(item.title, item.committee, item.content)
+    if model is AdminLegislationDB:
+        row["notice_key"] = item.notice_key
+    row.update(created_at=now, updated_at=now, is_active=True)
+    return row
+
+def upsert_rows(model, key: str, items: List[LegislationItem]) -> List[Dict]:
+    """일괄 저장할 행 목록 (한 문장 안에서 같은 키가 두 번 갱신되면 PostgreSQL이 거부하므로 마지막 항목만 사용)"""
+    now = datetime.utcnow()
+    keyed: Dict[str, Dict] = {}
+    unkeyed: Dict[str, Dict] = {}
+    for item in items:
+        row = legislation_row(model, item, now)
+        if row[key] is None:
+            # 자연키가 없는 행은 상세 페이지 URL로 구분
+            unkeyed[row["link_url"]] = row
+        else:
+            keyed[row[key]] = row
+    return list(keyed.values()) + list(unkeyed.values())
+
+def upsert_statement(model, key: str, dialect_name: str):
+    """자연키 기준 INSERT ... ON CONFLICT DO UPDATE 구문 (내용 해시가 같고 활성 상태인 행은 갱신 안 함)"""
+    table = model.__table__
+    stmt = UPSERT_INSERTS[dialect_name](model)
+    return stmt.on_conflict_do_update(
+        index_elements=[table.c[key]],
+        set_={column: stmt.excluded[column] for column in UPSERT_UPDATE_COLUMNS},
+        where=or_(
+            table.c.content_hash.is_(None),
+            table.c.content_hash != stmt.excluded.content_hash,
+            table.c.is_active.isnot(True)
+        )
+    )
+
+def unkeyed_lookup_statement(model, key: str, rows: List[Dict]):
+    """자연키가 없는 행과 상세 페이지 URL이 같은 기존 행의 (URL, ID) 조회 구문"""
+    return select(model.link_url, model.id).where(
+        model.__table__.c[key].is_(None),
+        model.link_url.in_([row["link_url"] for row in rows])
+    )
+
+def unkeyed_update_statement(model, row_id: int, row: Dict):
+    """자연키가 없는 기존 행 갱신 구문 (내용 해시가 같고 활성 상태이면 갱신 안 함)"""
+    return (
+        update(model)
+        .where(model.id == row_id)
+        .where(or_(model.content_hash.is_(None), model.content_hash != row["content_hash"], model.is_active.isnot(True)))
+        .values({column: row[column] for column in UPSERT_UPDATE_COLUMNS})
+    )
+
+def search_statement(model, dialect_name: str, keyword: str, limit: int):
+    """전문 검색 구문 - (행, 관련도 점수)를 관련도 높은 순으로 조회 (검색할 단어가 없으면 None)
+
+    PostgreSQL은 search_text의 tsvector GIN 인덱스, SQLite는 FTS5 테이블(bm25)을 사용하고
+    그 외 DB는 search_text LIKE 검색으로 대신합니다.
+    """
+    words = query_words(keyword)
+    if not words:
+        return None
+
+    if dialect_name == "sqlite":
+        fts_name = fts_table_name(model.__tablename__)
+        fts = sql_table(fts_name, column("rowid"))
+        # bm25는 관련도가 높을수록 작은 값이므로 부호를 바꿔 사용
+        score = (-func.bm25(literal_column(fts_name))).label("score")
+        stmt = (
+            select(model, score)
+            .join(fts, fts.c.rowid == model.id)
+            .where(literal_column(fts_name).op("MATCH")(fts5_query(keyword)))
+        )
+    elif dialect_name == "postgresql":
+        config = literal_column(TS_CONFIG)
+        document = func.to_tsvector(config, model.search_text)
+        query = func.to_tsquery(config, tsquery(keyword))
+        score = func.ts_rank(document, query).label("score")
+        stmt = select(model, score).where(document.op("@@")(query))
+    else:
+        score = literal_column("0").label("score")
+        stmt = select(model, score).where(*(model.search_text.contains(" ".join(grams)) for grams in words))
+
+    return (
+        stmt.where(model.is_active == True)
+        .order_by(desc(score), desc(model.created_at), desc(model.id))
+        .limit(limit)
+    )
+
+def rank_search_results(scored: List[Tuple]) -> List[Tuple]:
+    """소스별 검색 결과 (행, 점수, 소스)를 관련도 → 수집일시 → ID 순으로 합치기"""
+    return sorted(
+        scored,
+        key=lambda result: (result[1], result[0].created_at or datetime.min, result[0].id),
+        reverse=True
+    )
+
+def to_legislation_item(row, source: str) -> LegislationItem:
+    """DB 행을 LegislationItem으로 변환"""
+    return LegislationItem(
+        id=str(row.id),
+        bill_no=row.bill_no,
+        title=row.title,
+        committee=row.committee,
+        proposer=row.proposer,
+        start_date=row.start_date,
+        end_date=row.end_date,
+        content=row.content,
+        link_url=row.link_url,
+        notice_key=getattr(row, "notice_key", None),
+        source=source,
+        created_at=row.created_at.isoformat() if row.created_at else None
+    )
+
+# 현재 작업 단위의 세션 (스레드/태스크마다 따로 유지)
+_current_session: ContextVar[Optional[Session]] = ContextVar("database_session", default=None)
+
+def _unit_of_work(method):
+    """메서드 호출 하나를 작업 단위로 보고 연결 풀에서 세션을 빌려 실행한 뒤 반납"""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        # 작업 단위 안에서 다른 메서드를 부르면 같은 세션을 사용
+        if _current_session.get() is not None:
+            return method(self, *args, **kwargs)
+        session = SessionLocal()
+        token = _current_session.set(session)
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            _current_session.reset(token)
+            session.close()
+    return wrapper
+
 class DatabaseService:
+    """입법예고 데이터 저장/조회 서비스
+
+    세션을 하나 계속 들고 있지 않고 호출마다 연결 풀에서 세션을 빌려 쓰므로
+    여러 요청/스레드가 동시에 사용해도 안전합니다.
+    """
+
     def __init__(self):
-        self.db = next(get_db())
+        # 자연키 유니크 제약을 이용한 일괄 저장 (지원하지 않는 DB는 건별 저장)
+        dialect = engine.dialect.name
+        self.bulk_upsert = (
+            os.getenv("DB_BULK_UPSERT", "true").lower() == "true" and dialect in UPSERT_INSERTS
+        )
+        self.upsert_chunk_size = max(1, int(os.getenv("DB_UPSERT_CHUNK_SIZE", "500")))
+        self.union_view = union_view_enabled()
+    
+    @property
+    def db(self) -> Session:
+        """현재 작업 단위의 세션"""
+        session = _current_session.get()
+        if session is None:
+            raise RuntimeError("작업 단위 밖에서는 데이터베이스 세션을 사용할 수 없습니다")
+        return session
     
+    @_unit_of_work
     def save_national_legislation_data(self, items: List[LegislationItem]) -> int:
-        """입법부 입법예고 데이터를 데이터베이스에 저장"""
+        """입법부 입법예고 데이터를 데이터베이스에 저장 (의안번호 기준, 내용이 같으면 갱신 생략)"""
+        if self.bulk_upsert:
+            return self._bulk_upsert(NationalLegislationDB, "bill_no", items, "입법부")
+        return self._save_one_by_one(NationalLegislationDB, "bill_no", items, "입법부")
+    
+    @_unit_of_work
+    def save_admin_legislation_data(self, items: List[LegislationItem]) -> int:
+        """행정부 입법예고 데이터를 데이터베이스에 저장 (공고 고유키 기준, 내용이 같으면 갱신 생략)"""
+        if self.bulk_upsert:
+            return self._bulk_upsert(AdminLegislationDB, "notice_key", items, "행정부")
+        return self._save_one_by_one(AdminLegislationDB, "notice_key", items, "행정부")
+    
+    def _save_one_by_one(self, model, key: str, items: List[LegislationItem], label: str) -> int:
+        """건별 조회 후 추가/갱신 (일괄 저장을 지원하지 않는 DB용)"""
         try:
             saved_count = 0
+            unchanged_count = 0
             
             for item in items:
-                # 기존 데이터 확인 (의안번호로 중복 체크)
-                existing = self.db.query(NationalLegislationDB).filter(
-                    NationalLegislationDB.bill_no == item.bill_no
-                ).first()
+                row = legislation_row(model, item, datetime.utcnow())
+                # 기존 데이터 확인 (자연키로 중복 체크)
+                if row[key] is not None:
+                    existing = self.db.query(model).filter(getattr(model, key) == row[key]).first()
+                else:
+                    # 자연키가 없으면 상세 페이지 URL로 확인
+                    existing = self.db.query(model).filter(
+                        getattr(model, key).is_(None), model.link_url == row["link_url"]
+                    ).first()
                 
                 if existing:
-                    # 기존 데이터 업데이트
-                    existing.title = item.title
-                    existing.committee = item.committee
-                    existing.proposer = item.proposer
-                    existing.start_date = item.start_date
-                    existing.end_date = item.end_date
-                    existing.content = item.content
-                    existing.link_url = item.link_url
-                    existing.updated_at = datetime.utcnow()
-                    existing.is_active = True
+                    if existing.content_hash == row["content_hash"] and existing.is_active:
+                        # 내용이 같으면 쓰지 않음
+                        unchanged_count += 1
+                    else:
+                        # 기존 데이터 업데이트 (최초 수집일시 유지)
+                        for column in UPSERT_UPDATE_COLUMNS:
+                            setattr(existing, column, row[column])
                 else:
                     # 새 데이터 삽입
-                    new_item = NationalLegislationDB(
-                        bill_no=item.bill_no,
-                        title=item.title,
-                        committee=item.committee,
-                        proposer=item.proposer,
-                        start_date=item.start_date,
-                        end_date=item.end_date,
-                        content=item.content,
-                        link_url=item.link_url,
-                        created_at=datetime.utcnow(),
-                        updated_at=datetime.utcnow(),
-                        is_active=True
-                    )
-                    self.db.add(new_item)
+                    self.db.add(model(**row))
+                    # 같은 저장 안에서 같은 키가 다시 나오면 방금 추가한 행을 갱신하도록 반영
+                    self.db.flush()
                 
                 saved_count += 1
             
             self.db.commit()
-            logger.info(f"입법부 데이터 {saved_count}건 저장 완료")
+            logger.info(f"{label} 데이터 {saved_count}건 저장 완료 (변경 없음 {unchanged_count}건)")
             return saved_count
             
         except Exception as e:
             self.db.rollback()
-            logger.error(f"입법부 데이터 저장 오류: {e}")
+            logger.error(f"{label} 데이터 저장 오류: {e}")
             return 0
     
-    def save_admin_legislation_data(self, items: List[LegislationItem]) -> int:
-        """행정부 입법예고 데이터를 데이터베이스에 저장"""
+    def _bulk_upsert(self, model, key: str, items: List[LegislationItem], label: str) -> int:
+        """자연키 기준 INSERT ... ON CONFLICT DO UPDATE를 청크 단위로 실행 (청크당 한 번 왕복)
+        
+        내용 해시가 같고 활성 상태인 행은 갱신하지 않아 변경 없는 재수집은 쓰기가 발생하지 않음
+        """
+        rows = upsert_rows(model, key, items)
+        stmt = upsert_statement(model, key, self.db.get_bind().dialect.name)
         try:
-            saved_count = 0
-            
-            for item in items:
-                # 기존 데이터 확인 (의안번호로 중복 체크)
-                existing = self.db.query(AdminLegislationDB).filter(
-                    AdminLegislationDB.bill_no == item.bill_no
-                ).first()
-                
-                if existing:
-                    # 기존 데이터 업데이트
-                    existing.title = item.title
-                    existing.committee = item.committee
-                    existing.proposer = item.proposer
-                    existing.start_date = item.start_date
-                    existing.end_date = item.end_date
-                    existing.content = item.content
-                    existing.link_url = item.link_url
-                    existing.updated_at = datetime.utcnow()
-                    existing.is_active = True
-                else:
-                    # 새 데이터 삽입
-                    new_item = AdminLegislationDB(
-                        bill_no=item.bill_no,
-                        title=item.title,
-                        committee=item.committee,
-                        proposer=item.proposer,
-                        start_date=item.start_date,
-                        end_date=item.end_date,
-                        content=item.content,
-                        link_url=item.link_url,
-                        created_at=datetime.utcnow(),
-                        updated_at=datetime.utcnow(),
-                        is_active=True
-                    )
-                    self.db.add(new_item)
-                
-                saved_count += 1
-            
+            # 자연키가 없는 행은 ON CONFLICT로 찾을 수 없으므로 상세 페이지 URL이 같은 기존 행을 직접 갱신
+            unkeyed = [row for row in rows if row[key] is None]
+            if unkeyed:
+                existing = dict(self.db.execute(unkeyed_lookup_statement(model, key, unkeyed)).all())
+                for row in unkeyed:
+                    if row["link_url"] in existing:
+                        self.db.execute(unkeyed_update_statement(model, existing[row["link_url"]], row))
+                rows = [row for row in rows if row[key] is not None or row["link_url"] not in existing]
+
+            for offset in range(0, len(rows), self.upsert_chunk_size):
+                self.db.execute(stmt, rows[offset:offset + self.upsert_chunk_size])
+
             self.db.commit()
-            logger.info(f"행정부 데이터 {saved_count}건 저장 완료")
-            return saved_count
-            
+            logger.info(f"{label} 데이터 {len(items)}건 저장 완료")
+            return len(items)
+
         except Exception as e:
             self.db.rollback()
-            logger.error(f"행정부 데이터 저장 오류: {e}")
+            logger.error(f"{label} 데이터 저장 오류: {e}")
             return 0
-    
+
+    @_unit_of_work
     def get_national_legislation_data(self, limit: int = 100) -> List[LegislationItem]:
         """입법부 입법예고 데이터 조회"""
         try:
@@ -119,21 +303,7 @@ class DatabaseService:
                 NationalLegislationDB.is_active == True
             ).order_by(desc(NationalLegislationDB.created_at)).limit(limit).all()
             
-            result = []
-            for item in items:
-                result.append(LegislationItem(
-                    id=str(item.id),
-                    bill_no=item.bill_no,
-                    title=item.title,
-                    committee=item.committee,
-                    proposer=item.proposer,
-                    start_date=item.start_date,
-                    end_date=item.end_date,
-                    content=item.content,
-                    link_url=item.link_url,
-                    source='national',
-                    created_at=item.created_at.isoformat() if item.created_at else None
-                ))
+            result = [to_legislation_item(item, 'national') for item in items]
             
             logger.info(f"입법부 데이터 {len(result)}건 조회 완료")
             return result
@@ -142,6 +312,7 @@ class DatabaseService:
             logger.error(f"입법부 데이터 조회 오류: {e}")
             return []
     
+    @_unit_of_work
     def get_admin_legislation_data(self, limit: int = 100) -> List[LegislationItem]:
         """행정부 입법예고 데이터 조회"""
         try:
@@ -149,21 +320,7 @@ class DatabaseService:
                 AdminLegislationDB.is_active == True
             ).order_by(desc(AdminLegislationDB.created_at)).limit(limit).all()
             
-            result = []
-            for item in items:
-                result.append(LegislationItem(
-                    id=str(item.id),
-                    bill_no=item.bill_no,
-                    title=item.title,
-                    committee=item.committee,
-                    proposer=item.proposer,
-                    start_date=item.start_date,
-                    end_date=item.end_date,
-                    content=item.content,
-                    link_url=item.link_url,
-                    source='admin',
-                    created_at=item.created_at.isoformat() if item.created_at else None
-                ))
+            result = [to_legislation_item(item, 'admin') for item in items]
             
             logger.info(f"행정부 데이터 {len(result)}건 조회 완료")
             return result
@@ -172,9 +329,23 @@ class DatabaseService:
             logger.error(f"행정부 데이터 조회 오류: {e}")
             return []
     
+    @_unit_of_work
     def get_all_legislation_data(self, limit: int = 200) -> List[LegislationItem]:
-        """모든 입법예고 데이터 조회 (입법부 + 행정부)"""
+        """모든 입법예고 데이터 조회 (입법부 + 행정부, 수집일시 역순)"""
         try:
+            if self.union_view:
+                # 통합 뷰에서 한 번에 정렬해 조회
+                view = LegislationAllView.c
+                rows = self.db.execute(
+                    select(LegislationAllView)
+                    .where(view.is_active == True)
+                    .order_by(desc(view.created_at), desc(view.source_rank), desc(view.id))
+                    .limit(limit)
+                ).all()
+                all_data = [to_legislation_item(row, row.source) for row in rows]
+                logger.info(f"전체 데이터 {len(all_data)}건 조회 완료")
+                return all_data
+            
             national_data = self.get_national_legislation_data(limit // 2)
             admin_data = self.get_admin_legislation_data(limit // 2)
             
@@ -189,10 +360,13 @@ class DatabaseService:
             logger.error(f"전체 데이터 조회 오류: {e}")
             return []
     
-    def delete_national_legislation_data(self) -> int:
-        """입법부 데이터 삭제"""
+    @_unit_of_work
+    def delete_national_legislation_data(self, reset_frontier: bool = False) -> int:
+        """입법부 데이터 삭제 (reset_frontier이면 프론티어 기록도 지워 다음 수집 때 모든 상세 페이지를 다시 받음)"""
         try:
             deleted_count = self.db.query(NationalLegislationDB).delete()
+            if reset_frontier:
+                self.db.query(CrawlFrontierDB).filter(CrawlFrontierDB.source == 'national').delete()
             self.db.commit()
             logger.info(f"입법부 데이터 {deleted_count}건 삭제 완료")
             return deleted_count
@@ -201,10 +375,13 @@ class DatabaseService:
             logger.error(f"입법부 데이터 삭제 오류: {e}")
             return 0
     
-    def delete_admin_legislation_data(self) -> int:
-        """행정부 데이터 삭제"""
+    @_unit_of_work
+    def delete_admin_legislation_data(self, reset_frontier: bool = False) -> int:
+        """행정부 데이터 삭제 (reset_frontier이면 프론티어 기록도 지워 다음 수집 때 모든 상세 페이지를 다시 받음)"""
         try:
             deleted_count = self.db.query(AdminLegislationDB).delete()
+            if reset_frontier:
+                self.db.query(CrawlFrontierDB).filter(CrawlFrontierDB.source == 'admin').delete()
             self.db.commit()
             logger.info(f"행정부 데이터 {deleted_count}건 삭제 완료")
             return deleted_count
@@ -213,131 +390,99 @@ class DatabaseService:
             logger.error(f"행정부 데이터 삭제 오류: {e}")
             return 0
     
-    def search_legislation(self, keyword: str, source: Optional[str] = None) -> List[LegislationItem]:
-        """입법예고 검색"""
+    @_unit_of_work
+    def search_legislation(self, keyword: str, source: Optional[str] = None, limit: int = 100,
+                           offset: int = 0) -> List[LegislationItem]:
+        """입법예고 전문 검색 (관련도 높은 순)"""
         try:
-            if source == 'national':
-                return self._search_national_legislation(keyword)
-            elif source == 'admin':
-                return self._search_admin_legislation(keyword)
-            else:
-                # 전체 검색
-                national_results = self._search_national_legislation(keyword)
-                admin_results = self._search_admin_legislation(keyword)
-                all_results = national_results + admin_results
-                all_results.sort(key=lambda x: x.created_at or '', reverse=True)
-                return all_results
+            sources = [source] if source in SOURCE_MODELS else list(SOURCE_MODELS)
+            dialect = self.db.get_bind().dialect.name
+            scored = []
+            for model_source in sources:
+                stmt = search_statement(SOURCE_MODELS[model_source], dialect, keyword, offset + limit)
+                if stmt is None:
+                    return []
+                scored.extend((row, score, model_source) for row, score in self.db.execute(stmt))
+            
+            page = rank_search_results(scored)[offset:offset + limit]
+            return [to_legislation_item(row, model_source) for row, _, model_source in page]
                 
         except Exception as e:
             logger.error(f"검색 오류: {e}")
             return []
     
-    def _search_national_legislation(self, keyword: str) -> List[LegislationItem]:
-        """입법부 데이터 검색"""
-        try:
-            items = self.db.query(NationalLegislationDB).filter(
-                and_(
-                    NationalLegislationDB.is_active == True,
-                    or_(
-                        NationalLegislationDB.title.contains(keyword),
-                        NationalLegislationDB.committee.contains(keyword),
-                        NationalLegislationDB.content.contains(keyword)
-                    )
-                )
-            ).order_by(desc(NationalLegislationDB.created_at)).all()
-            
-            result = []
-            for item in items:
-                result.append(LegislationItem(
-                    id=str(item.id),
-                    bill_no=item.bill_no,
-                    title=item.title,
-                    committee=item.committee,
-                    proposer=item.proposer,
-                    start_date=item.start_date,
-                    end_date=item.end_date,
-                    content=item.content,
-                    link_url=item.link_url,
-                    source='national',
-                    created_at=item.created_at.isoformat() if item.created_at else None
-                ))
-            
-            return result
-        except Exception as e:
-            logger.error(f"입법부 검색 오류: {e}")
-            return []
-    
-    def _search_admin_legislation(self, keyword: str) -> List[LegislationItem]:
-        """행정부 데이터 검색"""
-        try:
-            items = self.db.query(AdminLegislationDB).filter(
-                and_(
-                    AdminLegislationDB.is_active == True,
-                    or_(
-                        AdminLegislationDB.title.contains(keyword),
-                        AdminLegislationDB.committee.contains(keyword),
-                        AdminLegislationDB.content.contains(keyword)
-                    )
-                )
-            ).order_by(desc(AdminLegislationDB.created_at)).all()
+    @_unit_of_work
+    def archive_old_data(self, days: Optional[int] = None, batch_size: Optional[int] = None) -> Dict[str, int]:
+        """게시종료일로부터 보관 기간이 지났거나 비활성화된 행을 보관 테이블로 이동 - 소스별 이동 건수
+        
+        수집일시가 아니라 게시종료일 기준이므로 아직 의견을 받는 입법예고는 옮기지 않습니다
+        (옮긴 뒤 재수집되면 원본 테이블에 다시 들어가 중복되므로). 게시종료일이 없는 행만 수집일시로 판단합니다.
+        배치마다 INSERT ... SELECT와 DELETE 두 문장으로 옮기고 커밋하므로 행을 객체로 읽어 오지 않습니다.
+        """
+        if days is None:
+            days = int(os.getenv("RETENTION_DAYS", "90"))
+        if batch_size is None:
+            batch_size = int(os.getenv("RETENTION_BATCH_SIZE", "1000"))
+        now = datetime.utcnow()
+        cutoff = now - timedelta(days=days)
+        cutoff_date = cutoff.strftime("%Y-%m-%d")
+        
+        moved_counts = {}
+        for source, model in SOURCE_MODELS.items():
+            table = model.__table__
+            archive = ARCHIVE_TABLES[table.name]
+            # 게시종료일은 YYYY-MM-DD 문자열이므로 문자열 비교로 판단
+            has_end_date = and_(table.c.end_date.isnot(None), table.c.end_date != "")
+            expired = or_(
+                table.c.is_active.isnot(True),
+                and_(has_end_date, table.c.end_date < cutoff_date),
+                and_(~has_end_date, table.c.created_at < cutoff)
+            )
+            # 보관 테이블 기본키/파티션 키이므로 수집일시가 없는 행은 수정일시(또는 이동 시각)로 채움
+            created_at = func.coalesce(table.c.created_at, table.c.updated_at, literal(now, DateTime))
+            columns = [created_at.label("created_at") if column.name == "created_at" else column
+                       for column in table.columns]
             
-            result = []
-            for item in items:
-                result.append(LegislationItem(
-                    id=str(item.id),
-                    bill_no=item.bill_no,
-                    title=item.title,
-                    committee=item.committee,
-                    proposer=item.proposer,
-                    start_date=item.start_date,
-                    end_date=item.end_date,
-                    content=item.content,
-                    link_url=item.link_url,
-                    source='admin',
-                    created_at=item.created_at.isoformat() if item.created_at else None
-                ))
+            moved = 0
+            try:
+                # 스케줄 작업에서 API 서버보다 먼저 실행되어도 동작하도록 보관 테이블이 없으면 생성
+                archive.create(self.db.connection(), checkfirst=True)
+                while True:
+                    batch = self.db.execute(
+                        select(table.c.id, created_at.label("created_at"))
+                        .where(expired)
+                        .order_by(table.c.id)
+                        .limit(batch_size)
+                    ).all()
+                    if not batch:
+                        break
+                    
+                    in_batch = table.c.id.in_([row.id for row in batch])
+                    if ARCHIVE_PARTITIONED:
+                        ensure_archive_partitions(
+                            self.db.connection(), archive,
+                            (row.created_at.replace(day=1, hour=0, minute=0, second=0, microsecond=0) for row in batch)
+                        )
+                    self.db.execute(archive.insert().from_select(
+                        [column.name for column in table.columns] + ["archived_at"],
+                        select(*columns, literal(now, DateTime)).where(in_batch)
+                    ))
+                    self.db.execute(table.delete().where(in_batch))
+                    self.db.commit()
+                    moved += len(batch)
+            except Exception as e:
+                self.db.rollback()
+                logger.error(f"{source} 데이터 보관 이동 오류: {e}")
             
-            return result
-        except Exception as e:
-            logger.error(f"행정부 검색 오류: {e}")
-            return []
+            moved_counts[source] = moved
+            logger.info(f"{source} 데이터 {moved}건 보관 테이블로 이동 (게시종료 후 {days}일 경과 또는 비활성)")
+        return moved_counts
     
-    def cleanup_old_data(self, days: int = 30):
-        """오래된 데이터 정리 (N일 이전 데이터 비활성화)"""
-        try:
-            cutoff_time = datetime.utcnow() - timedelta(days=days)
-            
-            # 입법부 데이터 정리
-            old_national = self.db.query(NationalLegislationDB).filter(
-                and_(
-                    NationalLegislationDB.is_active == True,
-                    NationalLegislationDB.created_at < cutoff_time
-                )
-            ).all()
-            
-            for item in old_national:
-                item.is_active = False
-                item.updated_at = datetime.utcnow()
-            
-            # 행정부 데이터 정리
-            old_admin = self.db.query(AdminLegislationDB).filter(
-                and_(
-                    AdminLegislationDB.is_active == True,
-                    AdminLegislationDB.created_at < cutoff_time
-                )
-            ).all()
-            
-            for item in old_admin:
-                item.is_active = False
-                item.updated_at = datetime.utcnow()
-            
-            self.db.commit()
-            logger.info(f"오래된 데이터 정리 완료 - 입법부: {len(old_national)}건, 행정부: {len(old_admin)}건")
-            
-        except Exception as e:
-            self.db.rollback()
-            logger.error(f"데이터 정리 오류: {e}")
+    @_unit_of_work
+    def cleanup_old_data(self, days: int = 30) -> Dict[str, int]:
+        """오래된 데이터 정리 (N일 이전 데이터를 보관 테이블로 이동)"""
+        return self.archive_old_data(days)
     
     def close(self):
-        """데이터베이스 연결 종료"""
-        self.db.close()
\ No newline at end of file
+        """데이터베이스 연결 종료 (세션은 작업 단위마다 반납되므로 남은 것이 없음)"""
+        pass
\ No newline at end of file
@@ -0,0 +1,244 @@
+import hashlib
+import re
+from datetime import datetime
+from typing import Callable, Dict, Iterable, List, Optional
+
+import soupsieve as sv
+from bs4 import BeautifulSoup, SoupStrainer
+
+from models.legislation_models import MISSING_BILL_NO
+
+class FieldRule:
+    """상세 페이지 필드 추출 규칙 (선택자 → 정규식 → 후처리)
+
+    - selectors: 앞에서부터 시도하는 CSS 선택자. 없으면 페이지 전체 텍스트를 대상으로 함
+    - finder: 선택자로 표현하기 어려운 경우 요소를 찾는 함수 (soup -> 요소, 선택자가 있으면 모두 실패했을 때만 사용)
+    - patterns: 앞에서부터 시도하는 정규식. group=None이면 모든 그룹을 튜플로 반환
+    - attr: 요소 텍스트 대신 읽을 속성 이름
+    - post: 추출 값 후처리 함수
+    """
+
+    def __init__(self, name: str, selectors: Iterable[str] = (), patterns: Iterable[str] = (),
+                 group: Optional[int] = 1, attr: Optional[str] = None,
+                 finder: Optional[Callable] = None, post: Optional[Callable] = None, default=None):
+        self.name = name
+        # 규칙 선언 시 한 번만 컴파일
+        self.selectors = [sv.compile(selector) for selector in selectors]
+        self.patterns = [re.compile(pattern) for pattern in patterns]
+        self.selector_sources = list(selectors)
+        self.group = group
+        self.attr = attr
+        self.finder = finder
+        self.post = post
+        self.default = default
+
+    def extract(self, document: "DocumentExtraction"):
+        """규칙을 적용해 필드 값 추출 (찾지 못하면 기본값)"""
+        if self.finder or self.selectors:
+            elem = None
+            for selector in self.selectors:
+                elem = selector.select_one(document.soup)
+                if elem is not None:
+                    break
+            if elem is None and self.finder:
+                elem = self.finder(document.soup)
+            if elem is None:
+                return self.default
+            text = elem.get(self.attr, '') if self.attr else elem.get_text(strip=True)
+        else:
+            text = document.page_text
+
+        if self.patterns:
+            match = None
+            for pattern in self.patterns:
+                match = pattern.search(text)
+                if match:
+                    break
+            if not match:
+                return self.default
+            value = match.groups() if self.group is None else match.group(self.group)
+        else:
+            value = text
+
+        return self.post(value) if self.post else value
+
+    def describe(self) -> str:
+        """규칙 내용을 문자열로 표현 (규칙 변경 감지용)"""
+        return repr((
+            self.name, self.selector_sources, [pattern.pattern for pattern in self.patterns],
+            self.group, self.attr, getattr(self.finder, "__name__", None),
+            getattr(self.post, "__name__", None), self.default,
+        ))
+
+class SourceRules:
+    """소스별 필드 규칙 묶음 (본문 영역 id + 필드 규칙 목록)"""
+
+    def __init__(self, name: str, content_root: str, fields: List[FieldRule]):
+        self.name = name
+        self.strainer = SoupStrainer(id=content_root)
+        self.fields = {rule.name: rule for rule in fields}
+        # 선택자/정규식이 바뀌면 달라지는 값 - 아카이브에 캐시된 파싱 결과 무효화에 사용
+        self.fingerprint = hashlib.sha1(
+            "\n".join([content_root] + [rule.describe() for rule in fields]).encode("utf-8")
+        ).hexdigest()[:16]
+
+    def bind(self, soup: BeautifulSoup) -> "DocumentExtraction":
+        """파싱된 문서에 규칙을 연결"""
+        return DocumentExtraction(self, soup)
+
+class DocumentExtraction:
+    """문서 하나에 대한 추출 상태 (필드별 결과와 페이지 텍스트를 한 번만 계산)"""
+
+    def __init__(self, rules: SourceRules, soup: BeautifulSoup):
+        self.rules = rules
+        self.soup = soup
+        self._page_text: Optional[str] = None
+        self._values: Dict = {}
+
+    @property
+    def page_text(self) -> str:
+        if self._page_text is None:
+            self._page_text = self.soup.get_text()
+        return self._page_text
+
+    def get(self, name: str):
+        """필드 값 조회 (최초 조회 시에만 추출)"""
+        if name not in self._values:
+            self._values[name] = self.rules.fields[name].extract(self)
+        return self._values[name]
+
+    def get_all(self) -> Dict:
+        """모든 필드 값 조회"""
+        return {name: self.get(name) for name in self.rules.fields}
+
+# ---------------------------------------------------------------------------
+# 후처리 함수
+# ---------------------------------------------------------------------------
+
+def clean_bill_title(title: str) -> str:
+    """"[의안번호] 제목(제안자)" 형태에서 제목만 남김"""
+    if "]" in title and "(" in title:
+        return title.split("]")[-1].split("(")[0].strip()
+    return title
+
+def strip_text(text: str) -> str:
+    return text.strip()
+
+def strip_phone_number(text: str) -> str:
+    """담당 부서 정보에서 전화번호 이후 제거"""
+    return text.split("전화번호")[0].strip()
+
+def extract_until_opinion(text: str) -> str:
+    """의견제출 이전까지 내용만 추출"""
+    cut_keywords = ["3. 의견제출", "의견제출", "※ 제출의견", "의견 제출"]
+    for key in cut_keywords:
+        if key in text:
+            return text.split(key)[0].strip()
+    return text.strip()
+
+def to_date_range(groups) -> tuple:
+    """(년, 월, 일, 년, 월, 일) 그룹을 (시작일, 종료일) date 튜플로 변환"""
+    start_date = datetime.strptime(f"{groups[0]}-{int(groups[1]):02d}-{int(groups[2]):02d}", "%Y-%m-%d").date()
+    end_date = datetime.strptime(f"{groups[3]}-{int(groups[4]):02d}-{int(groups[5]):02d}", "%Y-%m-%d").date()
+    return start_date, end_date
+
+def find_keyword_content_div(soup: BeautifulSoup):
+    """충분히 길고 입법 관련 키워드가 있는 첫 번째 div (standard 모드 호환용, fast 모드는 선택자 실패 시에만 사용)"""
+    for div in soup.select('div'):
+        div_text = div.get_text(strip=True)
+        if len(div_text) > 100 and any(keyword in div_text for keyword in ["법률안", "입법예고", "내용"]):
+            return div
+    return None
+
+# ---------------------------------------------------------------------------
+# 소스별 규칙 선언
+# ---------------------------------------------------------------------------
+
+NATIONAL_COMMON_FIELDS = [
+    FieldRule(
+        "title",
+        selectors=['h1, h2, h3, .title, .board-title, .legislation-heading h3'],
+        post=clean_bill_title,
+        default="(제목 없음)",
+    ),
+    FieldRule("bill_no", patterns=[r'의안번호[:\s]*(\d+)'], default=MISSING_BILL_NO),
+    FieldRule(
+        "proposer",
+        patterns=[r'제안자[:\s]*([^\n\r]+)', r'발의자[:\s]*([^\n\r]+)'],
+        post=strip_text,
+        default="(제안자 없음)",
+    ),
+    FieldRule(
+        "committee",
+        patterns=[r'소관위원회[:\s]*([^\n\r]+)', r'소관위[:\s]*([^\n\r]+)'],
+        post=strip_text,
+        default="(소관위 없음)",
+    ),
+    FieldRule(
+        "period",
+        patterns=[
+            r'입법\s*예고기간[:\s]*(\d{4}-\d{2}-\d{2})\s*~\s*(\d{4}-\d{2}-\d{2})',
+            r'게시기간[:\s]*(\d{4}-\d{2}-\d{2})\s*~\s*(\d{4}-\d{2}-\d{2})',
+        ],
+        group=None,
+    ),
+]
+
+ADMIN_FIELDS = [
+    FieldRule(
+        "period",
+        selectors=[
+            'ul.basic li:first-child, .basic li:first-child',
+            'li:-soup-contains("게시"), li:-soup-contains("기간")',
+        ],
+        patterns=[r"(\d{4})[.\- ]\s*(\d{1,2})[.\- ]\s*(\d{1,2})[.]?\s*~\s*(\d{4})[.\- ]\s*(\d{1,2})[.\- ]\s*(\d{1,2})"],
+        group=None,
+        post=to_date_range,
+    ),
+    FieldRule(
+        "title",
+        selectors=['#ogLmPpVo span, .title span, h1, h2, h3', 'p span, div span'],
+        default="제목 없음",
+    ),
+    FieldRule(
+        "committee",
+        selectors=[
+            'ul.basic li table tbody tr td, .basic li table td',
+            'table td:-soup-contains("부서"), table td:-soup-contains("과")',
+        ],
+        post=strip_phone_number,
+        default="소관위 없음",
+    ),
+    FieldRule(
+        "content",
+        selectors=['#ogLmPpVo > div:nth-child(7) > div'],
+        post=extract_until_opinion,
+        default="내용 없음",
+    ),
+    FieldRule(
+        "link_url",
+        selectors=['#ogLmPpVo > ul:nth-child(2) > a:nth-child(2)'],
+        attr='href',
+        post=strip_text,
+        default="링크 없음",
+    ),
+]
+
+# (소스, 파싱 모드)별 규칙 - 모듈 로드 시 한 번 컴파일됨
+SOURCE_RULES = {
+    ("national", "standard"): SourceRules("national", "content", NATIONAL_COMMON_FIELDS + [
+        FieldRule("content", finder=find_keyword_content_div, default="(내용 없음)"),
+    ]),
+    ("national", "fast"): SourceRules("national", "content", NATIONAL_COMMON_FIELDS + [
+        # 내용 영역을 선택자로 바로 찾고 (전체 div 순회 없음), 구조가 다를 때만 키워드 div 탐색
+        # (두 모드의 결과가 다르면 benchmarks/bench_parse.py가 실패하므로 선택자를 고칠 것)
+        FieldRule(
+            "content",
+            selectors=['#content > div.card-wrap > div:nth-child(1) > div', '#content div.card-wrap'],
+            finder=find_keyword_content_div,
+            default="(내용 없음)",
+        ),
+    ]),
+    ("admin", "standard"): SourceRules("admin", "ogLmPpVo", ADMIN_FIELDS),
+    ("admin", "fast"): SourceRules("admin", "ogLmPpVo", ADMIN_FIELDS),
+}
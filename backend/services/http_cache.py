@@ -0,0 +1,240 @@
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Optional
+from urllib.parse import parse_qsl, urlencode, urlparse
+import logging
+
+from requests import Response
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+logger = logging.getLogger(__name__)
+
+# URL 종류별 기본 TTL (초) - 목록은 자주 바뀌고 상세 페이지는 거의 바뀌지 않음
+DEFAULT_TTLS = {
+    "list": 10 * 60,
+    "detail": 24 * 60 * 60,
+}
+
+# 캐시 키와 녹화 파일에 남기지 않을 인증 쿼리 파라미터 (국회 Open API 인증키)
+CREDENTIAL_PARAMS = {"KEY"}
+REDACTED = "REDACTED"
+
+def redact_url(url: str) -> str:
+    """인증 쿼리 파라미터 값을 가린 URL (디스크에 저장하는 캐시 키/녹화 URL용)"""
+    parsed = urlparse(url)
+    params = parse_qsl(parsed.query, keep_blank_values=True)
+    if not any(name.upper() in CREDENTIAL_PARAMS for name, _ in params):
+        return url
+    query = urlencode([
+        (name, REDACTED if name.upper() in CREDENTIAL_PARAMS else value) for name, value in params
+    ])
+    return parsed._replace(query=query).geturl()
+
+def classify_url(url: str) -> str:
+    """URL을 캐시 TTL 분류(list/detail)로 구분"""
+    path = urlparse(url).path.rstrip('/')
+    # 목록 페이지와 Open API 응답은 새 공고가 계속 추가됨
+    if path.endswith('list.do') or path == '/gcom/ogLmPp' or path.startswith('/portal/openapi/'):
+        return "list"
+    return "detail"
+
+class HttpCache:
+    """ETag/Last-Modified와 본문을 저장하는 SQLite 기반 디스크 캐시 (LRU 용량 제한)"""
+
+    def __init__(self, path: str, max_bytes: int = 200 * 1024 * 1024, ttls: Optional[Dict[str, int]] = None):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.ttls = dict(DEFAULT_TTLS, **(ttls or {}))
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        # 스크래퍼가 여러 스레드에서 세션을 사용하므로 락으로 직렬화
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS http_cache (
+                url TEXT PRIMARY KEY,
+                url_class TEXT NOT NULL,
+                etag TEXT,
+                last_modified TEXT,
+                content_type TEXT,
+                body BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                stored_at REAL NOT NULL,
+                last_access REAL NOT NULL
+            )
+        """)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_http_cache_access ON http_cache (last_access)")
+        # 인증키가 그대로 키에 남은 이전 항목 제거 (Open API 응답은 list로 분류됨)
+        stale = [
+            (url,) for (url,) in self._conn.execute("SELECT url FROM http_cache WHERE url_class = 'list'").fetchall()
+            if redact_url(url) != url
+        ]
+        if stale:
+            self._conn.executemany("DELETE FROM http_cache WHERE url = ?", stale)
+            logger.info(f"인증키가 포함된 HTTP 캐시 항목 {len(stale)}건 제거")
+        self._conn.commit()
+
+    @classmethod
+    def from_env(cls) -> Optional["HttpCache"]:
+        """환경변수 설정으로 캐시 생성 (비활성화 시 None)"""
+        if os.getenv("SCRAPER_CACHE_ENABLED", "true").lower() != "true":
+            return None
+        return cls(
+            path=os.getenv("SCRAPER_CACHE_PATH", "./.scraper_cache/http_cache.sqlite3"),
+            max_bytes=int(os.getenv("SCRAPER_CACHE_MAX_MB", "200")) * 1024 * 1024,
+            ttls={
+                "list": int(os.getenv("SCRAPER_CACHE_LIST_TTL", str(DEFAULT_TTLS["list"]))),
+                "detail": int(os.getenv("SCRAPER_CACHE_DETAIL_TTL", str(DEFAULT_TTLS["detail"]))),
+            }
+        )
+
+    def get(self, url: str) -> Optional[Dict]:
+        """캐시 항목 조회 (LRU 접근 시각 갱신)"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT url_class, etag, last_modified, content_type, body, stored_at "
+                "FROM http_cache WHERE url = ?",
+                (url,)
+            ).fetchone()
+            if row is None:
+                return None
+            self._conn.execute(
+                "UPDATE http_cache SET last_access = ? WHERE url = ?", (time.time(), url)
+            )
+            self._conn.commit()
+
+        url_class, etag, last_modified, content_type, body, stored_at = row
+        return {
+            "url_class": url_class,
+            "etag": etag,
+            "last_modified": last_modified,
+            "content_type": content_type,
+            "body": body,
+            "stored_at": stored_at,
+        }
+
+    def is_fresh(self, entry: Dict) -> bool:
+        """TTL 이내의 항목인지 확인"""
+        ttl = self.ttls.get(entry["url_class"], 0)
+        return time.time() - entry["stored_at"] < ttl
+
+    def put(self, url: str, etag: Optional[str], last_modified: Optional[str],
+            content_type: Optional[str], body: bytes):
+        """응답 저장 후 용량 초과분을 LRU 순서로 제거"""
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO http_cache "
+                "(url, url_class, etag, last_modified, content_type, body, size, stored_at, last_access) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (url, classify_url(url), etag, last_modified, content_type, body, len(body), now, now)
+            )
+            self._evict()
+            self._conn.commit()
+
+    def refresh(self, url: str, etag: Optional[str], last_modified: Optional[str]):
+        """304 응답 시 저장 시각(TTL 기준)과 검증자만 갱신"""
+        with self._lock:
+            self._conn.execute(
+                "UPDATE http_cache SET stored_at = ?, "
+                "etag = COALESCE(?, etag), last_modified = COALESCE(?, last_modified) "
+                "WHERE url = ?",
+                (time.time(), etag, last_modified, url)
+            )
+            self._conn.commit()
+
+    def _evict(self):
+        """총 용량이 상한을 넘으면 가장 오래 접근하지 않은 항목부터 삭제"""
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM http_cache").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        evicted = []
+        for url, size in self._conn.execute("SELECT url, size FROM http_cache ORDER BY last_access"):
+            if total <= self.max_bytes:
+                break
+            evicted.append((url,))
+            total -= size
+
+        self._conn.executemany("DELETE FROM http_cache WHERE url = ?", evicted)
+        logger.info(f"HTTP 캐시 {len(evicted)}건 제거 (LRU)")
+
+    def close(self):
+        """캐시 연결 종료"""
+        with self._lock:
+            self._conn.close()
+
+class CachingHTTPAdapter(HTTPAdapter):
+    """조건부 요청(If-None-Match / If-Modified-Since)으로 변경분만 받는 requests 어댑터
+
+    캐시 키는 인증 파라미터(KEY)를 가린 URL을 사용해 API 인증키가 디스크에 남지 않게 합니다.
+    """
+
+    def __init__(self, cache: HttpCache, **kwargs):
+        self.cache = cache
+        super().__init__(**kwargs)
+
+    def send(self, request, **kwargs):
+        if request.method != 'GET':
+            return super().send(request, **kwargs)
+
+        cache_key = redact_url(request.url)
+        entry = self.cache.get(cache_key)
+        if entry and self.cache.is_fresh(entry):
+            return self._build_cached_response(request, entry)
+
+        if entry:
+            if entry["etag"]:
+                request.headers['If-None-Match'] = entry["etag"]
+            if entry["last_modified"]:
+                request.headers['If-Modified-Since'] = entry["last_modified"]
+
+        response = super().send(request, **kwargs)
+
+        if response.status_code == 304 and entry:
+            # 본문은 변경되지 않았으므로 캐시된 본문 재사용
+            self.cache.refresh(
+                cache_key,
+                response.headers.get('ETag'),
+                response.headers.get('Last-Modified')
+            )
+            response.close()
+            return self._build_cached_response(request, entry)
+
+        if response.status_code == 200:
+            self.cache.put(
+                cache_key,
+                response.headers.get('ETag'),
+                response.headers.get('Last-Modified'),
+                response.headers.get('Content-Type'),
+                response.content
+            )
+
+        return response
+
+    def _build_cached_response(self, request, entry: Dict) -> Response:
+        """캐시 항목으로 200 응답 객체 생성"""
+        response = Response()
+        response.status_code = 200
+        response.reason = 'OK'
+        response.url = request.url
+        response.request = request
+        response.connection = self
+        response.headers = CaseInsensitiveDict({'X-Cache': 'HIT'})
+        if entry["content_type"]:
+            response.headers['Content-Type'] = entry["content_type"]
+        response.encoding = get_encoding_from_headers(response.headers)
+        response._content = entry["body"]
+        response._content_consumed = True
+        return response
+
+    def close(self):
+        super().close()
+        self.cache.close()
@@ -0,0 +1,165 @@
+import hashlib
+import json
+import os
+import threading
+from datetime import datetime
+from typing import Dict, Optional
+from urllib.parse import urlparse
+import logging
+
+from requests import Response
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+from services.http_cache import classify_url, redact_url
+
+logger = logging.getLogger(__name__)
+
+# 호스트별 수집 소스
+SOURCE_HOSTS = {
+    "pal.assembly.go.kr": "national",
+    "opinion.lawmaking.go.kr": "admin",
+}
+
+def classify_source(url: str) -> Optional[str]:
+    """URL 호스트로 수집 소스(national/admin) 구분"""
+    return SOURCE_HOSTS.get(urlparse(url).netloc)
+
+class FixtureStore:
+    """녹화한 응답을 저장하는 디렉토리 (index.json + pages/*.html)
+
+    index.json 구조:
+        {"meta": {"target_date": ..., "recorded_at": ...},
+         "responses": {url: {"file", "source", "kind", "content_type"}}}
+
+    공유하는 디렉토리이므로 URL은 인증 파라미터(KEY)를 가린 형태로 저장/조회합니다.
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        self.index_path = os.path.join(directory, "index.json")
+        self._lock = threading.Lock()
+
+        if os.path.exists(self.index_path):
+            with open(self.index_path, encoding="utf-8") as f:
+                index = json.load(f)
+        else:
+            index = {}
+        self.meta: Dict = index.get("meta", {})
+        # 이전에 녹화한 인덱스에 인증키가 남아 있어도 가린 URL로 조회되도록 변환 (다음 저장 시 반영)
+        self.responses: Dict[str, Dict] = {
+            redact_url(url): entry for url, entry in index.get("responses", {}).items()
+        }
+
+    def path_for(self, entry: Dict) -> str:
+        return os.path.join(self.directory, entry["file"])
+
+    def load(self, url: str) -> Optional[Dict]:
+        """URL의 녹화 항목과 본문 조회 (없으면 None)"""
+        entry = self.responses.get(redact_url(url))
+        if entry is None:
+            return None
+        with open(self.path_for(entry), "rb") as f:
+            return dict(entry, body=f.read())
+
+    def save(self, url: str, content_type: Optional[str], body: bytes):
+        """응답 본문 저장 후 인덱스 갱신"""
+        url = redact_url(url)
+        entry = {
+            "file": os.path.join("pages", f"{hashlib.sha1(url.encode('utf-8')).hexdigest()}.html"),
+            "source": classify_source(url),
+            "kind": classify_url(url),
+            "content_type": content_type,
+        }
+        with self._lock:
+            os.makedirs(os.path.join(self.directory, "pages"), exist_ok=True)
+            with open(self.path_for(entry), "wb") as f:
+                f.write(body)
+            self.responses[url] = entry
+            self._write_index()
+
+    def set_meta(self, **meta):
+        with self._lock:
+            self.meta.update(meta)
+            self._write_index()
+
+    def _write_index(self):
+        os.makedirs(self.directory, exist_ok=True)
+        with open(self.index_path, "w", encoding="utf-8") as f:
+            json.dump({"meta": self.meta, "responses": self.responses}, f, ensure_ascii=False, indent=1)
+
+def build_response(request, status_code: int, body: bytes, content_type: Optional[str], adapter) -> Response:
+    """저장된 본문으로 requests 응답 객체 생성"""
+    response = Response()
+    response.status_code = status_code
+    response.reason = 'OK' if status_code == 200 else 'Not Found'
+    response.url = request.url
+    response.request = request
+    response.connection = adapter
+    response.headers = CaseInsensitiveDict({'X-Fixture': 'REPLAY'})
+    if content_type:
+        response.headers['Content-Type'] = content_type
+    response.encoding = get_encoding_from_headers(response.headers)
+    response._content = body
+    response._content_consumed = True
+    return response
+
+class RecordingAdapter(BaseAdapter):
+    """실제 응답을 그대로 돌려주면서 200 응답을 픽스처 디렉토리에 저장하는 어댑터"""
+
+    def __init__(self, store: FixtureStore, inner: BaseAdapter):
+        super().__init__()
+        self.store = store
+        self.inner = inner
+
+    def send(self, request, **kwargs):
+        response = self.inner.send(request, **kwargs)
+        if request.method == 'GET' and response.status_code == 200:
+            self.store.save(request.url, response.headers.get('Content-Type'), response.content)
+        return response
+
+    def close(self):
+        self.inner.close()
+
+class ReplayAdapter(BaseAdapter):
+    """녹화된 응답만으로 요청을 처리하는 오프라인 어댑터 (없는 URL은 404)"""
+
+    def __init__(self, store: FixtureStore):
+        super().__init__()
+        self.store = store
+        self.served = 0
+        self.missing = 0
+
+    def send(self, request, **kwargs):
+        entry = self.store.load(request.url)
+        if entry is None:
+            self.missing += 1
+            logger.warning(f"녹화되지 않은 요청: {redact_url(request.url)}")
+            return build_response(request, 404, b"", None, self)
+
+        self.served += 1
+        return build_response(request, 200, entry["body"], entry["content_type"], self)
+
+    def close(self):
+        pass
+
+def start_recording(session, directory: str, target_date: Optional[str] = None) -> FixtureStore:
+    """세션의 기존 어댑터를 감싸 응답 녹화 시작"""
+    store = FixtureStore(directory)
+    store.set_meta(target_date=target_date, recorded_at=datetime.now().isoformat(timespec="seconds"))
+    for prefix in ('https://', 'http://'):
+        session.mount(prefix, RecordingAdapter(store, session.get_adapter(prefix)))
+    logger.info(f"응답 녹화 시작 - {directory}")
+    return store
+
+def start_replay(session, directory: str) -> ReplayAdapter:
+    """세션이 네트워크 대신 녹화된 응답을 사용하도록 설정"""
+    store = FixtureStore(directory)
+    if not store.responses:
+        raise FileNotFoundError(f"녹화된 응답이 없습니다: {directory}")
+    adapter = ReplayAdapter(store)
+    for prefix in ('https://', 'http://'):
+        session.mount(prefix, adapter)
+    logger.info(f"녹화 응답 재생 - {directory} ({len(store.responses)}건)")
+    return adapter
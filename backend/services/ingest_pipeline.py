@@ -0,0 +1,222 @@
+import asyncio
+import os
+import time
+from contextlib import aclosing
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional
+import logging
+
+from models.legislation_models import LegislationItem
+from services.legislation_service import LegislationService
+from services.database_service import DatabaseService
+
+logger = logging.getLogger(__name__)
+
+# 큐 종료 표시
+_DONE = object()
+
+class IngestPipeline:
+    """목록 수집 → 상세 수집 → 파싱 → 정규화 → 배치 저장을 큐로 잇는 스트리밍 수집 파이프라인
+
+    단계 사이의 큐는 크기가 제한되어 있어 느린 단계(예: DB 저장)가 앞 단계를 자연스럽게 늦추고,
+    수집한 항목은 배치 단위로 바로 저장되므로 중간에 실패해도 저장된 데이터는 남습니다.
+    크롤링 프론티어에는 저장이 끝난 URL만 기록되어, 저장되지 못한 건은 다음 실행에서 다시 수집합니다.
+    """
+
+    def __init__(self, legislation_service: LegislationService, database_service: DatabaseService,
+                 batch_size: Optional[int] = None, queue_size: Optional[int] = None,
+                 flush_interval: Optional[float] = None):
+        if batch_size is None:
+            batch_size = int(os.getenv("INGEST_BATCH_SIZE", "50"))
+        if queue_size is None:
+            queue_size = int(os.getenv("INGEST_QUEUE_SIZE", "100"))
+        if flush_interval is None:
+            flush_interval = float(os.getenv("INGEST_FLUSH_SECONDS", "2"))
+        self.legislation_service = legislation_service
+        self.database_service = database_service
+        self.scraper = legislation_service.web_scraper
+        self.batch_size = batch_size
+        self.queue_size = queue_size
+        self.flush_interval = flush_interval
+
+    async def run_national(self, target_date: Optional[str] = None, max_pages: int = 10,
+                           on_saved: Optional[Callable[[int], None]] = None) -> int:
+        """입법부 데이터 스트리밍 수집 - 저장 건수 반환
+
+        API 데이터를 먼저 저장하고, 웹 수집 결과 중 API에 있는 의안번호는 정규화 단계에서 제외합니다.
+        on_saved는 배치가 저장될 때마다 저장 건수로 호출됩니다 (진행 상황 보고용).
+        """
+        if target_date is None:
+            target_date = (datetime.today() - timedelta(days=1)).strftime("%Y-%m-%d")
+
+        saved = 0
+        api_data = {}
+        try:
+            api_data = await self.legislation_service._collect_api_data(target_date)
+        except Exception as e:
+            logger.error(f"입법부 API 데이터 수집 오류: {e}")
+
+        if api_data:
+            api_items = self.legislation_service._combine_data_new(api_data, [])
+            api_saved = await asyncio.to_thread(self.database_service.save_national_legislation_data, api_items)
+            if on_saved and api_saved:
+                on_saved(api_saved)
+            saved += api_saved
+
+        def normalize(row: Dict) -> Optional[LegislationItem]:
+            if row["의안번호"] in api_data:
+                return None
+            return self.legislation_service._convert_national_row(row)
+
+        saved += await self._run("national", target_date, max_pages, None, normalize, on_saved)
+        return saved
+
+    async def run_admin(self, target_date: Optional[str] = None, max_pages: int = 5,
+                        include_closed: bool = False,
+                        on_saved: Optional[Callable[[int], None]] = None) -> int:
+        """행정부 데이터 스트리밍 수집 - 저장 건수 반환"""
+        today = datetime.today()
+        if target_date is None:
+            target_date = (today - timedelta(days=1)).strftime("%Y-%m-%d")
+        # 마감 여부 기준일 (include_closed이면 마감된 건도 포함)
+        today_date = None if include_closed else today.date()
+
+        return await self._run("admin", target_date, max_pages, today_date,
+                               self.legislation_service._convert_admin_row, on_saved)
+
+    async def _run(self, source: str, target_date: str, max_pages: int, today_date, normalize,
+                   on_saved: Optional[Callable[[int], None]] = None) -> int:
+        """단계별 작업을 실행하고 모든 큐가 비워질 때까지 대기"""
+        logger.info(f"{source} 스트리밍 수집 시작 - 대상 날짜: {target_date}")
+        started = time.monotonic()
+
+        fetch_workers = self.scraper.fetcher.max_concurrency
+        parse_workers = max(1, self.scraper.parse_workers)
+
+        url_queue = asyncio.Queue(self.queue_size)
+        page_queue = asyncio.Queue(self.queue_size)
+        item_queue = asyncio.Queue(self.queue_size)
+        write_queue = asyncio.Queue(self.queue_size)
+
+        async def list_stage():
+            """목록 페이지에서 수집할 상세 URL 추출"""
+            try:
+                async with aclosing(self.scraper.iter_list_pages(source, target_date, max_pages)) as pages:
+                    async for page, rows in pages:
+                        # 목록에 표시된 게시시작일이 대상 날짜가 아닌 행은 상세 페이지 요청 생략
+                        urls = [url for url, start_date in rows if start_date in (None, target_date)]
+                        urls = await self.scraper._filter_due_links(urls, target_date)
+                        logger.info(f"{source} 페이지 {page}에서 {len(urls)}개 상세 페이지 대기열 추가")
+                        for url in urls:
+                            await url_queue.put(url)
+            except Exception as e:
+                # 이미 대기열에 들어간 URL은 계속 처리
+                logger.error(f"{source} 목록 수집 중 오류: {e}")
+
+        async def fetch_stage():
+            """상세 페이지 원본 수집"""
+            while (url := await url_queue.get()) is not _DONE:
+                try:
+                    content = await self.scraper.fetcher.fetch(url)
+                except Exception as e:
+                    # 프론티어에 기록하지 않으므로 다음 실행에서 다시 수집
+                    logger.error(f"상세 페이지 수집 오류 ({url}): {e}")
+                    continue
+                await page_queue.put((url, content))
+
+        async def parse_stage():
+            """상세 페이지 파싱 (프로세스 풀 사용 시 워커에서 실행)"""
+            while (job := await page_queue.get()) is not _DONE:
+                url, content = job
+                try:
+                    notice_date, row = await self.scraper.parse_detail_page(
+                        source, content, url, target_date, today_date
+                    )
+                except Exception as e:
+                    logger.error(f"상세 페이지 파싱 오류 ({url}): {e}")
+                    continue
+                await item_queue.put((url, notice_date, row))
+
+        async def normalize_stage():
+            """파싱 결과를 LegislationItem으로 변환하고 프론티어 기록 정보를 붙임"""
+            while (job := await item_queue.get()) is not _DONE:
+                url, notice_date, row = job
+                try:
+                    item = normalize(row) if row else None
+                except Exception as e:
+                    # 프론티어에 기록하지 않으므로 다음 실행에서 다시 수집
+                    logger.error(f"상세 페이지 변환 오류 ({url}): {e}")
+                    continue
+                entry = {
+                    "url": url,
+                    "notice_date": notice_date,
+                    "bill_no": row.get("의안번호") if row else None
+                }
+                await write_queue.put((entry, item))
+
+        async def write_stage() -> int:
+            """배치 크기 또는 대기 시간 기준으로 모아서 저장"""
+            saved = 0
+            entries: List[Dict] = []
+            items: List[LegislationItem] = []
+            finished = False
+
+            while not finished:
+                deadline = time.monotonic() + self.flush_interval
+                while len(entries) < self.batch_size:
+                    try:
+                        job = await asyncio.wait_for(write_queue.get(), max(0, deadline - time.monotonic()))
+                    except asyncio.TimeoutError:
+                        break
+                    if job is _DONE:
+                        finished = True
+                        break
+                    entry, item = job
+                    entries.append(entry)
+                    if item:
+                        items.append(item)
+
+                if entries:
+                    batch_saved = await self._write_batch(source, entries, items)
+                    if on_saved and batch_saved:
+                        on_saved(batch_saved)
+                    saved += batch_saved
+                    entries, items = [], []
+            return saved
+
+        async def run_workers(worker, count: int, next_queue: Optional[asyncio.Queue], next_count: int):
+            """같은 단계 작업을 count개 실행하고, 끝나면 다음 단계에 종료 표시 전달"""
+            try:
+                await asyncio.gather(*(worker() for _ in range(count)))
+            finally:
+                if next_queue is not None:
+                    for _ in range(next_count):
+                        await next_queue.put(_DONE)
+
+        stages = [
+            run_workers(list_stage, 1, url_queue, fetch_workers),
+            run_workers(fetch_stage, fetch_workers, page_queue, parse_workers),
+            run_workers(parse_stage, parse_workers, item_queue, 1),
+            run_workers(normalize_stage, 1, write_queue, 1),
+        ]
+        # 각 단계는 오류를 기록하고 계속 진행하므로 종료 표시가 항상 끝까지 전달됨
+        _, saved = await asyncio.gather(asyncio.gather(*stages), write_stage())
+
+        logger.info(f"{source} 스트리밍 수집 완료 - {saved}건 저장 ({time.monotonic() - started:.1f}초)")
+        return saved
+
+    async def _write_batch(self, source: str, entries: List[Dict], items: List[LegislationItem]) -> int:
+        """배치 저장 후 저장에 성공한 경우에만 프론티어에 기록"""
+        saved = 0
+        if items:
+            if source == "national":
+                saved = await asyncio.to_thread(self.database_service.save_national_legislation_data, items)
+            else:
+                saved = await asyncio.to_thread(self.database_service.save_admin_legislation_data, items)
+            if not saved:
+                # 저장 실패 - 기록하지 않아 다음 실행에서 다시 수집
+                return 0
+
+        if self.scraper.frontier:
+            await asyncio.to_thread(self.scraper.frontier.record, source, entries)
+        return saved
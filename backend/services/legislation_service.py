@@ -1,37 +1,59 @@
 import asyncio
+import json
+import math
 import os
 from datetime import datetime, timedelta
-from typing import List
-import re
+from typing import Dict, List, Optional, Tuple
+import logging
 
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from webdriver_manager.chrome import ChromeDriverManager
 from oauth2client.service_account import ServiceAccountCredentials
 import gspread
 import requests
-import time
 
 from models.legislation_models import LegislationItem
-from services.web_scraper import WebScraper
+from services.web_scraper import WebScraper, LIST_PAGES
+from services.page_parsers import inspect_admin_detail_page, inspect_national_detail_page
+from services.browser_pool import BrowserPool
+from services.crawl_frontier import CrawlFrontier
+
+logger = logging.getLogger(__name__)
+
+# 국회 Open API 한 번에 요청할 수 있는 최대 건수
+API_PAGE_SIZE = 1000
+# 동시에 요청할 API 페이지 수
+API_PAGE_WAVE = 4
+# 실시간 수집의 상세 페이지 수집 방식 (requests: requests + BeautifulSoup / browser: 헤드리스 Chrome 풀)
+SCRAPER_BACKENDS = ("requests", "browser")
 
 class LegislationService:
     def __init__(self):
         self.api_key = os.getenv("ASSEMBLY_API_KEY", "자신의 국회입법예고 API KEY")
         self.base_url = "https://open.assembly.go.kr/portal/openapi/nknalejkafmvgzmpt"
-        self.web_scraper = WebScraper()
+        # 이미 처리한 상세 페이지는 재확인 시점 전까지 다시 수집하지 않음
+        frontier = CrawlFrontier() if os.getenv("CRAWL_FRONTIER_ENABLED", "true").lower() == "true" else None
+        self.web_scraper = WebScraper(frontier=frontier)
+        # 자바스크립트 렌더링이 필요할 때만 사용하는 브라우저 풀 (처음 사용할 때 생성)
+        self.browser_pool: Optional[BrowserPool] = None
+        self.scraper_backend = os.getenv("SCRAPER_BACKEND", "requests")
+        if self.scraper_backend not in SCRAPER_BACKENDS:
+            raise ValueError(f"지원하지 않는 수집 방식: {self.scraper_backend}")
         
-    async def get_national_legislation(self) -> List[LegislationItem]:
-        """입법부 입법예고 데이터를 수집합니다."""
+    async def get_national_legislation(self, target_date: Optional[str] = None, max_pages: int = 10,
+                                       frontier_entries: Optional[List[Dict]] = None) -> List[LegislationItem]:
+        """입법부 입법예고 데이터를 수집합니다. (기본 대상 날짜: 어제)
+
+        frontier_entries를 넘기면 처리한 상세 페이지가 모이며, 저장 후 web_scraper.record_frontier로 기록합니다.
+        (SCRAPER_BACKEND=browser이면 브라우저 풀로 수집하며 프론티어는 사용하지 않음)
+        """
         try:
-            # API 데이터 수집
-            api_data = await self._collect_api_data()
-            
-            # requests + BeautifulSoup로 크롤링 (더 빠르고 안정적)
-            web_data = self.web_scraper.get_national_legislation_data()
+            if self.scraper_backend == "browser":
+                collect_web = self._collect_selenium_data(target_date, max_pages)
+            else:
+                collect_web = self.web_scraper.get_national_legislation_data_async(
+                    target_date, max_pages=max_pages, frontier_entries=frontier_entries
+                )
+            # API 데이터와 웹 크롤링은 호스트가 달라 동시에 수집
+            api_data, web_data = await asyncio.gather(self._collect_api_data(target_date), collect_web)
             
             # 데이터 통합
             combined_data = self._combine_data_new(api_data, web_data)
@@ -41,11 +63,19 @@ class LegislationService:
             print(f"입법부 데이터 수집 오류: {e}")
             return []
     
-    async def get_admin_legislation(self) -> List[LegislationItem]:
-        """행정부 입법예고 데이터를 수집합니다."""
+    async def get_admin_legislation(self, target_date: Optional[str] = None, max_pages: int = 5,
+                                    include_closed: bool = False,
+                                    frontier_entries: Optional[List[Dict]] = None) -> List[LegislationItem]:
+        """행정부 입법예고 데이터를 수집합니다. (기본 대상 날짜: 어제, frontier_entries는 입법부와 동일)"""
         try:
+            if self.scraper_backend == "browser":
+                return await self._collect_admin_data(target_date, max_pages, include_closed)
+            
             # requests + BeautifulSoup로 크롤링 (더 빠르고 안정적)
-            web_data = self.web_scraper.get_admin_legislation_data()
+            web_data = await self.web_scraper.get_admin_legislation_data_async(
+                target_date, max_pages=max_pages, include_closed=include_closed,
+                frontier_entries=frontier_entries
+            )
             
             # 데이터를 LegislationItem으로 변환
             return self._convert_admin_data_to_items(web_data)
@@ -53,372 +83,207 @@ class LegislationService:
             print(f"행정부 데이터 수집 오류: {e}")
             return []
     
-    async def _collect_api_data(self) -> dict:
-        """API를 통해 입법부 데이터를 수집합니다."""
-        api_data = {}
-        page = 1
+    async def get_legislation_from_links(self, source: str, target_date: str, urls: List[str],
+                                         api_data: Optional[dict] = None,
+                                         frontier_entries: Optional[List[Dict]] = None) -> List[LegislationItem]:
+        """목록에서 미리 고른 상세 URL로 대상 날짜 데이터를 수집 (백필용, 마감된 건 포함)
         
-        # 어제 날짜 계산
-        today = datetime.today()
-        yesterday = today - timedelta(days=1)
-        yesterday_dash = yesterday.strftime("%Y-%m-%d")
+        입법부는 collect_api_range로 받아 둔 같은 날짜의 API 데이터(api_data)와 통합합니다.
+        """
+        web_data = await self.web_scraper.collect_detail_links(
+            source, urls, target_date, frontier_entries=frontier_entries
+        )
+        if source == "national":
+            return self._combine_data_new(api_data or {}, web_data)
+        return self._convert_admin_data_to_items(web_data)
+    
+    async def _collect_api_data(self, target_date: Optional[str] = None) -> dict:
+        """API를 통해 입법부 데이터를 수집합니다. (기본 대상 날짜: 어제)"""
+        # 대상 날짜 (지정하지 않으면 어제)
+        if target_date is None:
+            target_date = (datetime.today() - timedelta(days=1)).strftime("%Y-%m-%d")
+        
+        api_data = await self.collect_api_range(target_date, target_date)
+        return api_data.get(target_date, {})
+    
+    async def collect_api_range(self, start_date: str, end_date: str) -> Dict[str, dict]:
+        """API를 통해 기간 내 입법부 데이터를 게시시작일별로 수집 - {게시시작일: {의안번호: 데이터}}
+        
+        게시시작일(NOTI_ST_DT) 내림차순 응답을 가정해 페이지를 동시에 가져오다가
+        시작일 이전 행이 나오면 중단합니다. 정렬이 맞지 않으면 전체 페이지를 확인합니다.
+        """
+        api_data: Dict[str, dict] = {}
+        
+        try:
+            total_count, rows = await self._fetch_api_page(1)
+        except Exception as e:
+            logger.error(f"입법부 API 1페이지 요청 오류: {e}")
+            return api_data
+        
+        total_pages = math.ceil(total_count / API_PAGE_SIZE)
+        pages = [rows]
+        page = 2
+        
+        # 정렬이 확인되는 동안만 게시일 기준 조기 종료
+        ordered = True
+        last_date = None
         
         while True:
-            params = {
-                "KEY": self.api_key,
-                "Type": "json",
-                "pIndex": page,
-                "pSize": 100
-            }
+            for rows in pages:
+                dates = [bill.get("NOTI_ST_DT") or "" for bill in rows]
+                if ordered and (dates != sorted(dates, reverse=True) or (last_date is not None and dates and dates[0] > last_date)):
+                    logger.warning("입법부 API 응답이 게시시작일 순으로 정렬되어 있지 않아 전체 페이지를 확인합니다")
+                    ordered = False
+                if dates:
+                    last_date = dates[-1]
+                
+                for bill in rows:
+                    notice_date = bill.get("NOTI_ST_DT", "")
+                    if not start_date <= notice_date <= end_date:
+                        continue
+                    bill_no = bill.get("BILL_NO")
+                    api_data.setdefault(notice_date, {})[bill_no] = {
+                        "의안번호": bill_no,
+                        "제목": bill.get("BILL_NAME", ""),
+                        "링크": bill.get("LINK_URL", ""),
+                        "소관위": bill.get("CURR_COMMITTEE", ""),
+                        "제안자": bill.get("PROPOSER", ""),
+                        "게시종료일": bill.get("NOTI_ED_DT", ""),
+                        "내용요약": "(내용 없음)"
+                    }
             
-            response = requests.get(self.base_url, params=params)
-            data = response.json()
-            rows = data.get("nknalejkafmvgzmpt", [None, {}])[1].get("row", [])
+            if ordered and last_date is not None and last_date < start_date:
+                logger.info(f"입법부 API {page - 1}/{total_pages}페이지에서 대상 날짜 이전 도달 - 수집 종료")
+                break
+            if page > total_pages:
+                break
             
+            # 다음 페이지 묶음을 동시에 요청 (페이지 순서 유지)
+            wave = list(range(page, min(page + API_PAGE_WAVE, total_pages + 1)))
+            try:
+                results = await asyncio.gather(*(self._fetch_api_page(number) for number in wave))
+            except Exception as e:
+                logger.error(f"입법부 API {wave[0]}~{wave[-1]}페이지 요청 오류 - 지금까지 수집한 데이터 사용: {e}")
+                break
+            pages = [rows for _, rows in results]
+            page = wave[-1] + 1
+        
+        collected = sum(len(bills) for bills in api_data.values())
+        logger.info(f"입법부 API 데이터 {collected}건 수집 (전체 {total_count}건 중)")
+        return api_data
+    
+    async def _fetch_api_page(self, page: int) -> Tuple[int, List[Dict]]:
+        """입법부 API 한 페이지 요청 - (전체 건수, 행 목록)"""
+        params = {
+            "KEY": self.api_key,
+            "Type": "json",
+            "pIndex": page,
+            "pSize": API_PAGE_SIZE
+        }
+        
+        # 스크래퍼와 같은 커넥션 풀/재시도/속도 제한 사용
+        content = await self.web_scraper.fetcher.fetch(self.base_url, params=params)
+        data = json.loads(content)
+        
+        # 데이터가 없으면 {"RESULT": {...}} 형태로 응답
+        body = data.get("nknalejkafmvgzmpt", [{}, {}])
+        try:
+            total_count = int(body[0]["head"][0]["list_total_count"])
+        except (IndexError, KeyError, TypeError, ValueError):
+            total_count = 0
+        rows = body[1].get("row", []) if len(body) > 1 else []
+        return total_count, rows
+    
+    def _get_browser_pool(self) -> BrowserPool:
+        """브라우저 풀 (처음 필요할 때 생성)"""
+        if self.browser_pool is None:
+            self.browser_pool = BrowserPool()
+        return self.browser_pool
+    
+    async def _collect_browser_details(self, source: str, target_date: str, max_pages: int,
+                                       list_ready: str, detail_ready: str) -> List[Tuple[Optional[str], dict]]:
+        """브라우저로 목록 페이지를 넘기며 상세 페이지를 탭 단위로 병렬 렌더링 - [(상세 URL, 데이터)]"""
+        pool = self._get_browser_pool()
+        list_url, base_params, parse_list = LIST_PAGES[source]
+        collected = []
+        
+        for page in range(1, max_pages + 1):
+            # 목록 페이지도 클릭 대신 페이지 번호로 바로 이동
+            page_url = requests.Request('GET', list_url, params=dict(base_params, pIndex=page, pSize='20')).prepare().url
+            try:
+                # 파싱은 이벤트 루프를 막지 않도록 스크래퍼의 파싱 실행기(스레드/프로세스 풀)에서 실행
+                rows = await self.web_scraper._run_parser(parse_list, await pool.render(page_url, list_ready))
+            except Exception as e:
+                logger.error(f"브라우저 목록 페이지 {page} 로딩 실패: {e}")
+                break
             if not rows:
                 break
-                
-            for bill in rows:
-                noti_st_dt = bill.get("NOTI_ST_DT", "")
-                if noti_st_dt != yesterday_dash:
-                    continue
-                    
-                bill_no = bill.get("BILL_NO")
-                api_data[bill_no] = {
-                    "의안번호": bill_no,
-                    "제목": bill.get("BILL_NAME", ""),
-                    "링크": bill.get("LINK_URL", ""),
-                    "소관위": bill.get("CURR_COMMITTEE", ""),
-                    "제안자": bill.get("PROPOSER", ""),
-                    "게시종료일": bill.get("NOTI_ED_DT", ""),
-                    "내용요약": "(내용 없음)"
-                }
             
-            page += 1
+            # 목록에 표시된 게시시작일이 대상 날짜가 아닌 행은 상세 페이지를 열지 않음
+            detail_urls = [url for url, start_date in rows if start_date in (None, target_date)]
+            pages = await pool.render_many(detail_urls, detail_ready)
+            collected.extend((url, pages.get(url)) for url in detail_urls)
             
-        return api_data
+            # 목록 행이 모두 대상 날짜 이전이면 이후 페이지는 볼 필요 없음
+            row_dates = [start_date for _, start_date in rows if start_date]
+            if row_dates and max(row_dates) < target_date:
+                break
+        
+        return collected
     
-    async def _collect_selenium_data(self) -> List[dict]:
-        """Selenium을 통해 상세 정보를 수집합니다."""
-        options = webdriver.ChromeOptions()
-        options.add_argument('--no-sandbox')
-        options.add_argument('--disable-dev-shm-usage')
-        options.add_argument('--headless')
-        options.add_argument('--disable-gpu')
-        options.add_argument('--disable-extensions')
-        options.add_argument('--disable-infobars')
+    async def _collect_selenium_data(self, target_date: Optional[str] = None, max_pages: int = 10) -> List[dict]:
+        """Selenium을 통해 상세 정보를 수집합니다. (자바스크립트 렌더링이 필요한 경우, 기본 대상 날짜: 어제)"""
+        if target_date is None:
+            target_date = (datetime.today() - timedelta(days=1)).strftime("%Y-%m-%d")
         
-        driver = webdriver.Chrome(
-            service=Service(ChromeDriverManager().install()), 
-            options=options
+        pages = await self._collect_browser_details(
+            "national", target_date, max_pages,
+            list_ready="#frm", detail_ready="#content"
         )
-        wait = WebDriverWait(driver, 10)
         
         combined_rows = []
-        
-        try:
-            list_url = "https://pal.assembly.go.kr/napal/lgsltpa/lgsltpaOngoing/list.do?searchConClosed=0&menuNo=1100026"
-            driver.get(list_url)
-            
-            current_page = 1
-            today = datetime.today()
-            yesterday = today - timedelta(days=1)
-            yesterday_dash = yesterday.strftime("%Y-%m-%d")
-            
-            while True:
-                wait.until(EC.presence_of_all_elements_located((
-                    By.CSS_SELECTOR,
-                    "#frm > div > div.board01.pr.td_center.board-added > table > tbody > tr"
-                )))
-                
-                links = driver.find_elements(By.CSS_SELECTOR,
-                    "#frm > div > div.board01.pr.td_center.board-added > table > tbody > tr > td.align_left.td_block > a"
-                )
-                
-                if not links:
-                    break
-                
-                for i in range(len(links)):
-                    links = driver.find_elements(By.CSS_SELECTOR,
-                        "#frm > div > div.board01.pr.td_center.board-added > table > tbody > tr > td.align_left.td_block > a"
-                    )
-                    
-                    try:
-                        driver.execute_script("arguments[0].click();", links[i])
-                        time.sleep(2)
-                        
-                        # 의안번호 추출
-                        try:
-                            elem = WebDriverWait(driver, 10).until(
-                                EC.presence_of_element_located((
-                                    By.XPATH, 
-                                    '/html/body/div[4]/div/div[4]/table/tbody/tr/td[1]'
-                                ))
-                            )
-                            bill_no = elem.get_attribute("innerText").strip()
-                        except:
-                            bill_no = "(없음)"
-                        
-                        # 제목 추출
-                        try:
-                            raw_title = driver.find_element(
-                                By.CSS_SELECTOR, 
-                                "#content > div.legislation-heading > h3"
-                            ).text.strip()
-                            if "]" in raw_title and "(" in raw_title:
-                                title = raw_title.split("]")[-1].split("(")[0].strip()
-                            else:
-                                title = raw_title
-                        except:
-                            title = "(제목 없음)"
-                        
-                        # 제안자 추출
-                        try:
-                            proposer = driver.find_element(
-                                By.CSS_SELECTOR,
-                                '#content > div.board01.pr.td_center.board-added > table > tbody > tr > td:nth-child(2)'
-                            ).text.strip()
-                        except:
-                            proposer = "(제안자 없음)"
-                        
-                        # 소관위 추출
-                        try:
-                            committee = driver.find_element(
-                                By.CSS_SELECTOR,
-                                '#content > div.board01.pr.td_center.board-added > table > tbody > tr > td.td_block'
-                            ).text.strip()
-                        except:
-                            committee = "(소관위 없음)"
-                        
-                        # 게시기간 추출
-                        try:
-                            period_element = WebDriverWait(driver, 10).until(
-                                EC.presence_of_element_located((
-                                    By.CSS_SELECTOR,
-                                    '#content > div.board01.pr.td_center.board-added > table > tbody > tr > td:nth-child(6)'
-                                ))
-                            )
-                            period_text = period_element.text.strip()
-                            
-                            noti_range = period_text.split("~")
-                            noti_st_dt = noti_range[0].strip() if len(noti_range) >= 1 else ""
-                            noti_ed_dt = noti_range[1].strip() if len(noti_range) >= 2 else ""
-                            
-                            if noti_st_dt != yesterday_dash:
-                                driver.back()
-                                time.sleep(1)
-                                continue
-                        except Exception as e:
-                            noti_st_dt = ""
-                            noti_ed_dt = ""
-                        
-                        # 내용 추출
-                        try:
-                            content = driver.find_element(
-                                By.CSS_SELECTOR, 
-                                "#content > div.card-wrap > div:nth-child(1) > div"
-                            ).text.strip()
-                            summary = content
-                        except:
-                            summary = "(내용 없음)"
-                        
-                        row = {
-                            "의안번호": bill_no,
-                            "제목": title,
-                            "제안자": proposer,
-                            "소관위": committee,
-                            "링크": driver.current_url,
-                            "게시종료일": noti_ed_dt,
-                            "내용요약": summary,
-                            "게시시작일": noti_st_dt
-                        }
-                        combined_rows.append(row)
-                        
-                    except Exception as e:
-                        print(f"크롤링 에러: {e}")
-                    
-                    driver.back()
-                    time.sleep(2)
-                
-                current_page += 1
-                try:
-                    driver.execute_script("fnSearch(arguments[0])", current_page)
-                    time.sleep(2)
-                except Exception as e:
-                    break
-                    
-        finally:
-            driver.quit()
+        for url, html in pages:
+            if html is None:
+                continue
+            try:
+                _, row = await self.web_scraper._run_parser(inspect_national_detail_page, html, url, target_date)
+            except Exception as e:
+                logger.error(f"크롤링 에러 ({url}): {e}")
+                continue
+            if row:
+                combined_rows.append(row)
         
         return combined_rows
     
-    async def _collect_admin_data(self) -> List[LegislationItem]:
-        """행정부 입법예고 데이터를 수집합니다."""
-        options = webdriver.ChromeOptions()
-        options.add_argument("--no-sandbox")
-        options.add_argument("--disable-dev-shm-usage")
-        options.add_argument("--headless")
-        options.add_argument("--disable-gpu")
-        options.add_argument("--disable-extensions")
-        options.add_argument("--disable-infobars")
+    async def _collect_admin_data(self, target_date: Optional[str] = None, max_pages: int = 5,
+                                  include_closed: bool = False) -> List[LegislationItem]:
+        """행정부 입법예고 데이터를 수집합니다. (브라우저 렌더링, 기본 대상 날짜: 어제)"""
+        today = datetime.today()
+        if target_date is None:
+            target_date = (today - timedelta(days=1)).strftime("%Y-%m-%d")
+        # 마감 여부 기준일 (include_closed이면 마감된 건도 포함)
+        today_date = None if include_closed else today.date()
         
-        driver = webdriver.Chrome(
-            service=Service(ChromeDriverManager().install()), 
-            options=options
+        pages = await self._collect_browser_details(
+            "admin", target_date, max_pages,
+            list_ready="#listView", detail_ready="#ogLmPpVo"
         )
-        wait = WebDriverWait(driver, 10)
-        
-        results = []
         
-        try:
-            url = "https://opinion.lawmaking.go.kr/gcom/ogLmPp"
-            driver.get(url)
-            page_number = 1
-            
-            # 어제 날짜 계산
-            today = datetime.today()
-            yesterday = today - timedelta(days=1)
-            yesterday_dash = yesterday.strftime("%Y-%m-%d")
-            today_date = today.date()
-            
-            while True:
-                time.sleep(2)
-                wait.until(
-                    EC.presence_of_all_elements_located((By.CSS_SELECTOR, "#listView > ul"))
-                )
-                link_elements = driver.find_elements(
-                    By.CSS_SELECTOR, "#listView > ul > li.title.W40 > a"
+        rows = []
+        for url, html in pages:
+            if html is None:
+                continue
+            try:
+                _, row = await self.web_scraper._run_parser(
+                    inspect_admin_detail_page, html, url, target_date, today_date
                 )
-                
-                for i in range(len(link_elements)):
-                    wait.until(
-                        EC.presence_of_all_elements_located(
-                            (By.CSS_SELECTOR, "#listView > ul")
-                        )
-                    )
-                    link_elements = driver.find_elements(
-                        By.CSS_SELECTOR, "#listView > ul > li.title.W40 > a"
-                    )
-                    if i >= len(link_elements):
-                        break
-                    
-                    link = link_elements[i]
-                    try:
-                        driver.execute_script("arguments[0].click();", link)
-                    except:
-                        time.sleep(2)
-                        try:
-                            driver.execute_script("arguments[0].click();", link)
-                        except:
-                            continue
-                    
-                    wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "#ogLmPpVo")))
-                    
-                    # 제목 추출
-                    try:
-                        title = driver.find_element(
-                            By.CSS_SELECTOR,
-                            "#ogLmPpVo > div:nth-child(7) > div > p:nth-child(8) > span",
-                        ).text.strip()
-                    except:
-                        title = "제목 없음"
-                    
-                    # 소관위 추출
-                    try:
-                        committee_raw = driver.find_element(
-                            By.CSS_SELECTOR,
-                            "#ogLmPpVo > ul.basic > li:nth-child(2) > table > tbody > tr > td",
-                        ).text.strip()
-                        committee = committee_raw.split("전화번호")[0].strip()
-                    except:
-                        committee = "소관위 없음"
-                    
-                    # 게시기간 추출
-                    try:
-                        period_raw = driver.find_element(
-                            By.CSS_SELECTOR, "#ogLmPpVo > ul.basic > li:nth-child(1)"
-                        ).text.strip()
-                        match = re.search(
-                            r"(\d{4})[.\- ]\s*(\d{1,2})[.\- ]\s*(\d{1,2})[.]?\s*~\s*(\d{4})[.\- ]\s*(\d{1,2})[.\- ]\s*(\d{1,2})",
-                            period_raw,
-                        )
-                        if match:
-                            start_date = datetime.strptime(
-                                f"{match.group(1)}-{int(match.group(2)):02d}-{int(match.group(3)):02d}",
-                                "%Y-%m-%d",
-                            ).date()
-                            end_date = datetime.strptime(
-                                f"{match.group(4)}-{int(match.group(5)):02d}-{int(match.group(6)):02d}",
-                                "%Y-%m-%d",
-                            ).date()
-                        else:
-                            start_date, end_date = None, None
-                    except Exception as e:
-                        start_date, end_date = None, None
-                    
-                    if not start_date or start_date.strftime("%Y-%m-%d") != yesterday_dash:
-                        driver.back()
-                        time.sleep(2)
-                        continue
-                    
-                    if end_date and end_date < today_date:
-                        driver.back()
-                        time.sleep(2)
-                        continue
-                    
-                    # 내용 추출
-                    try:
-                        content_raw = driver.find_element(
-                            By.CSS_SELECTOR, "#ogLmPpVo > div:nth-child(7) > div"
-                        ).text.strip()
-                        content = self._extract_until_opinion(content_raw)
-                    except:
-                        content = "내용 없음"
-                    
-                    # 링크 추출
-                    try:
-                        link_element = driver.find_element(
-                            By.CSS_SELECTOR, "#ogLmPpVo > ul:nth-child(2) > a:nth-child(2)"
-                        )
-                        link_url = link_element.get_attribute("href").strip()
-                    except:
-                        link_url = "링크 없음"
-                    
-                    results.append(LegislationItem(
-                        title=title,
-                        committee=committee,
-                        proposer="",
-                        start_date=start_date.strftime("%Y-%m-%d") if start_date else "",
-                        end_date=end_date.strftime("%Y-%m-%d") if end_date else "",
-                        content=content,
-                        link_url=link_url,
-                        source="admin",
-                        created_at=datetime.now()
-                    ))
-                    
-                    driver.back()
-                    time.sleep(2)
-                
-                # 페이지네이션
-                try:
-                    pagination = driver.find_elements(By.CSS_SELECTOR, "#nav > ol > li")
-                    next_clicked = False
-                    for li in pagination:
-                        a_tags = li.find_elements(By.TAG_NAME, "a")
-                        if a_tags and a_tags[0].text.strip() == str(page_number + 1):
-                            driver.execute_script("arguments[0].click();", a_tags[0])
-                            page_number += 1
-                            next_clicked = True
-                            break
-                    if not next_clicked:
-                        break
-                except Exception as e:
-                    break
-                    
-        finally:
-            driver.quit()
+            except Exception as e:
+                logger.error(f"행정부 크롤링 에러 ({url}): {e}")
+                continue
+            if row:
+                rows.append(row)
         
-        return results
+        return self._convert_admin_data_to_items(rows)
     
     def _extract_until_opinion(self, text: str) -> str:
         """의견제출 이전까지 내용만 추출"""
@@ -487,38 +352,41 @@ class LegislationService:
         
         # 웹 스크래핑 데이터 처리 (API에 없는 것만)
         for row in web_data:
-            bill_no = row["의안번호"]
-            if bill_no not in api_data:
-                combined_items.append(LegislationItem(
-                    bill_no=bill_no,
-                    title=row["제목"],
-                    committee=row["소관위"],
-                    proposer=row["제안자"],
-                    start_date=row["게시시작일"],
-                    end_date=row["게시종료일"],
-                    content=row["내용요약"],
-                    link_url=row["링크"],
-                    source="national",
-                    created_at=datetime.now()
-                ))
+            if row["의안번호"] not in api_data:
+                combined_items.append(self._convert_national_row(row))
         
         return combined_items
     
+    def _convert_national_row(self, row: dict) -> LegislationItem:
+        """입법부 웹 스크래핑 데이터 한 건을 LegislationItem으로 변환"""
+        return LegislationItem(
+            bill_no=row["의안번호"],
+            title=row["제목"],
+            committee=row["소관위"],
+            proposer=row["제안자"],
+            start_date=row["게시시작일"],
+            end_date=row["게시종료일"],
+            content=row["내용요약"],
+            link_url=row["링크"],
+            source="national",
+            created_at=datetime.now()
+        )
+    
     def _convert_admin_data_to_items(self, web_data: List[dict]) -> List[LegislationItem]:
         """행정부 웹 스크래핑 데이터를 LegislationItem으로 변환"""
-        items = []
-        
-        for row in web_data:
-            items.append(LegislationItem(
-                title=row["title"],
-                committee=row["committee"],
-                proposer=row["proposer"],
-                start_date=row["start_date"],
-                end_date=row["end_date"],
-                content=row["content"],
-                link_url=row["link_url"],
-                source=row["source"],
-                created_at=datetime.now()
-            ))
-        
-        return items
+        return [self._convert_admin_row(row) for row in web_data]
+    
+    def _convert_admin_row(self, row: dict) -> LegislationItem:
+        """행정부 웹 스크래핑 데이터 한 건을 LegislationItem으로 변환"""
+        return LegislationItem(
+            title=row["title"],
+            committee=row["committee"],
+            proposer=row["proposer"],
+            start_date=row["start_date"],
+            end_date=row["end_date"],
+            content=row["content"],
+            link_url=row["link_url"],
+            notice_key=row.get("notice_key"),
+            source=row["source"],
+            created_at=datetime.now()
+        )
@@ -0,0 +1,147 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from typing import Dict, List, Optional, Tuple
+import logging
+
+try:
+    import zstandard
+except ImportError:  # zstandard가 없으면 zlib으로 압축
+    zstandard = None
+
+logger = logging.getLogger(__name__)
+
+class PageArchive:
+    """수집한 원본 HTML을 본문 해시(SHA-256) 기준으로 압축 저장하는 로컬 아카이브
+
+    - objects/ab/<해시>.zst (zstandard가 없으면 .zz / zlib) 에 본문 저장 (같은 본문은 한 번만 저장)
+    - index.sqlite3 에 URL별 최신 본문 해시와 마지막 파싱 결과를 기록해
+      본문과 추출 규칙이 그대로면 다시 파싱하지 않음
+    """
+
+    def __init__(self, directory: str, level: int = 3):
+        self.directory = directory
+        self.level = level
+        self._lock = threading.Lock()
+        os.makedirs(os.path.join(directory, "objects"), exist_ok=True)
+
+        # 수집은 여러 스레드에서 기록하므로 락으로 직렬화
+        self._conn = sqlite3.connect(os.path.join(directory, "index.sqlite3"), check_same_thread=False)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS archive_pages (
+                url TEXT PRIMARY KEY,
+                source TEXT NOT NULL,
+                content_hash TEXT NOT NULL,
+                fetched_at REAL NOT NULL,
+                parsed_hash TEXT,
+                rules_fingerprint TEXT,
+                notice_date TEXT,
+                item_json TEXT
+            )
+        """)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_archive_source ON archive_pages (source, notice_date)")
+        self._conn.commit()
+
+    @classmethod
+    def from_env(cls, enabled: Optional[bool] = None) -> Optional["PageArchive"]:
+        """환경변수 설정으로 아카이브 생성 (기본 비활성화 - 실행 사이에 유지되는 경로에서만 켜야 의미가 있음)
+
+        enabled를 주면 SCRAPER_ARCHIVE_ENABLED 대신 사용
+        """
+        if enabled is None:
+            enabled = os.getenv("SCRAPER_ARCHIVE_ENABLED", "false").lower() == "true"
+        if not enabled:
+            return None
+        return cls(os.getenv("SCRAPER_ARCHIVE_PATH", "./.scraper_archive"))
+
+    def _object_path(self, content_hash: str, suffix: str) -> str:
+        return os.path.join(self.directory, "objects", content_hash[:2], f"{content_hash}{suffix}")
+
+    def put(self, body: bytes) -> str:
+        """본문을 압축 저장하고 해시 반환 (이미 있으면 저장 생략)"""
+        content_hash = hashlib.sha256(body).hexdigest()
+        if zstandard:
+            path = self._object_path(content_hash, ".zst")
+            compress = zstandard.ZstdCompressor(level=self.level).compress
+        else:
+            path = self._object_path(content_hash, ".zz")
+            compress = lambda data: zlib.compress(data, self.level)
+
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            # 다른 스레드가 같은 본문을 쓰는 중이어도 완성된 파일만 보이도록 임시 파일 후 교체
+            temp_path = f"{path}.{threading.get_ident()}.tmp"
+            with open(temp_path, "wb") as f:
+                f.write(compress(body))
+            os.replace(temp_path, path)
+        return content_hash
+
+    def get(self, content_hash: str) -> bytes:
+        """해시로 원본 본문 조회"""
+        path = self._object_path(content_hash, ".zst")
+        if os.path.exists(path):
+            if zstandard is None:
+                raise RuntimeError("zstandard 패키지가 없어 .zst 아카이브를 읽을 수 없습니다")
+            with open(path, "rb") as f:
+                return zstandard.ZstdDecompressor().decompress(f.read())
+        with open(self._object_path(content_hash, ".zz"), "rb") as f:
+            return zlib.decompress(f.read())
+
+    def lookup(self, url: str) -> Optional[Dict]:
+        """URL의 최신 아카이브 항목 조회"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT source, content_hash, parsed_hash, rules_fingerprint, notice_date, item_json "
+                "FROM archive_pages WHERE url = ?",
+                (url,)
+            ).fetchone()
+        if row is None:
+            return None
+
+        source, content_hash, parsed_hash, rules_fingerprint, notice_date, item_json = row
+        return {
+            "source": source,
+            "content_hash": content_hash,
+            "parsed_hash": parsed_hash,
+            "rules_fingerprint": rules_fingerprint,
+            "notice_date": notice_date,
+            "item": json.loads(item_json) if item_json else None,
+        }
+
+    def cached_parse(self, url: str, content_hash: str, rules_fingerprint: str) -> Optional[Tuple[Optional[str], Optional[Dict]]]:
+        """본문과 추출 규칙이 마지막 파싱 때와 같으면 (게시시작일, 데이터) 반환"""
+        entry = self.lookup(url)
+        if entry and entry["parsed_hash"] == content_hash and entry["rules_fingerprint"] == rules_fingerprint:
+            return entry["notice_date"], entry["item"]
+        return None
+
+    def record(self, url: str, source: str, content_hash: str, rules_fingerprint: Optional[str] = None,
+               notice_date: Optional[str] = None, item: Optional[Dict] = None):
+        """URL의 최신 본문 해시와 파싱 결과 기록"""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO archive_pages "
+                "(url, source, content_hash, fetched_at, parsed_hash, rules_fingerprint, notice_date, item_json) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (url, source, content_hash, time.time(),
+                 content_hash if rules_fingerprint else None, rules_fingerprint, notice_date,
+                 json.dumps(item, ensure_ascii=False) if item is not None else None)
+            )
+            self._conn.commit()
+
+    def list_pages(self, source: str) -> List[Tuple[str, str]]:
+        """소스별 아카이브된 (URL, 본문 해시) 목록"""
+        with self._lock:
+            return self._conn.execute(
+                "SELECT url, content_hash FROM archive_pages WHERE source = ? ORDER BY url",
+                (source,)
+            ).fetchall()
+
+    def close(self):
+        """인덱스 연결 종료"""
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,223 @@
+import re
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlparse
+
+from bs4 import BeautifulSoup, SoupStrainer
+
+from services.extraction_rules import SOURCE_RULES
+
+# 이 모듈의 함수는 프로세스 풀 워커에서 실행되므로
+# 원본 바이트와 문자열/날짜만 받아 일반 dict/튜플만 반환합니다 (모두 pickle 가능).
+
+# 목록 행에 표시된 게시기간 (예: 2024-01-05 ~ 2024-01-15, 2024. 1. 5. ~ 2024. 2. 14.)
+ROW_PERIOD_PATTERN = re.compile(
+    r"(\d{4})[.\-/ ]\s*(\d{1,2})[.\-/ ]\s*(\d{1,2})[.]?\s*~\s*(\d{4})[.\-/ ]\s*(\d{1,2})[.\-/ ]\s*(\d{1,2})"
+)
+
+PARSE_MODES = ("standard", "fast")
+
+# 추출 결과 dict 구성 버전 (필드가 바뀌면 올려서 아카이브에 캐시된 파싱 결과를 무효화)
+ITEM_SCHEMA_VERSION = 4
+
+# 행정부 상세 URL의 공고 일련번호 (예: /gcom/ogLmPp/77612)
+ADMIN_NOTICE_PATH_PATTERN = re.compile(r"/ogLmPp/(\d+)")
+
+def extract_row_start_date(row_text: str) -> Optional[str]:
+    """목록 행 텍스트에서 게시시작일(YYYY-MM-DD) 추출 - 없으면 None"""
+    match = ROW_PERIOD_PATTERN.search(row_text)
+    if not match:
+        return None
+    return f"{match.group(1)}-{int(match.group(2)):02d}-{int(match.group(3)):02d}"
+
+def parse_national_list_page(content: bytes) -> List[Tuple[str, Optional[str]]]:
+    """입법부 목록 페이지에서 (상세 URL, 게시시작일) 목록 추출"""
+    soup = BeautifulSoup(content, 'html.parser')
+
+    rows = []
+    for row in soup.select('#frm > div > div.board01.pr.td_center.board-added > table > tbody > tr'):
+        link_elem = row.select_one('td.align_left.td_block > a')
+        if link_elem:
+            href = link_elem.get('href')
+            if href:
+                # 상대 URL을 절대 URL로 변환
+                if href.startswith('/'):
+                    full_url = f"https://pal.assembly.go.kr{href}"
+                else:
+                    full_url = href
+                rows.append((full_url, extract_row_start_date(row.get_text(" ", strip=True))))
+
+    return rows
+
+def parse_admin_list_page(content: bytes) -> List[Tuple[str, Optional[str]]]:
+    """행정부 목록 페이지에서 (상세 URL, 게시시작일) 목록 추출"""
+    soup = BeautifulSoup(content, 'html.parser')
+
+    rows = []
+    for row in soup.select('#listView > ul'):
+        start_date = extract_row_start_date(row.get_text(" ", strip=True))
+        for link_elem in row.select('li.title.W40 > a'):
+            href = link_elem.get('href')
+            if href:
+                # 상대 URL을 절대 URL로 변환
+                if href.startswith('/'):
+                    rows.append((f"https://opinion.lawmaking.go.kr{href}", start_date))
+                else:
+                    rows.append((href, start_date))
+
+    return rows
+
+def admin_notice_key(url: str) -> str:
+    """행정부 상세 URL에서 공고 고유키 추출 (공고 일련번호, 없으면 쿼리를 정렬한 URL)"""
+    parsed = urlparse(url.strip())
+    match = ADMIN_NOTICE_PATH_PATTERN.search(parsed.path)
+    if match:
+        return match.group(1)
+
+    params = sorted(parse_qsl(parsed.query))
+    for name, value in params:
+        if "seq" in name.lower() and value.isdigit():
+            return value
+
+    query = "&".join(f"{name}={value}" for name, value in params)
+    return f"{parsed.netloc}{parsed.path}" + (f"?{query}" if query else "")
+
+def make_detail_soup(content: bytes, strainer: SoupStrainer, parse_mode: str) -> BeautifulSoup:
+    """파싱 모드에 맞게 상세 페이지 파싱 (fast 모드는 본문 영역만 파싱)"""
+    # fast 모드에서는 본문 영역 밖의 레이아웃/스크립트를 파싱하지 않음
+    if parse_mode == "fast":
+        soup = BeautifulSoup(content, 'lxml', parse_only=strainer)
+        if soup.contents:
+            return soup
+        # 본문 영역을 찾지 못한 페이지는 전체 문서로 파싱
+        return BeautifulSoup(content, 'lxml')
+    return BeautifulSoup(content, 'html.parser')
+
+def inspect_national_detail_page(content: bytes, url: str, target_date: str,
+                                 parse_mode: str = "standard") -> Tuple[Optional[str], Optional[Dict]]:
+    """입법부 상세 페이지에서 (게시시작일, 대상 날짜 데이터) 추출"""
+    rules = SOURCE_RULES[("national", parse_mode)]
+    soup = make_detail_soup(content, rules.strainer, parse_mode)
+    document = rules.bind(soup)
+
+    # 게시기간을 찾지 못하면 대상 날짜로 간주
+    period = document.get("period")
+    noti_st_dt, noti_ed_dt = period or (target_date, target_date)
+    notice_date = period[0] if period else None
+
+    # 대상 날짜와 일치하지 않으면 데이터 없음
+    if noti_st_dt != target_date:
+        return notice_date, None
+
+    return notice_date, _national_item(document.get_all(), url, noti_st_dt, noti_ed_dt)
+
+def _national_item(fields: Dict, url: str, noti_st_dt: Optional[str], noti_ed_dt: Optional[str]) -> Dict:
+    return {
+        "의안번호": fields["bill_no"],
+        "제목": fields["title"],
+        "제안자": fields["proposer"],
+        "소관위": fields["committee"],
+        "링크": url,
+        "게시종료일": noti_ed_dt,
+        "내용요약": fields["content"],
+        "게시시작일": noti_st_dt
+    }
+
+def inspect_admin_detail_page(content: bytes, url: str, target_date: str, today_date,
+                              parse_mode: str = "standard") -> Tuple[Optional[str], Optional[Dict]]:
+    """행정부 상세 페이지에서 (게시시작일, 대상 날짜 데이터) 추출"""
+    rules = SOURCE_RULES[("admin", parse_mode)]
+    soup = make_detail_soup(content, rules.strainer, parse_mode)
+    document = rules.bind(soup)
+
+    # 게시기간을 찾지 못하면 제외
+    period = document.get("period")
+    if not period:
+        return None, None
+    start_date, end_date = period
+    notice_date = start_date.strftime("%Y-%m-%d")
+
+    # 대상 날짜와 일치하지 않으면 데이터 없음
+    if notice_date != target_date:
+        return notice_date, None
+
+    # 마감된 건은 제외 (기준일이 없으면 포함)
+    if today_date and end_date < today_date:
+        return notice_date, None
+
+    return notice_date, _admin_item(document.get_all(), url, notice_date, end_date.strftime("%Y-%m-%d"))
+
+def _admin_item(fields: Dict, url: str, start_date: str, end_date: str) -> Dict:
+    return {
+        "title": fields["title"],
+        "committee": fields["committee"],
+        "proposer": "",
+        "start_date": start_date,
+        "end_date": end_date,
+        "content": fields["content"],
+        "link_url": fields["link_url"],
+        "notice_key": admin_notice_key(url),
+        "source": "admin"
+    }
+
+# ---------------------------------------------------------------------------
+# 대상 날짜와 무관한 전체 추출 (아카이브 캐시/재파싱용)
+# ---------------------------------------------------------------------------
+
+def extract_national_detail_page(content: bytes, url: str, parse_mode: str = "standard",
+                                 target_date: Optional[str] = None) -> Tuple[Optional[str], Optional[Dict]]:
+    """입법부 상세 페이지에서 대상 날짜와 관계없이 (게시시작일, 전체 데이터) 추출
+
+    게시기간을 찾지 못하면 게시일 필드는 None (select 시 대상 날짜로 채움)
+    target_date를 주면 게시시작일이 다른 페이지는 나머지 필드를 추출하지 않고 (게시시작일, None) 반환
+    """
+    rules = SOURCE_RULES[("national", parse_mode)]
+    document = rules.bind(make_detail_soup(content, rules.strainer, parse_mode))
+    period = document.get("period")
+    noti_st_dt, noti_ed_dt = period or (None, None)
+    if target_date and noti_st_dt not in (None, target_date):
+        return noti_st_dt, None
+    return noti_st_dt, _national_item(document.get_all(), url, noti_st_dt, noti_ed_dt)
+
+def select_national_detail(notice_date: Optional[str], item: Optional[Dict], target_date: str,
+                           today_date=None) -> Tuple[Optional[str], Optional[Dict]]:
+    """전체 추출 결과에 대상 날짜 조건 적용 (inspect_national_detail_page와 같은 결과)"""
+    if item is None or notice_date not in (None, target_date):
+        return notice_date, None
+    if notice_date is None:
+        item = dict(item, 게시시작일=target_date, 게시종료일=target_date)
+    return notice_date, item
+
+def extract_admin_detail_page(content: bytes, url: str, parse_mode: str = "standard",
+                              target_date: Optional[str] = None) -> Tuple[Optional[str], Optional[Dict]]:
+    """행정부 상세 페이지에서 대상 날짜/마감 여부와 관계없이 (게시시작일, 전체 데이터) 추출
+
+    target_date를 주면 게시시작일이 다른 페이지는 나머지 필드를 추출하지 않고 (게시시작일, None) 반환
+    """
+    rules = SOURCE_RULES[("admin", parse_mode)]
+    document = rules.bind(make_detail_soup(content, rules.strainer, parse_mode))
+    period = document.get("period")
+    if not period:
+        return None, None
+    start_date, end_date = (value.strftime("%Y-%m-%d") for value in period)
+    if target_date and start_date != target_date:
+        return start_date, None
+    return start_date, _admin_item(document.get_all(), url, start_date, end_date)
+
+def select_admin_detail(notice_date: Optional[str], item: Optional[Dict], target_date: str,
+                        today_date=None) -> Tuple[Optional[str], Optional[Dict]]:
+    """전체 추출 결과에 대상 날짜/마감 조건 적용 (inspect_admin_detail_page와 같은 결과)"""
+    if item is None or notice_date != target_date:
+        return notice_date, None
+    if today_date and item["end_date"] < today_date.strftime("%Y-%m-%d"):
+        return notice_date, None
+    return notice_date, item
+
+DETAIL_EXTRACTORS = {
+    "national": extract_national_detail_page,
+    "admin": extract_admin_detail_page,
+}
+
+DETAIL_SELECTORS = {
+    "national": select_national_detail,
+    "admin": select_admin_detail,
+}
@@ -0,0 +1,82 @@
+import asyncio
+from typing import Dict, Optional
+import logging
+
+from services.legislation_service import LegislationService
+from services.database_service import DatabaseService
+
+logger = logging.getLogger(__name__)
+
+# 한 번에 파싱/저장할 페이지 수
+REPARSE_CHUNK_SIZE = 100
+
+class ReparseService:
+    """원본 HTML 아카이브를 현재 추출 규칙으로 다시 파싱해 데이터베이스를 갱신 (네트워크 사용 없음)
+
+    선택자가 깨져 잘못 저장된 데이터를 규칙 수정 후 재수집 없이 복구할 때 사용합니다.
+    아카이브에는 웹 상세 페이지만 있으므로 입법부 API 데이터는 다시 만들지 않습니다.
+    """
+
+    def __init__(self, legislation_service: LegislationService, database_service: DatabaseService):
+        self.legislation_service = legislation_service
+        self.database_service = database_service
+        self.scraper = legislation_service.web_scraper
+
+    async def run(self, sources=("national", "admin"), start_date: Optional[str] = None,
+                  end_date: Optional[str] = None) -> Dict[str, int]:
+        """아카이브 재파싱 실행 - 소스별 저장 건수 반환 (게시시작일 범위 지정 가능)"""
+        archive = self.scraper.archive
+        if archive is None:
+            raise RuntimeError("원본 HTML 아카이브가 비활성화되어 있습니다 (SCRAPER_ARCHIVE_ENABLED)")
+
+        saved_counts = {}
+        for source in sources:
+            pages = await asyncio.to_thread(archive.list_pages, source)
+            logger.info(f"{source} 아카이브 재파싱 시작 - {len(pages)}개 페이지")
+
+            saved = 0
+            undated = 0
+            for offset in range(0, len(pages), REPARSE_CHUNK_SIZE):
+                chunk = pages[offset:offset + REPARSE_CHUNK_SIZE]
+                results = await asyncio.gather(*(
+                    self._reparse_page(source, url, content_hash) for url, content_hash in chunk
+                ))
+
+                rows = []
+                for notice_date, row in results:
+                    if row is None:
+                        continue
+                    if notice_date is None:
+                        # 게시일을 알 수 없는 페이지는 어느 날짜 데이터인지 정할 수 없어 제외
+                        undated += 1
+                        continue
+                    if (start_date and notice_date < start_date) or (end_date and notice_date > end_date):
+                        continue
+                    rows.append(row)
+
+                if rows:
+                    saved += await asyncio.to_thread(self._save, source, rows)
+
+            if undated:
+                logger.info(f"{source} 게시일을 찾지 못한 페이지 {undated}개 제외")
+            logger.info(f"{source} 아카이브 재파싱 완료 - {saved}건 저장")
+            saved_counts[source] = saved
+
+        return saved_counts
+
+    async def _reparse_page(self, source: str, url: str, content_hash: str):
+        """아카이브 본문을 다시 파싱 (실패 시 (None, None))"""
+        try:
+            content = await asyncio.to_thread(self.scraper.archive.get, content_hash)
+            return await self.scraper.extract_detail_page(source, content, url)
+        except Exception as e:
+            logger.error(f"아카이브 재파싱 오류 ({url}): {e}")
+            return None, None
+
+    def _save(self, source: str, rows) -> int:
+        """재파싱 결과 저장 (기존 데이터는 갱신)"""
+        if source == "national":
+            items = [self.legislation_service._convert_national_row(row) for row in rows]
+            return self.database_service.save_national_legislation_data(items)
+        items = self.legislation_service._convert_admin_data_to_items(rows)
+        return self.database_service.save_admin_legislation_data(items)
@@ -0,0 +1,32 @@
+import asyncio
+from typing import Awaitable, Callable, Dict, TypeVar
+import logging
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+class SingleFlight:
+    """같은 키의 작업이 진행 중이면 새로 시작하지 않고 그 결과를 함께 기다리게 하는 중복 실행 방지 계층
+
+    먼저 호출한 쪽이 작업을 시작하고, 끝나기 전에 들어온 호출은 같은 결과(또는 같은 예외)를 받습니다.
+    기다리던 요청이 취소되어도 진행 중인 작업은 취소되지 않습니다.
+    """
+
+    def __init__(self):
+        self._tasks: Dict[str, asyncio.Task] = {}
+
+    def in_flight(self, key: str) -> bool:
+        """해당 키의 작업이 진행 중인지 여부"""
+        return key in self._tasks
+
+    async def do(self, key: str, func: Callable[[], Awaitable[T]]) -> T:
+        """키별로 한 번만 func를 실행하고 결과를 공유"""
+        task = self._tasks.get(key)
+        if task is None:
+            task = asyncio.ensure_future(func())
+            self._tasks[key] = task
+            task.add_done_callback(lambda _: self._tasks.pop(key, None))
+        else:
+            logger.info(f"진행 중인 작업에 합류: {key}")
+        return await asyncio.shield(task)
@@ -1,18 +1,85 @@
 import requests
-from bs4 import BeautifulSoup
-import re
-from typing import List, Dict, Optional
+from requests.adapters import HTTPAdapter
+from typing import List, Dict, Optional, Tuple
 from datetime import datetime, timedelta
-import time
+import asyncio
+import os
+from contextlib import aclosing
+from concurrent.futures import ProcessPoolExecutor
 import logging
 
+from services.async_fetcher import AsyncFetcher
+from services.http_cache import HttpCache, CachingHTTPAdapter
+from services.page_archive import PageArchive
+from services.extraction_rules import SOURCE_RULES
+from services.page_parsers import (
+    DETAIL_EXTRACTORS,
+    DETAIL_SELECTORS,
+    ITEM_SCHEMA_VERSION,
+    PARSE_MODES,
+    inspect_admin_detail_page,
+    inspect_national_detail_page,
+    parse_admin_list_page,
+    parse_national_list_page,
+)
+
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# 소스별 목록 페이지 (URL, 기본 파라미터, 파서)
+LIST_PAGES = {
+    "national": (
+        "https://pal.assembly.go.kr/napal/lgsltpa/lgsltpaOngoing/list.do?searchConClosed=0&menuNo=1100026",
+        {'searchConClosed': '0', 'menuNo': '1100026'},
+        parse_national_list_page,
+    ),
+    "admin": (
+        "https://opinion.lawmaking.go.kr/gcom/ogLmPp",
+        {},
+        parse_admin_list_page,
+    ),
+}
+
+SOURCE_LABELS = {"national": "입법부", "admin": "행정부"}
+
 class WebScraper:
-    def __init__(self):
+    def __init__(self, max_concurrency: Optional[int] = None, per_host_interval: Optional[float] = None,
+                 parse_mode: Optional[str] = None, frontier=None, parse_workers: Optional[int] = None,
+                 archive_enabled: Optional[bool] = None, max_total_concurrency: Optional[int] = None):
+        if parse_mode is None:
+            parse_mode = os.getenv("SCRAPER_PARSE_MODE", "standard")
+        if parse_mode not in PARSE_MODES:
+            raise ValueError(f"지원하지 않는 파싱 모드: {parse_mode}")
+        # standard: html.parser로 문서 전체 파싱 / fast: lxml로 본문 영역만 파싱
+        self.parse_mode = parse_mode
+        # 파싱 전용 프로세스 풀 (0이면 이벤트 루프에서 바로 파싱)
+        self.parse_pool: Optional[ProcessPoolExecutor] = None
+        if parse_workers is None:
+            parse_workers = int(os.getenv("SCRAPER_PARSE_WORKERS", "0"))
+        self.set_parse_workers(parse_workers)
+        # 이미 처리한 URL을 건너뛰기 위한 크롤링 프론티어 (선택)
+        self.frontier = frontier
+        # 원본 HTML 압축 아카이브 (본문이 바뀌지 않은 페이지는 파싱 생략, 오프라인 재파싱)
+        self.archive = PageArchive.from_env(archive_enabled)
+        
+        if max_concurrency is None:
+            max_concurrency = int(os.getenv("SCRAPER_MAX_CONCURRENCY", "8"))
+        if per_host_interval is None:
+            per_host_interval = float(os.getenv("SCRAPER_HOST_INTERVAL", "0.1"))
+        if max_total_concurrency is None:
+            max_total_concurrency = int(os.getenv("SCRAPER_MAX_TOTAL_CONCURRENCY") or max_concurrency * 2)
+        
         self.session = requests.Session()
+        # 커넥션 풀은 호스트마다 따로 생기므로 호스트별 동시 요청 수(max_concurrency)만큼 확보
+        # (pool_connections: 유지할 호스트 풀 개수) + 조건부 요청 디스크 캐시
+        self.cache = HttpCache.from_env()
+        if self.cache:
+            adapter = CachingHTTPAdapter(self.cache, pool_connections=4, pool_maxsize=max_concurrency)
+        else:
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=max_concurrency)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
@@ -21,89 +88,58 @@ class WebScraper:
             'Connection': 'keep-alive',
             'Upgrade-Insecure-Requests': '1',
         })
+        # 상세 페이지는 동시성 제한 + 호스트별 적응형 속도 제한 하에 비동기로 수집
+        # (일시적 오류는 백오프 재시도, 연속 실패 시 호스트 서킷 차단)
+        self.fetcher = AsyncFetcher(
+            self.session,
+            max_concurrency=max_concurrency,
+            max_total_concurrency=max_total_concurrency,
+            per_host_interval=per_host_interval,
+            max_retries=int(os.getenv("SCRAPER_MAX_RETRIES", "3")),
+            min_interval=float(os.getenv("SCRAPER_HOST_MIN_INTERVAL", "0.05")),
+            max_interval=float(os.getenv("SCRAPER_HOST_MAX_INTERVAL", "5")),
+            circuit_threshold=int(os.getenv("SCRAPER_CIRCUIT_THRESHOLD", "5")),
+            circuit_reset=float(os.getenv("SCRAPER_CIRCUIT_RESET", "30"))
+        )
         
-    def get_national_legislation_data(self) -> List[Dict]:
-        """입법부 입법예고 데이터를 requests + BeautifulSoup로 수집"""
+    def get_national_legislation_data(self, target_date: Optional[str] = None) -> List[Dict]:
+        """입법부 입법예고 데이터를 requests + BeautifulSoup로 수집
+
+        새 이벤트 루프에서 실행하므로 동기 코드 전용입니다. 실행 중인 이벤트 루프 안에서 호출하면
+        RuntimeError가 발생하므로 get_national_legislation_data_async를 await하세요.
+        """
+        self._ensure_no_running_loop("get_national_legislation_data_async")
+        return asyncio.run(self.get_national_legislation_data_async(target_date))
+    
+    async def get_national_legislation_data_async(self, target_date: Optional[str] = None, max_pages: int = 10,
+                                                  frontier_entries: Optional[List[Dict]] = None) -> List[Dict]:
+        """입법부 입법예고 데이터를 비동기로 수집 (상세 페이지 동시 요청, 기본 대상 날짜: 어제)
+
+        처리한 상세 페이지의 프론티어 항목은 frontier_entries에 모으기만 하며,
+        호출자가 저장에 성공한 뒤 record_frontier로 기록합니다.
+        """
         try:
-            # 어제 날짜 계산
-            today = datetime.today()
-            yesterday = today - timedelta(days=1)
-            yesterday_dash = yesterday.strftime("%Y-%m-%d")
+            # 대상 날짜 (지정하지 않으면 어제)
+            if target_date is None:
+                target_date = (datetime.today() - timedelta(days=1)).strftime("%Y-%m-%d")
             
-            logger.info(f"입법부 데이터 수집 시작 - 대상 날짜: {yesterday_dash}")
+            logger.info(f"입법부 데이터 수집 시작 - 대상 날짜: {target_date}")
             
             # 1단계: 목록 페이지에서 링크 수집
-            list_url = "https://pal.assembly.go.kr/napal/lgsltpa/lgsltpaOngoing/list.do?searchConClosed=0&menuNo=1100026"
-            
             all_links = []
-            page = 1
             
-            while True:
-                logger.info(f"목록 페이지 {page} 수집 중...")
-                
-                # 페이지별 데이터 요청
-                params = {
-                    'searchConClosed': '0',
-                    'menuNo': '1100026',
-                    'pIndex': page,
-                    'pSize': '20'
-                }
-                
-                response = self.session.get(list_url, params=params, timeout=30)
-                response.raise_for_status()
-                
-                soup = BeautifulSoup(response.content, 'html.parser')
-                
-                # 테이블에서 링크 추출
-                table_rows = soup.select('#frm > div > div.board01.pr.td_center.board-added > table > tbody > tr')
-                
-                if not table_rows:
-                    logger.info(f"페이지 {page}에서 데이터 없음 - 수집 종료")
-                    break
-                
-                page_links = []
-                for row in table_rows:
-                    link_elem = row.select_one('td.align_left.td_block > a')
-                    if link_elem:
-                        href = link_elem.get('href')
-                        if href:
-                            # 상대 URL을 절대 URL로 변환
-                            if href.startswith('/'):
-                                full_url = f"https://pal.assembly.go.kr{href}"
-                            else:
-                                full_url = href
-                            page_links.append(full_url)
-                
-                if not page_links:
-                    break
-                    
-                all_links.extend(page_links)
-                logger.info(f"페이지 {page}에서 {len(page_links)}개 링크 수집")
-                
-                page += 1
-                time.sleep(1)  # 요청 간격 조절
-                
-                # 최대 10페이지까지만 수집 (안전장치)
-                if page > 10:
-                    break
+            async with aclosing(self.iter_list_pages("national", target_date, max_pages)) as pages:
+                async for page, rows in pages:
+                    # 목록에 표시된 게시시작일이 대상 날짜가 아닌 행은 상세 페이지 요청 생략
+                    page_links = [url for url, start_date in rows if start_date in (None, target_date)]
+                    all_links.extend(page_links)
+                    logger.info(f"페이지 {page}에서 {len(page_links)}개 링크 수집 ({len(rows) - len(page_links)}개 날짜 불일치로 제외)")
             
             logger.info(f"총 {len(all_links)}개 링크 수집 완료")
             
-            # 2단계: 각 상세 페이지에서 데이터 추출
-            results = []
-            for i, detail_url in enumerate(all_links):
-                try:
-                    logger.info(f"상세 페이지 {i+1}/{len(all_links)} 처리 중: {detail_url}")
-                    
-                    detail_data = self._scrape_national_detail_page(detail_url, yesterday_dash)
-                    if detail_data:
-                        results.append(detail_data)
-                        
-                    time.sleep(0.5)  # 요청 간격 조절
-                    
-                except Exception as e:
-                    logger.error(f"상세 페이지 처리 오류 ({detail_url}): {e}")
-                    continue
+            # 2단계: 각 상세 페이지에서 데이터 추출 (목록 순서 유지)
+            results = await self.collect_detail_links("national", all_links, target_date,
+                                                      frontier_entries=frontier_entries)
             
             logger.info(f"입법부 데이터 수집 완료 - 총 {len(results)}건")
             return results
@@ -112,162 +148,218 @@ class WebScraper:
             logger.error(f"입법부 데이터 수집 중 오류: {e}")
             return []
     
-    def _scrape_national_detail_page(self, url: str, target_date: str) -> Optional[Dict]:
-        """입법부 상세 페이지에서 데이터 추출 - 정확한 파싱"""
-        try:
-            response = self.session.get(url, timeout=30)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # 기본값 설정
-            bill_no = "(없음)"
-            title = "(제목 없음)"
-            proposer = "(제안자 없음)"
-            committee = "(소관위 없음)"
-            content = "(내용 없음)"
-            noti_st_dt = target_date
-            noti_ed_dt = target_date
-            
-            # 페이지 텍스트 전체에서 정보 추출
-            page_text = soup.get_text()
-            
-            # 제목 추출 - 더 정확한 방법
-            title_elem = soup.select_one('h1, h2, h3, .title, .board-title, .legislation-heading h3')
-            if title_elem:
-                title = title_elem.get_text(strip=True)
-                # 제목에서 불필요한 부분 제거
-                if "]" in title and "(" in title:
-                    title = title.split("]")[-1].split("(")[0].strip()
-            
-            # 정규식으로 정보 추출
-            import re
+    async def iter_list_pages(self, source: str, target_date: str, max_pages: int):
+        """목록 페이지를 차례로 가져와 (페이지 번호, [(상세 URL, 게시시작일)])를 반환하는 비동기 제너레이터
+        
+        빈 페이지, 게시일이 모두 대상 날짜 이전인 페이지, 최대 페이지에서 종료
+        """
+        list_url, base_params, parser = LIST_PAGES[source]
+        page = 1
+        
+        while True:
+            logger.info(f"{SOURCE_LABELS[source]} 목록 페이지 {page} 수집 중...")
             
-            # 의안번호 추출
-            bill_match = re.search(r'의안번호[:\s]*(\d+)', page_text)
-            if bill_match:
-                bill_no = bill_match.group(1)
+            # 페이지별 데이터 요청
+            params = dict(base_params, pIndex=page, pSize='20')
             
-            # 제안자 추출 - 더 정확한 패턴
-            proposer_match = re.search(r'제안자[:\s]*([^\n\r]+)', page_text)
-            if not proposer_match:
-                proposer_match = re.search(r'발의자[:\s]*([^\n\r]+)', page_text)
-            if proposer_match:
-                proposer = proposer_match.group(1).strip()
+            try:
+                content = await self.fetcher.fetch(list_url, params=params)
+            except Exception as e:
+                # 재시도 후에도 실패하면 지금까지 모은 결과로 계속 진행
+                logger.error(f"{SOURCE_LABELS[source]} 목록 페이지 {page} 수집 실패 - 목록 수집 중단: {e}")
+                return
             
-            # 소관위 추출
-            committee_match = re.search(r'소관위원회[:\s]*([^\n\r]+)', page_text)
-            if not committee_match:
-                committee_match = re.search(r'소관위[:\s]*([^\n\r]+)', page_text)
-            if committee_match:
-                committee = committee_match.group(1).strip()
+            rows = await self._run_parser(parser, content)
             
-            # 게시기간 추출
-            period_match = re.search(r'입법\s*예고기간[:\s]*(\d{4}-\d{2}-\d{2})\s*~\s*(\d{4}-\d{2}-\d{2})', page_text)
-            if period_match:
-                noti_st_dt = period_match.group(1)
-                noti_ed_dt = period_match.group(2)
-            else:
-                # 대안 패턴
-                period_match = re.search(r'게시기간[:\s]*(\d{4}-\d{2}-\d{2})\s*~\s*(\d{4}-\d{2}-\d{2})', page_text)
-                if period_match:
-                    noti_st_dt = period_match.group(1)
-                    noti_ed_dt = period_match.group(2)
+            if not rows:
+                logger.info(f"페이지 {page}에서 데이터 없음 - 수집 종료")
+                return
             
-            # 내용 추출 - 더 정확한 방법
-            content_divs = soup.select('div')
-            for div in content_divs:
-                div_text = div.get_text(strip=True)
-                if len(div_text) > 100 and any(keyword in div_text for keyword in ["법률안", "입법예고", "내용"]):
-                    content = div_text
-                    break
+            yield page, rows
             
-            # 대상 날짜와 일치하지 않으면 None 반환
-            if noti_st_dt != target_date:
-                return None
+            # 목록 행이 모두 대상 날짜 이전이면 이후 페이지는 볼 필요 없음
+            row_dates = [start_date for _, start_date in rows if start_date]
+            if row_dates and max(row_dates) < target_date:
+                logger.info(f"페이지 {page}의 게시일이 모두 대상 날짜 이전 - 수집 종료")
+                return
             
-            return {
-                "의안번호": bill_no,
-                "제목": title,
-                "제안자": proposer,
-                "소관위": committee,
-                "링크": url,
-                "게시종료일": noti_ed_dt,
-                "내용요약": content,
-                "게시시작일": noti_st_dt
-            }
+            page += 1
             
+            # 최대 페이지까지만 수집 (안전장치)
+            if page > max_pages:
+                return
+    
+    async def list_links_by_date(self, source: str, start_date: str, end_date: str,
+                                 max_pages: int) -> Dict[Optional[str], List[str]]:
+        """목록 페이지를 한 번만 훑어 기간 내 상세 URL을 게시시작일별로 나눔 (백필용)
+        
+        목록에서 게시일을 읽지 못한 행은 None 키로 모으며, 종료일 이후 행은 제외합니다.
+        """
+        links: Dict[Optional[str], List[str]] = {}
+        async with aclosing(self.iter_list_pages(source, start_date, max_pages)) as pages:
+            async for page, rows in pages:
+                for url, row_date in rows:
+                    if row_date is None or start_date <= row_date <= end_date:
+                        links.setdefault(row_date, []).append(url)
+        
+        total = sum(len(urls) for urls in links.values())
+        logger.info(f"{SOURCE_LABELS[source]} 목록 {start_date} ~ {end_date} - {len(links)}개 날짜, {total}개 링크 수집")
+        return links
+    
+    async def collect_detail_links(self, source: str, urls: List[str], target_date: str, today_date=None,
+                                   frontier_entries: Optional[List[Dict]] = None) -> List[Dict]:
+        """상세 URL 중 프론티어 기준으로 수집이 필요한 페이지를 동시에 가져와 대상 날짜 데이터 추출 (목록 순서 유지)"""
+        urls = await self._filter_due_links(urls, target_date)
+        if source == "national":
+            details = await asyncio.gather(*(
+                self._scrape_national_detail_page_async(url, target_date) for url in urls
+            ))
+        else:
+            details = await asyncio.gather(*(
+                self._scrape_admin_detail_page_async(url, target_date, today_date) for url in urls
+            ))
+        return self._collect_details(urls, details, frontier_entries)
+    
+    async def parse_detail_page(self, source: str, content: bytes, url: str, target_date: str,
+                                today_date=None) -> Tuple[Optional[str], Optional[Dict]]:
+        """상세 페이지 본문에서 (게시시작일, 대상 날짜 데이터) 추출 (프로세스 풀 사용 시 워커에서 실행)"""
+        if self.archive:
+            return await self._parse_archived_detail_page(source, content, url, target_date, today_date)
+        if source == "national":
+            return await self._run_parser(
+                inspect_national_detail_page, content, url, target_date, self.parse_mode
+            )
+        return await self._run_parser(
+            inspect_admin_detail_page, content, url, target_date, today_date, self.parse_mode
+        )
+    
+    def rules_fingerprint(self, source: str) -> str:
+        """현재 파싱 모드와 추출 규칙을 나타내는 값 (바뀌면 캐시된 파싱 결과를 쓰지 않음)"""
+        return f"{self.parse_mode}:{SOURCE_RULES[(source, self.parse_mode)].fingerprint}:v{ITEM_SCHEMA_VERSION}"
+    
+    async def extract_detail_page(self, source: str, content: bytes, url: str) -> Tuple[Optional[str], Optional[Dict]]:
+        """대상 날짜와 관계없이 상세 페이지 전체를 추출하고 아카이브에 파싱 결과 기록"""
+        notice_date, item = await self._run_parser(DETAIL_EXTRACTORS[source], content, url, self.parse_mode)
+        if self.archive:
+            content_hash = await asyncio.to_thread(self.archive.put, content)
+            await asyncio.to_thread(
+                self.archive.record, url, source, content_hash, self.rules_fingerprint(source), notice_date, item
+            )
+        return notice_date, item
+    
+    async def _parse_archived_detail_page(self, source: str, content: bytes, url: str, target_date: str,
+                                          today_date=None) -> Tuple[Optional[str], Optional[Dict]]:
+        """본문을 아카이브에 저장하고, 지난 실행과 본문이 같으면 저장된 파싱 결과 재사용
+        
+        캐시가 없으면 게시시작일부터 확인해 대상 날짜가 아닌 페이지는 나머지 필드를 추출하지 않고
+        본문 해시만 기록합니다. (파싱 결과가 없으므로 다음 실행에서 다시 파싱)
+        """
+        content_hash = await asyncio.to_thread(self.archive.put, content)
+        fingerprint = self.rules_fingerprint(source)
+        cached = await asyncio.to_thread(self.archive.cached_parse, url, content_hash, fingerprint)
+        
+        if cached is not None:
+            notice_date, item = cached
+        else:
+            notice_date, item = await self._run_parser(
+                DETAIL_EXTRACTORS[source], content, url, self.parse_mode, target_date
+            )
+            # 게시시작일만 보고 건너뛴 페이지는 전체 추출 결과가 아니므로 캐시하지 않음
+            skipped = item is None and notice_date is not None
+            await asyncio.to_thread(
+                self.archive.record, url, source, content_hash,
+                None if skipped else fingerprint, notice_date, item
+            )
+        
+        return DETAIL_SELECTORS[source](notice_date, item, target_date, today_date)
+    
+    def set_parse_workers(self, workers: int):
+        """파싱 프로세스 풀 크기 변경 (0 이하이면 풀 없이 스레드에서 파싱)"""
+        if self.parse_pool:
+            self.parse_pool.shutdown(wait=True)
+            self.parse_pool = None
+        self.parse_workers = max(0, workers)
+        if self.parse_workers:
+            self.parse_pool = ProcessPoolExecutor(max_workers=self.parse_workers)
+            logger.info(f"파싱 프로세스 풀 사용 - 워커 {self.parse_workers}개")
+    
+    @staticmethod
+    def _ensure_no_running_loop(async_name: str):
+        """동기 래퍼가 실행 중인 이벤트 루프 안에서 호출되면 대신 쓸 비동기 메서드를 알려주는 오류 발생"""
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        raise RuntimeError(f"실행 중인 이벤트 루프 안에서는 동기 수집 메서드를 쓸 수 없습니다. {async_name}()를 await하세요.")
+    
+    async def _run_parser(self, func, *args):
+        """파싱 함수를 프로세스 풀에서 실행 (풀이 없으면 스레드에서 실행)
+        
+        네트워크 I/O와 분리하기 위해 원본 바이트만 워커로 넘기고 일반 dict/튜플을 돌려받음
+        풀이 없어도 이벤트 루프에서 직접 파싱하지 않아 수집 중에도 API 요청을 계속 처리함
+        """
+        if self.parse_pool is None:
+            return await asyncio.to_thread(func, *args)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.parse_pool, func, *args)
+    
+    async def _scrape_national_detail_page_async(self, url: str, target_date: str) -> Optional[Tuple[Optional[str], Optional[Dict]]]:
+        """입법부 상세 페이지를 비동기로 가져와 (게시시작일, 데이터) 추출 - 실패 시 None"""
+        try:
+            logger.info(f"상세 페이지 처리 중: {url}")
+            content = await self.fetcher.fetch(url)
+            return await self.parse_detail_page("national", content, url, target_date)
         except Exception as e:
             logger.error(f"상세 페이지 파싱 오류 ({url}): {e}")
             return None
     
-    def get_admin_legislation_data(self) -> List[Dict]:
-        """행정부 입법예고 데이터를 requests + BeautifulSoup로 수집"""
+    def _inspect_national_detail_page(self, content: bytes, url: str, target_date: str) -> Tuple[Optional[str], Optional[Dict]]:
+        """입법부 상세 페이지에서 (게시시작일, 대상 날짜 데이터) 추출"""
+        return inspect_national_detail_page(content, url, target_date, self.parse_mode)
+    
+    def get_admin_legislation_data(self, target_date: Optional[str] = None) -> List[Dict]:
+        """행정부 입법예고 데이터를 requests + BeautifulSoup로 수집
+
+        동기 코드 전용입니다. 이벤트 루프 안에서는 get_admin_legislation_data_async를 await하세요.
+        """
+        self._ensure_no_running_loop("get_admin_legislation_data_async")
+        return asyncio.run(self.get_admin_legislation_data_async(target_date))
+    
+    async def get_admin_legislation_data_async(self, target_date: Optional[str] = None, max_pages: int = 5,
+                                               include_closed: bool = False,
+                                               frontier_entries: Optional[List[Dict]] = None) -> List[Dict]:
+        """행정부 입법예고 데이터를 비동기로 수집 (페이지 내 상세 페이지 동시 요청, 기본 대상 날짜: 어제)
+
+        프론티어 항목은 입법부와 마찬가지로 frontier_entries에 모아 호출자가 저장 후 기록합니다.
+        """
         try:
-            # 어제 날짜 계산
+            # 대상 날짜 (지정하지 않으면 어제)
             today = datetime.today()
-            yesterday = today - timedelta(days=1)
-            yesterday_dash = yesterday.strftime("%Y-%m-%d")
-            today_date = today.date()
+            if target_date is None:
+                target_date = (today - timedelta(days=1)).strftime("%Y-%m-%d")
+            # 마감 여부 기준일 (include_closed이면 마감된 건도 포함)
+            today_date = None if include_closed else today.date()
             
-            logger.info(f"행정부 데이터 수집 시작 - 대상 날짜: {yesterday_dash}")
+            logger.info(f"행정부 데이터 수집 시작 - 대상 날짜: {target_date}")
             
             results = []
-            page = 1
             
-            while True:
-                logger.info(f"행정부 페이지 {page} 수집 중...")
-                
-                # 행정부 입법예고 목록 페이지
-                url = "https://opinion.lawmaking.go.kr/gcom/ogLmPp"
-                params = {
-                    'pIndex': page,
-                    'pSize': '20'
-                }
-                
-                response = self.session.get(url, params=params, timeout=30)
-                response.raise_for_status()
-                
-                soup = BeautifulSoup(response.content, 'html.parser')
-                
-                # 목록에서 링크 추출
-                list_items = soup.select('#listView > ul > li.title.W40 > a')
-                
-                if not list_items:
-                    logger.info(f"페이지 {page}에서 데이터 없음 - 수집 종료")
-                    break
-                
-                page_results = []
-                for link_elem in list_items:
-                    try:
-                        href = link_elem.get('href')
-                        if href:
-                            # 상대 URL을 절대 URL로 변환
-                            if href.startswith('/'):
-                                detail_url = f"https://opinion.lawmaking.go.kr{href}"
-                            else:
-                                detail_url = href
-                            
-                            detail_data = self._scrape_admin_detail_page(detail_url, yesterday_dash, today_date)
-                            if detail_data:
-                                page_results.append(detail_data)
-                                
-                    except Exception as e:
-                        logger.error(f"행정부 링크 처리 오류: {e}")
-                        continue
-                
-                if not page_results:
-                    break
+            async with aclosing(self.iter_list_pages("admin", target_date, max_pages)) as pages:
+                async for page, rows in pages:
+                    # 목록에 표시된 게시시작일이 대상 날짜가 아닌 행은 상세 페이지 요청 생략
+                    detail_urls = [url for url, start_date in rows if start_date in (None, target_date)]
+                    skipped_count = len(rows) - len(detail_urls)
+                    
+                    # 페이지 내 상세 페이지를 동시에 수집 (목록 순서 유지)
+                    page_results = await self.collect_detail_links("admin", detail_urls, target_date, today_date,
+                                                                   frontier_entries)
                     
-                results.extend(page_results)
-                logger.info(f"페이지 {page}에서 {len(page_results)}건 수집")
-                
-                page += 1
-                time.sleep(1)  # 요청 간격 조절
-                
-                # 최대 5페이지까지만 수집 (성능 최적화)
-                if page > 5:
-                    break
+                    results.extend(page_results)
+                    logger.info(f"페이지 {page}에서 {len(page_results)}건 수집 ({skipped_count}개 날짜 불일치로 제외)")
+                    
+                    # 목록에서 날짜를 읽을 수 없으면 기존처럼 결과 없는 페이지에서 종료
+                    if not any(start_date for _, start_date in rows) and not page_results:
+                        break
             
             logger.info(f"행정부 데이터 수집 완료 - 총 {len(results)}건")
             return results
@@ -276,97 +368,55 @@ class WebScraper:
             logger.error(f"행정부 데이터 수집 중 오류: {e}")
             return []
     
-    def _scrape_admin_detail_page(self, url: str, target_date: str, today_date) -> Optional[Dict]:
-        """행정부 상세 페이지에서 데이터 추출"""
+    async def _scrape_admin_detail_page_async(self, url: str, target_date: str, today_date) -> Optional[Tuple[Optional[str], Optional[Dict]]]:
+        """행정부 상세 페이지를 비동기로 가져와 (게시시작일, 데이터) 추출 - 실패 시 None"""
         try:
-            response = self.session.get(url, timeout=30)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # 제목 추출 - 더 일반적인 선택자
-            title_elem = soup.select_one('#ogLmPpVo span, .title span, h1, h2, h3')
-            if not title_elem:
-                title_elem = soup.select_one('p span, div span')
-            title = title_elem.get_text(strip=True) if title_elem else "제목 없음"
-            
-            # 소관위 추출 - 더 일반적인 선택자
-            committee_elem = soup.select_one('ul.basic li table tbody tr td, .basic li table td')
-            if not committee_elem:
-                committee_elem = soup.select_one('table td:contains("부서"), table td:contains("과")')
-            if committee_elem:
-                committee_raw = committee_elem.get_text(strip=True)
-                committee = committee_raw.split("전화번호")[0].strip()
-            else:
-                committee = "소관위 없음"
-            
-            # 게시기간 추출 - 더 일반적인 선택자
-            period_elem = soup.select_one('ul.basic li:first-child, .basic li:first-child')
-            if not period_elem:
-                period_elem = soup.select_one('li:contains("게시"), li:contains("기간")')
-            if period_elem:
-                period_text = period_elem.get_text(strip=True)
-                match = re.search(
-                    r"(\d{4})[.\- ]\s*(\d{1,2})[.\- ]\s*(\d{1,2})[.]?\s*~\s*(\d{4})[.\- ]\s*(\d{1,2})[.\- ]\s*(\d{1,2})",
-                    period_text,
-                )
-                if match:
-                    start_date = datetime.strptime(
-                        f"{match.group(1)}-{int(match.group(2)):02d}-{int(match.group(3)):02d}",
-                        "%Y-%m-%d",
-                    ).date()
-                    end_date = datetime.strptime(
-                        f"{match.group(4)}-{int(match.group(5)):02d}-{int(match.group(6)):02d}",
-                        "%Y-%m-%d",
-                    ).date()
-                    
-                    # 대상 날짜와 일치하지 않으면 None 반환
-                    if start_date.strftime("%Y-%m-%d") != target_date:
-                        return None
-                    
-                    # 마감된 건은 제외
-                    if end_date < today_date:
-                        return None
-                else:
-                    return None
-            else:
-                return None
-            
-            # 내용 추출
-            content_elem = soup.select_one('#ogLmPpVo > div:nth-child(7) > div')
-            if content_elem:
-                content_raw = content_elem.get_text(strip=True)
-                content = self._extract_until_opinion(content_raw)
-            else:
-                content = "내용 없음"
-            
-            # 링크 추출
-            link_elem = soup.select_one('#ogLmPpVo > ul:nth-child(2) > a:nth-child(2)')
-            link_url = link_elem.get('href', '').strip() if link_elem else "링크 없음"
-            
-            return {
-                "title": title,
-                "committee": committee,
-                "proposer": "",
-                "start_date": start_date.strftime("%Y-%m-%d"),
-                "end_date": end_date.strftime("%Y-%m-%d"),
-                "content": content,
-                "link_url": link_url,
-                "source": "admin"
-            }
-            
+            content = await self.fetcher.fetch(url)
+            return await self.parse_detail_page("admin", content, url, target_date, today_date)
         except Exception as e:
             logger.error(f"행정부 상세 페이지 파싱 오류 ({url}): {e}")
             return None
     
-    def _extract_until_opinion(self, text: str) -> str:
-        """의견제출 이전까지 내용만 추출"""
-        cut_keywords = ["3. 의견제출", "의견제출", "※ 제출의견", "의견 제출"]
-        for key in cut_keywords:
-            if key in text:
-                return text.split(key)[0].strip()
-        return text.strip()
+    def _inspect_admin_detail_page(self, content: bytes, url: str, target_date: str, today_date) -> Tuple[Optional[str], Optional[Dict]]:
+        """행정부 상세 페이지에서 (게시시작일, 대상 날짜 데이터) 추출"""
+        return inspect_admin_detail_page(content, url, target_date, today_date, self.parse_mode)
+    
+    async def _filter_due_links(self, urls: List[str], target_date: str) -> List[str]:
+        """크롤링 프론티어 기준으로 수집이 필요한 URL만 남김"""
+        if not self.frontier or not urls:
+            return urls
+        return await asyncio.to_thread(self.frontier.filter_due, urls, target_date)
+    
+    def _collect_details(self, urls: List[str], details: List,
+                         frontier_entries: Optional[List[Dict]] = None) -> List[Dict]:
+        """상세 페이지 결과에서 대상 데이터를 모으고 처리한 URL의 프론티어 항목을 frontier_entries에 추가"""
+        results = []
+        for url, detail in zip(urls, details):
+            if detail is None:
+                # 수집 실패 - 기록하지 않아 다음 실행에서 다시 시도
+                continue
+            notice_date, item = detail
+            if item:
+                results.append(item)
+            if frontier_entries is not None:
+                frontier_entries.append({
+                    "url": url,
+                    "notice_date": notice_date,
+                    "bill_no": item.get("의안번호") if item else None
+                })
+        return results
+    
+    async def record_frontier(self, source: str, entries: List[Dict]):
+        """저장이 끝난 상세 페이지를 프론티어에 기록 (저장 실패 시 호출하지 않아 다음 실행에서 다시 수집)"""
+        if self.frontier and entries:
+            await asyncio.to_thread(self.frontier.record, source, entries)
     
     def close(self):
-        """세션 종료"""
+        """세션, 요청 스레드 풀, 아카이브 및 파싱 프로세스 풀 종료"""
+        self.fetcher.close()
         self.session.close()
+        if self.archive:
+            self.archive.close()
+        if self.parse_pool:
+            self.parse_pool.shutdown(wait=True)
+            self.parse_pool = None
@@ -2,28 +2,47 @@
 """
 웹 스크래퍼 테스트 스크립트
 requests + BeautifulSoup 방식으로 크롤링 테스트
+
+사용법:
+    python test_scraper.py                          실제 사이트로 테스트
+    python test_scraper.py --record fixtures/DATE   응답을 녹화하면서 테스트
+    python test_scraper.py --replay fixtures/DATE   녹화된 응답으로 오프라인 테스트
 """
 
+import argparse
 import asyncio
 import sys
 import os
+from datetime import datetime, timedelta
 
 # 현재 디렉토리를 Python 경로에 추가
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from services.web_scraper import WebScraper
 from services.legislation_service import LegislationService
+from services.http_fixtures import start_recording, start_replay
 
-async def test_web_scraper():
+async def test_web_scraper(target_date=None, record_dir=None, replay_dir=None):
     """웹 스크래퍼 테스트"""
     print("🔍 웹 스크래퍼 테스트 시작...")
     
     scraper = WebScraper()
+    include_closed = False
+    
+    if record_dir:
+        start_recording(scraper.session, record_dir, target_date)
+        print(f"📼 응답 녹화: {record_dir}")
+    elif replay_dir:
+        replay = start_replay(scraper.session, replay_dir)
+        # 녹화 당시의 대상 날짜로 재생하고, 그 사이 마감된 건도 포함
+        target_date = target_date or replay.store.meta.get("target_date")
+        include_closed = True
+        print(f"▶️ 녹화 응답 재생: {replay_dir} (대상 날짜: {target_date})")
     
     try:
         # 입법부 데이터 테스트
         print("\n📊 입법부 데이터 수집 테스트...")
-        national_data = scraper.get_national_legislation_data()
+        national_data = await scraper.get_national_legislation_data_async(target_date)
         print(f"✅ 입법부 데이터 수집 완료: {len(national_data)}건")
         
         if national_data:
@@ -37,7 +56,7 @@ async def test_web_scraper():
         
         # 행정부 데이터 테스트
         print("\n📊 행정부 데이터 수집 테스트...")
-        admin_data = scraper.get_admin_legislation_data()
+        admin_data = await scraper.get_admin_legislation_data_async(target_date, include_closed=include_closed)
         print(f"✅ 행정부 데이터 수집 완료: {len(admin_data)}건")
         
         if admin_data:
@@ -91,16 +110,28 @@ async def test_legislation_service():
 
 async def main():
     """메인 테스트 함수"""
+    parser = argparse.ArgumentParser(description="입법예고 수집기 테스트")
+    parser.add_argument("--date", help="대상 날짜 (YYYY-MM-DD, 기본: 어제 / 재생 시 녹화 날짜)")
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument("--record", metavar="DIR", help="목록/상세 응답을 DIR에 녹화")
+    group.add_argument("--replay", metavar="DIR", help="DIR에 녹화된 응답으로 오프라인 실행")
+    args = parser.parse_args()
+    
+    # 녹화 시 대상 날짜를 고정해 두어야 재생 결과가 같아짐
+    if args.record and not args.date:
+        args.date = (datetime.today() - timedelta(days=1)).strftime("%Y-%m-%d")
+    
     print("🚀 입법예고 수집기 테스트 시작")
     print("=" * 50)
     
     # 웹 스크래퍼 테스트
-    await test_web_scraper()
+    await test_web_scraper(args.date, args.record, args.replay)
     
     print("\n" + "=" * 50)
     
-    # 서비스 통합 테스트
-    await test_legislation_service()
+    # 서비스 통합 테스트 (API/브라우저를 사용하므로 녹화/재생 모드에서는 생략)
+    if not (args.record or args.replay):
+        await test_legislation_service()
     
     print("\n" + "=" * 50)
     print("✅ 모든 테스트 완료!")
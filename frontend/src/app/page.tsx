@@ -31,28 +31,31 @@ export default function Home() {
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState<string | null>(null);
   const [refreshing, setRefreshing] = useState(false);
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
+  const [loadingMore, setLoadingMore] = useState(false);
   const [activeTab, setActiveTab] = useState<'all' | 'national' | 'admin'>('all');
   const [searchQuery, setSearchQuery] = useState('');
   const [showProjectInfo, setShowProjectInfo] = useState(true);
 
+  const fetchPage = (type: 'all' | 'national' | 'admin', cursor?: string): Promise<LegislationResponse> => {
+    switch (type) {
+      case 'national':
+        return legislationApi.getNational({ cursor });
+      case 'admin':
+        return legislationApi.getAdmin({ cursor });
+      default:
+        return legislationApi.getAll({ cursor });
+    }
+  };
+
   const fetchData = async (type: 'all' | 'national' | 'admin' = 'all') => {
     try {
       setError(null);
-      let response: LegislationResponse;
-      
-      switch (type) {
-        case 'national':
-          response = await legislationApi.getNational();
-          break;
-        case 'admin':
-          response = await legislationApi.getAdmin();
-          break;
-        default:
-          response = await legislationApi.getAll();
-      }
+      const response = await fetchPage(type);
       
       if (response.success) {
         setLegislationData(response.data);
+        setNextCursor(response.next_cursor ?? null);
       } else {
         setError(response.message);
       }
@@ -64,11 +67,35 @@ export default function Home() {
     }
   };
 
+  // 다음 페이지를 받아 목록 뒤에 이어 붙이기
+  const handleLoadMore = async () => {
+    if (!nextCursor) return;
+    setLoadingMore(true);
+    try {
+      const response = await fetchPage(activeTab, nextCursor);
+      if (response.success) {
+        setLegislationData(prev => [...prev, ...response.data]);
+        setNextCursor(response.next_cursor ?? null);
+      } else {
+        setError(response.message);
+      }
+    } catch (err) {
+      setError('데이터를 가져오는 중 오류가 발생했습니다.');
+      console.error('다음 페이지 가져오기 오류:', err);
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
   const handleRefresh = async () => {
     setRefreshing(true);
     try {
-      await legislationApi.refresh();
+      const { job_id } = await legislationApi.refresh();
+      const job = await legislationApi.waitForJob(job_id);
       await fetchData(activeTab);
+      if (job.status === 'failed') {
+        setError(job.error || '데이터 새로고침 중 오류가 발생했습니다.');
+      }
     } catch (err) {
       setError('데이터 새로고침 중 오류가 발생했습니다.');
       console.error('새로고침 오류:', err);
@@ -339,6 +366,19 @@ export default function Home() {
                   </div>
                 ))}
               </div>
+              
+              {/* 다음 페이지 */}
+              {nextCursor && (
+                <div className="text-center">
+                  <button
+                    onClick={handleLoadMore}
+                    disabled={loadingMore}
+                    className="btn-outline disabled:opacity-50"
+                  >
+                    {loadingMore ? '불러오는 중...' : '더 보기'}
+                  </button>
+                </div>
+              )}
             </div>
           )}
         </div>
@@ -1,11 +1,11 @@
 import axios from 'axios';
-import { LegislationResponse, ErrorResponse } from '@/types/legislation';
+import { LegislationResponse, LegislationQuery, ErrorResponse, CrawlJob } from '@/types/legislation';
 
 const API_BASE_URL = process.env.NEXT_PUBLIC_API_URL || 'http://localhost:8000';
 
 const apiClient = axios.create({
   baseURL: API_BASE_URL,
-  timeout: 300000, // 5분 타임아웃 (크롤링 시간 고려)
+  timeout: 300000, // 5분 타임아웃 (데이터가 없을 때 조회 요청에서 실시간 수집하는 시간 고려)
   headers: {
     'Content-Type': 'application/json',
   },
@@ -36,36 +36,66 @@ apiClient.interceptors.response.use(
 );
 
 export const legislationApi = {
-  // 입법부 입법예고 데이터 가져오기
-  getNational: async (): Promise<LegislationResponse> => {
-    const response = await apiClient.get('/api/legislation/national');
+  // 입법부 입법예고 데이터 가져오기 (한 페이지씩, 다음 페이지는 next_cursor로 조회)
+  getNational: async (query: LegislationQuery = {}): Promise<LegislationResponse> => {
+    const response = await apiClient.get('/api/legislation/national', { params: query });
     return response.data;
   },
 
   // 행정부 입법예고 데이터 가져오기
-  getAdmin: async (): Promise<LegislationResponse> => {
-    const response = await apiClient.get('/api/legislation/admin');
+  getAdmin: async (query: LegislationQuery = {}): Promise<LegislationResponse> => {
+    const response = await apiClient.get('/api/legislation/admin', { params: query });
     return response.data;
   },
 
   // 모든 입법예고 데이터 가져오기
-  getAll: async (): Promise<LegislationResponse> => {
-    const response = await apiClient.get('/api/legislation/all');
+  getAll: async (query: LegislationQuery = {}): Promise<LegislationResponse> => {
+    const response = await apiClient.get('/api/legislation/all', { params: query });
     return response.data;
   },
 
-  // 데이터 새로고침
+  // 입법예고 전문 검색 (관련도 높은 순, 다음 페이지는 next_cursor로 조회)
+  search: async (
+    q: string,
+    query: { source?: 'national' | 'admin'; limit?: number; cursor?: string } = {}
+  ): Promise<LegislationResponse> => {
+    const response = await apiClient.get('/api/legislation/search', { params: { q, ...query } });
+    return response.data;
+  },
+
+  // 데이터 새로고침 작업 등록 (202 응답, 수집은 백그라운드에서 진행)
   refresh: async (): Promise<{
     success: boolean;
     message: string;
-    national_count: number;
-    admin_count: number;
-    total_count: number;
+    job_id: string;
+    status: CrawlJob['status'];
   }> => {
     const response = await apiClient.post('/api/legislation/refresh');
     return response.data;
   },
 
+  // 수집 작업 진행 상황 조회
+  getJob: async (jobId: string): Promise<CrawlJob> => {
+    const response = await apiClient.get(`/api/jobs/${jobId}`);
+    return response.data;
+  },
+
+  // 수집 작업이 끝날 때까지 주기적으로 조회
+  waitForJob: async (
+    jobId: string,
+    onProgress?: (job: CrawlJob) => void,
+    intervalMs: number = 2000
+  ): Promise<CrawlJob> => {
+    while (true) {
+      const job = await legislationApi.getJob(jobId);
+      onProgress?.(job);
+      if (job.status === 'succeeded' || job.status === 'failed') {
+        return job;
+      }
+      await new Promise((resolve) => setTimeout(resolve, intervalMs));
+    }
+  },
+
   // 헬스 체크
   healthCheck: async (): Promise<{ status: string; timestamp: string }> => {
     const response = await apiClient.get('/health');
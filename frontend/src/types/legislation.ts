@@ -8,6 +8,7 @@ export interface LegislationItem {
   content: string;
   link_url: string;
   bill_no?: string;
+  notice_key?: string;
   source: 'national' | 'admin';
   created_at?: string;
 }
@@ -17,9 +18,40 @@ export interface LegislationResponse {
   message: string;
   data: LegislationItem[];
   total_count: number;
+  next_cursor?: string | null;
   timestamp?: string;
 }
 
+// 목록 조회 페이지/필터 파라미터 (next_cursor를 cursor로 넘기면 다음 페이지)
+export interface LegislationQuery {
+  limit?: number;
+  cursor?: string;
+  committee?: string;
+  date_from?: string;
+  date_to?: string;
+}
+
+export type CrawlJobStatus = 'queued' | 'running' | 'succeeded' | 'failed';
+
+export interface CrawlJobSourceProgress {
+  status: CrawlJobStatus;
+  saved: number;
+}
+
+export interface CrawlJob {
+  job_id: string;
+  kind: string;
+  status: CrawlJobStatus;
+  created_at: string;
+  started_at?: string;
+  finished_at?: string;
+  progress: Record<'national' | 'admin', CrawlJobSourceProgress>;
+  national_count: number;
+  admin_count: number;
+  total_count: number;
+  error?: string;
+}
+
 export interface ErrorResponse {
   success: false;
   message: string;
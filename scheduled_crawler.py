@@ -20,28 +20,33 @@ sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'backen
 
 from backend.services.legislation_service import LegislationService
 from backend.services.database_service import DatabaseService
+from backend.services.backfill_service import BackfillService
+from backend.services.ingest_pipeline import IngestPipeline
+from backend.services.reparse_service import ReparseService
+from models.database import migrate_unique_keys
 
 class ScheduledCrawler:
     def __init__(self):
         self.legislation_service = LegislationService()
         self.database_service = DatabaseService()
+        # 수집한 항목을 배치 단위로 바로 저장하는 스트리밍 파이프라인
+        self.pipeline = IngestPipeline(self.legislation_service, self.database_service)
         self.api_url = os.getenv("API_URL", "http://localhost:8000")
     
-    async def crawl_and_save_national(self):
-        """입법부 데이터 크롤링 및 저장"""
+    async def crawl_and_save_national(self, reset: bool = False):
+        """입법부 데이터 크롤링 및 저장 (의안번호/공고 고유키 기준 추가·갱신, 프론티어로 처리한 상세 페이지는 건너뜀)"""
         print(f"[{datetime.now()}] 입법부 데이터 크롤링 시작...")
         
         try:
-            # 기존 입법부 데이터 삭제
-            self.database_service.delete_legislation_by_source("national")
-            print("기존 입법부 데이터 삭제 완료")
+            if reset:
+                # 전체 초기화: 기존 데이터와 프론티어 기록을 지우고 처음부터 다시 수집
+                await asyncio.to_thread(self.database_service.delete_national_legislation_data, True)
+                print("기존 입법부 데이터 및 프론티어 기록 삭제 완료")
             
-            # 새로운 데이터 크롤링
-            national_data = await self.legislation_service.get_national_legislation()
+            # 새로운 데이터 크롤링 (수집되는 대로 저장)
+            saved_count = await self.pipeline.run_national()
             
-            if national_data:
-                # 데이터베이스에 저장
-                saved_count = self.database_service.save_legislation_data(national_data)
+            if saved_count:
                 print(f"입법부 데이터 {saved_count}건 저장 완료")
             else:
                 print("입법부 데이터가 없습니다.")
@@ -50,21 +55,20 @@ class ScheduledCrawler:
             print(f"입법부 데이터 크롤링 오류: {e}")
             raise
     
-    async def crawl_and_save_admin(self):
-        """행정부 데이터 크롤링 및 저장"""
+    async def crawl_and_save_admin(self, reset: bool = False):
+        """행정부 데이터 크롤링 및 저장 (의안번호/공고 고유키 기준 추가·갱신, 프론티어로 처리한 상세 페이지는 건너뜀)"""
         print(f"[{datetime.now()}] 행정부 데이터 크롤링 시작...")
         
         try:
-            # 기존 행정부 데이터 삭제
-            self.database_service.delete_legislation_by_source("admin")
-            print("기존 행정부 데이터 삭제 완료")
+            if reset:
+                # 전체 초기화: 기존 데이터와 프론티어 기록을 지우고 처음부터 다시 수집
+                await asyncio.to_thread(self.database_service.delete_admin_legislation_data, True)
+                print("기존 행정부 데이터 및 프론티어 기록 삭제 완료")
             
-            # 새로운 데이터 크롤링
-            admin_data = await self.legislation_service.get_admin_legislation()
+            # 새로운 데이터 크롤링 (수집되는 대로 저장)
+            saved_count = await self.pipeline.run_admin()
             
-            if admin_data:
-                # 데이터베이스에 저장
-                saved_count = self.database_service.save_legislation_data(admin_data)
+            if saved_count:
                 print(f"행정부 데이터 {saved_count}건 저장 완료")
             else:
                 print("행정부 데이터가 없습니다.")
@@ -73,12 +77,46 @@ class ScheduledCrawler:
             print(f"행정부 데이터 크롤링 오류: {e}")
             raise
     
+    async def backfill(self, start_date: str, end_date: str, sources):
+        """날짜 범위 백필 (기존 데이터는 삭제하지 않고 추가/갱신)"""
+        print(f"[{datetime.now()}] 백필 시작: {start_date} ~ {end_date}")
+        
+        backfill_service = BackfillService(self.legislation_service, self.database_service)
+        saved_counts = await backfill_service.run(start_date, end_date, sources)
+        
+        for source, saved_count in saved_counts.items():
+            print(f"{source} 데이터 {saved_count}건 저장 완료")
+    
+    async def reparse(self, sources, start_date=None, end_date=None):
+        """원본 HTML 아카이브를 다시 파싱해 데이터 갱신 (네트워크 사용 없음)"""
+        print(f"[{datetime.now()}] 아카이브 재파싱 시작")
+        
+        reparse_service = ReparseService(self.legislation_service, self.database_service)
+        saved_counts = await reparse_service.run(sources, start_date, end_date)
+        
+        for source, saved_count in saved_counts.items():
+            print(f"{source} 데이터 {saved_count}건 저장 완료")
+    
+    def retention(self, days=None):
+        """보관 기간이 지났거나 비활성화된 데이터를 보관 테이블로 이동"""
+        print(f"[{datetime.now()}] 데이터 보관 이동 시작")
+        
+        moved_counts = self.database_service.archive_old_data(days)
+        
+        for source, moved_count in moved_counts.items():
+            print(f"{source} 데이터 {moved_count}건 보관 테이블로 이동")
+    
+    def migrate(self):
+        """자연키 중복 행 정리 후 유니크 인덱스 생성 (이전 버전 테이블 이전용)"""
+        print(f"[{datetime.now()}] 자연키 유니크 인덱스 이전 시작")
+        migrate_unique_keys()
+    
     def notify_api_refresh(self):
         """API 서버에 데이터 새로고침 알림"""
         try:
             response = requests.post(f"{self.api_url}/api/legislation/refresh")
-            if response.status_code == 200:
-                print("API 서버 새로고침 완료")
+            if response.status_code == 202:
+                print(f"API 서버 새로고침 작업 등록 완료 (job_id: {response.json().get('job_id')})")
             else:
                 print(f"API 서버 새로고침 실패: {response.status_code}")
         except Exception as e:
@@ -95,9 +133,58 @@ async def main():
         await crawler.crawl_and_save_national()
     elif mode == "admin":
         await crawler.crawl_and_save_admin()
-    elif mode == "all":
-        await crawler.crawl_and_save_national()
-        await crawler.crawl_and_save_admin()
+    elif mode in ("all", "reset"):
+        # reset: 기존 데이터와 프론티어 기록을 모두 지우고 다시 수집 (사용법: scheduled_crawler.py reset [national|admin|all])
+        reset = mode == "reset"
+        source = sys.argv[2] if reset and len(sys.argv) > 2 else "all"
+        crawls = []
+        if source in ("national", "all"):
+            crawls.append(crawler.crawl_and_save_national(reset))
+        if source in ("admin", "all"):
+            crawls.append(crawler.crawl_and_save_admin(reset))
+        # 두 소스는 호스트가 달라 동시에 수집 (전체 시간은 느린 쪽 소스 수준)
+        # 한쪽이 실패해도 다른 쪽 수집은 끝까지 진행한 뒤 오류를 전달
+        results = await asyncio.gather(*crawls, return_exceptions=True)
+        for result in results:
+            if isinstance(result, Exception):
+                raise result
+    elif mode == "backfill":
+        # 사용법: scheduled_crawler.py backfill START_DATE END_DATE [national|admin|all]
+        if len(sys.argv) < 4:
+            print("사용법: scheduled_crawler.py backfill YYYY-MM-DD YYYY-MM-DD [national|admin|all]")
+            sys.exit(1)
+        source = sys.argv[4] if len(sys.argv) > 4 else "all"
+        sources = ("national", "admin") if source == "all" else (source,)
+        await crawler.backfill(sys.argv[2], sys.argv[3], sources)
+        
+        # 백필 결과는 이미 저장되었으므로 새로고침(재수집) 알림은 보내지 않음
+        print(f"[{datetime.now()}] 백필 작업 완료")
+        return
+    elif mode == "reparse":
+        # 사용법: scheduled_crawler.py reparse [national|admin|all] [START_DATE END_DATE]
+        source = sys.argv[2] if len(sys.argv) > 2 else "all"
+        sources = ("national", "admin") if source == "all" else (source,)
+        start_date = sys.argv[3] if len(sys.argv) > 3 else None
+        end_date = sys.argv[4] if len(sys.argv) > 4 else None
+        await crawler.reparse(sources, start_date, end_date)
+        
+        # 재파싱은 아카이브만 사용하므로 새로고침(재수집) 알림은 보내지 않음
+        print(f"[{datetime.now()}] 재파싱 작업 완료")
+        return
+    elif mode == "retention":
+        # 사용법: scheduled_crawler.py retention [DAYS] (비우면 RETENTION_DAYS)
+        days = int(sys.argv[2]) if len(sys.argv) > 2 else None
+        await asyncio.to_thread(crawler.retention, days)
+        
+        # 조회 대상에서 빠지는 것뿐이므로 새로고침(재수집) 알림은 보내지 않음
+        print(f"[{datetime.now()}] 데이터 보관 이동 완료")
+        return
+    elif mode == "migrate":
+        # 사용법: scheduled_crawler.py migrate (키별로 최신 행만 남기고 중복 행 삭제)
+        await asyncio.to_thread(crawler.migrate)
+        
+        print(f"[{datetime.now()}] 유니크 인덱스 이전 완료")
+        return
     else:
         print(f"알 수 없는 모드: {mode}")
         sys.exit(1)